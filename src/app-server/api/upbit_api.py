@@ -4,7 +4,7 @@ from dotenv import load_dotenv
 import logging
 from typing import Annotated, Any
 from fastapi import Depends
-from dependencies import get_upbit_service, get_coin_service
+from dependencies import get_upbit_service, get_coin_service, get_coin_registry
 from dto.http_response import ErrorResponse, SuccessResponse
 
 
@@ -50,10 +50,83 @@ async def fetch_and_save_all_coin_list(
 ):
     try:
         fetched_data_list = upbit_service.fetch_all_coin_list()
-        saved_coin_list = coin_service.save_all_coin_list(fetched_data_list)
+        saved_counts = coin_service.save_all_coin_list(fetched_data_list)
 
         return SuccessResponse(
-            data=saved_coin_list, message="모든 코인 리스트 조회가 완료되었습니다"
+            data=saved_counts,
+            message=(
+                "모든 코인 리스트 조회가 완료되었습니다 "
+                f"(추가 {saved_counts['inserted']}, 갱신 {saved_counts['updated']}, "
+                f"변경 없음 {saved_counts['unchanged']})"
+            ),
+        )
+    except Exception as e:
+        logger.error(f"예상치 못한 에러: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail=ErrorResponse(
+                status_code=500,
+                error_code="INTERNAL_SERVER_ERROR",
+                message="서버 내부 오류가 발생했습니다",
+                details=str(e),
+            ).dict(),
+        )
+
+
+@router.post("/syncCoinMaster")
+async def sync_coin_master(
+    coin_service: Annotated[Any, Depends(get_coin_service)],
+):
+    try:
+        result = coin_service.sync_coin_master()
+        counts = result["counts"]
+
+        if not result["changed"]:
+            message = "코인 목록 변경 사항이 없습니다"
+        else:
+            message = (
+                "코인 목록 동기화가 완료되었습니다 "
+                f"(추가 {counts['added']}, 변경 {counts['renamed']}, "
+                f"상장 폐지 {counts['delisted']})"
+            )
+
+        return SuccessResponse(data=result, message=message)
+    except Exception as e:
+        logger.error(f"예상치 못한 에러: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail=ErrorResponse(
+                status_code=500,
+                error_code="INTERNAL_SERVER_ERROR",
+                message="서버 내부 오류가 발생했습니다",
+                details=str(e),
+            ).dict(),
+        )
+
+
+@router.post("/syncCoinLogos")
+async def sync_coin_logos(
+    upbit_service: Annotated[Any, Depends(get_upbit_service)],
+    coin_registry: Annotated[Any, Depends(get_coin_registry)],
+):
+    try:
+        symbols = sorted(
+            {
+                coin.symbol
+                for coin in coin_registry.all()
+                if coin.exchange == "UPBIT" and coin.is_active is not False
+            }
+        )
+        summary = upbit_service.sync_coin_logos(symbols)
+
+        return SuccessResponse(
+            data=summary,
+            message=(
+                "코인 로고 동기화가 완료되었습니다 "
+                f"(다운로드 {summary['downloaded']}, "
+                f"변경 없음 {summary['not_modified'] + summary['unchanged']}, "
+                f"실패 {summary['failed']})"
+            ),
         )
     except Exception as e:
         logger.error(f"예상치 못한 에러: {e}")
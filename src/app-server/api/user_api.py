@@ -2,9 +2,17 @@ import os
 from fastapi import APIRouter, HTTPException
 from dotenv import load_dotenv
 import logging
-from typing import Annotated, Any
-from fastapi import Depends
-from dependencies import get_user_service, get_trading_histories_service
+from datetime import datetime
+from typing import Annotated, Any, Optional
+from fastapi import Depends, Query
+from fastapi.concurrency import iterate_in_threadpool, run_in_threadpool
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from dependencies import (
+    get_user_service,
+    get_trading_histories_service,
+    get_job_queue,
+    TRADING_HISTORY_SYNC_JOB,
+)
 from dto.http_response import ErrorResponse, SuccessResponse
 from dto.user_dto import (
     SignupRequest,
@@ -14,6 +22,10 @@ from dto.user_dto import (
     UpdateTradingHistoryRequest,
 )
 from dto.exchange_credentials_dto import ExchangeProvider
+from dto.trading_history_dto import (
+    TradingHistoryPageResponse,
+    TradingHistoryDeltaResponse,
+)
 
 router = APIRouter(prefix="/user")
 load_dotenv()
@@ -134,22 +146,53 @@ async def check_nickname_duplicate(
 """======================== 거래내역 API ============================"""
 
 
-@router.get("/getTradingHistory/{user_id}")
+@router.get(
+    "/getTradingHistory/{user_id}",
+    response_model=TradingHistoryPageResponse,
+    response_class=ORJSONResponse,
+)
 async def get_trading_history(
     user_id: str,
     trading_histories_service: Annotated[Any, Depends(get_trading_histories_service)],
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    limit: int = Query(100, ge=1, le=1000, description="페이지 크기"),
+    start_time: Optional[datetime] = Query(None, description="체결시간 시작"),
+    end_time: Optional[datetime] = Query(None, description="체결시간 끝"),
+    coin_id: Optional[int] = Query(None),
+    trade_type: Optional[int] = Query(None, description="0: 매수, 1: 매도"),
+    exchange_code: Optional[int] = Query(
+        None, description="1:Upbit, 2:Bithumb, 3:Binance, 4:OKX"
+    ),
 ):
-    """사용자의 모든 거래내역 조회"""
+    """사용자 거래내역 조회 (체결시간 역순, 커서 페이지)"""
     try:
-        all_trading_histories_data = (
-            trading_histories_service.get_all_trading_histories_by_user_formatted(
-                user_id
-            )
+        # DB 조회는 이벤트 루프를 막지 않도록 스레드풀에서 실행
+        trading_histories_page = await run_in_threadpool(
+            trading_histories_service.get_trading_histories_page,
+            user_id,
+            cursor=cursor,
+            limit=limit,
+            start_time=start_time,
+            end_time=end_time,
+            coin_id=coin_id,
+            trade_type=trade_type,
+            exchange_code=exchange_code,
         )
 
-        return SuccessResponse(
-            data=all_trading_histories_data,
-            message=f"거래내역 조회 완료 (총 {all_trading_histories_data['total_count']}개)",
+        # 응답 모델로 검증한 뒤 orjson으로 바로 인코딩
+        response = TradingHistoryPageResponse(
+            data=trading_histories_page,
+            message=f"거래내역 조회 완료 ({trading_histories_page['count']}개)",
+        )
+        return ORJSONResponse(content=response.model_dump())
+    except ValueError as e:
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "status_code": 400,
+                "error_code": "INVALID_CURSOR",
+                "message": str(e),
+            },
         )
     except Exception as e:
         logger.error(f"거래내역 조회 중 시스템 에러: {e}")
@@ -164,12 +207,167 @@ async def get_trading_history(
         )
 
 
+@router.get("/getTradingHistoryStream/{user_id}")
+async def get_trading_history_stream(
+    user_id: str,
+    trading_histories_service: Annotated[Any, Depends(get_trading_histories_service)],
+    format: str = Query("ndjson", pattern="^(ndjson|json)$"),
+    start_time: Optional[datetime] = Query(None, description="체결시간 시작"),
+    end_time: Optional[datetime] = Query(None, description="체결시간 끝"),
+    coin_id: Optional[int] = Query(None),
+    trade_type: Optional[int] = Query(None, description="0: 매수, 1: 매도"),
+    exchange_code: Optional[int] = Query(
+        None, description="1:Upbit, 2:Bithumb, 3:Binance, 4:OKX"
+    ),
+):
+    """사용자 전체 거래내역 스트리밍 (ndjson: 한 줄에 한 행, json: JSON 배열)
+
+    DB에서 읽는 대로 전송하므로 내역 크기와 관계없이 요청당 메모리가 일정하다.
+    DB를 읽는 동기 제너레이터는 스레드풀에서 한 묶음씩 진행한다.
+    """
+    filters = {
+        "start_time": start_time,
+        "end_time": end_time,
+        "coin_id": coin_id,
+        "trade_type": trade_type,
+        "exchange_code": exchange_code,
+    }
+    if format == "json":
+        return StreamingResponse(
+            iterate_in_threadpool(
+                trading_histories_service.iter_trading_histories_json_array(
+                    user_id, **filters
+                )
+            ),
+            media_type="application/json",
+        )
+    return StreamingResponse(
+        iterate_in_threadpool(
+            trading_histories_service.iter_trading_histories_ndjson(user_id, **filters)
+        ),
+        media_type="application/x-ndjson",
+    )
+
+
+@router.get(
+    "/getTradingHistoryDelta/{user_id}",
+    response_model=TradingHistoryDeltaResponse,
+    response_class=ORJSONResponse,
+)
+async def get_trading_history_delta(
+    user_id: str,
+    trading_histories_service: Annotated[Any, Depends(get_trading_histories_service)],
+    sync_cursor: Optional[str] = Query(
+        None, description="이전 동기화/변경분 응답의 sync_cursor"
+    ),
+    limit: int = Query(1000, ge=1, le=1000, description="최대 행 수"),
+    include_total_count: bool = Query(
+        False, description="사용자 전체 거래내역 수 포함 여부"
+    ),
+):
+    """sync_cursor 이후 새로 저장된 거래내역 조회 (클라이언트 병합용)"""
+    try:
+        delta = await run_in_threadpool(
+            trading_histories_service.get_trading_histories_delta,
+            user_id,
+            sync_cursor=sync_cursor,
+            limit=limit,
+            include_total_count=include_total_count,
+        )
+
+        response = TradingHistoryDeltaResponse(
+            data=delta,
+            message=f"신규 거래내역 조회 완료 ({delta['count']}개)",
+        )
+        return ORJSONResponse(content=response.model_dump())
+    except ValueError as e:
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "status_code": 400,
+                "error_code": "INVALID_CURSOR",
+                "message": str(e),
+            },
+        )
+    except Exception as e:
+        logger.error(f"신규 거래내역 조회 중 시스템 에러: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail={
+                "status_code": 500,
+                "error_code": "INTERNAL_SERVER_ERROR",
+                "message": "신규 거래내역 조회 중 오류가 발생했습니다",
+                "details": str(e),
+            },
+        )
+
+
+@router.get("/getTradingFillVwap/{user_id}")
+async def get_trading_fill_vwap(
+    user_id: str,
+    trading_histories_service: Annotated[Any, Depends(get_trading_histories_service)],
+    start_time: Optional[datetime] = Query(None, description="체결시간 시작"),
+    end_time: Optional[datetime] = Query(None, description="체결시간 끝"),
+    exchange_code: Optional[int] = Query(
+        None, description="1:Upbit, 2:Bithumb, 3:Binance, 4:OKX"
+    ),
+):
+    """코인/매수매도별 체결 수량, 금액, 수수료, VWAP (저장된 체결 기준)"""
+    try:
+        vwap = await run_in_threadpool(
+            trading_histories_service.get_trading_fill_vwap,
+            user_id,
+            exchange_code=exchange_code,
+            start_time=start_time,
+            end_time=end_time,
+        )
+        return SuccessResponse(
+            data=vwap, message=f"체결 VWAP 조회 완료 ({len(vwap)}개)"
+        )
+    except Exception as e:
+        logger.error(f"체결 VWAP 조회 중 시스템 에러: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail={
+                "status_code": 500,
+                "error_code": "INTERNAL_SERVER_ERROR",
+                "message": "체결 VWAP 조회 중 오류가 발생했습니다",
+                "details": str(e),
+            },
+        )
+
+
+@router.get("/getTradingFills/{user_id}/{trading_history_id}")
+async def get_trading_fills(
+    user_id: str,
+    trading_history_id: int,
+    trading_histories_service: Annotated[Any, Depends(get_trading_histories_service)],
+):
+    """주문 하나의 체결 목록 조회"""
+    try:
+        fills = await run_in_threadpool(
+            trading_histories_service.get_trading_fills, user_id, trading_history_id
+        )
+        return SuccessResponse(data=fills, message=f"체결 조회 완료 ({len(fills)}개)")
+    except Exception as e:
+        logger.error(f"체결 조회 중 시스템 에러: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail={
+                "status_code": 500,
+                "error_code": "INTERNAL_SERVER_ERROR",
+                "message": "체결 조회 중 오류가 발생했습니다",
+                "details": str(e),
+            },
+        )
+
+
 @router.post("/updateTradingHistory")
 async def update_trading_history(
     request: UpdateTradingHistoryRequest,
-    trading_histories_service: Annotated[Any, Depends(get_trading_histories_service)],
-    user_service: Annotated[Any, Depends(get_user_service)],
+    job_queue: Annotated[Any, Depends(get_job_queue)],
 ):
+    """거래내역 동기화 작업 등록 (진행 상황은 getTradingHistorySyncJob으로 조회)"""
     try:
         try:
             exchange_provider = ExchangeProvider[request.exchange_provider_str.upper()]
@@ -184,46 +382,68 @@ async def update_trading_history(
                 },
             )
 
-        # 사용자의 마지막 거래내역 업데이트 시간 조회
-        user = user_service.user_repository.find_by_id(request.user_id)
-        start_time = user.last_trading_history_update_at if user else None
+        # 같은 사용자/거래소의 동기화가 진행 중이면 기존 작업을 반환
+        # (작업 결과에는 sync_cursor 이후 새로 저장된 행만 담김)
+        job = await job_queue.submit(
+            TRADING_HISTORY_SYNC_JOB,
+            {
+                "user_id": request.user_id,
+                "exchange_provider": exchange_provider.name,
+                "sync_cursor": request.sync_cursor,
+            },
+            dedup_key=f"{request.user_id}:{exchange_provider.name}",
+        )
 
-        trading_histies = trading_histories_service.get_trading_histories(
-            request.user_id, request.exchange_provider_str, start_time
+        return SuccessResponse(
+            data=job,
+            message=f"{exchange_provider.name} 거래내역 업데이트 작업 등록 (작업 ID: {job['job_id']})",
         )
-        processed_trading_histies = trading_histories_service.process_trading_histories(
-            request.user_id, request.exchange_provider_str, trading_histies
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        logger.error(f"거래내역 업데이트 작업 등록 중 시스템 에러: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail={
+                "status_code": 500,
+                "error_code": "INTERNAL_SERVER_ERROR",
+                "message": "거래내역 업데이트 작업 등록 중 오류가 발생했습니다",
+                "details": str(e),
+            },
         )
 
-        saved_trading_histories = trading_histories_service.save_trading_histories(
-            processed_trading_histies
-        )
 
-        all_trading_histories_data = (
-            trading_histories_service.get_all_trading_histories_by_user_formatted(
-                request.user_id
+@router.get("/getTradingHistorySyncJob/{job_id}")
+async def get_trading_history_sync_job(
+    job_id: str,
+    job_queue: Annotated[Any, Depends(get_job_queue)],
+):
+    """거래내역 동기화 작업 상태 조회 (조회 구간, uuid, 주문 상세, 저장 건수)"""
+    try:
+        job = await job_queue.get_job(job_id)
+        if job is None:
+            raise HTTPException(
+                status_code=404,
+                detail={
+                    "status_code": 404,
+                    "error_code": "JOB_NOT_FOUND",
+                    "message": "작업을 찾을 수 없습니다",
+                },
             )
-        )
-
-        user_service.update_user_trading_history_updated_at(request.user_id)
 
         return SuccessResponse(
-            data={
-                "saved_count": len(saved_trading_histories),
-                **all_trading_histories_data,
-            },
-            message=f"{exchange_provider.name} 거래내역 업데이트 완료 (저장: {len(saved_trading_histories)}개, 전체: {all_trading_histories_data['total_count']}개)",
+            data=job, message=f"거래내역 동기화 작업 상태: {job['status']}"
         )
     except HTTPException as e:
         raise e
     except Exception as e:
-        logger.error(f"거래내역 업데이트 중 시스템 에러: {e}")
+        logger.error(f"거래내역 동기화 작업 조회 중 시스템 에러: {e}")
         raise HTTPException(
             status_code=500,
             detail={
                 "status_code": 500,
                 "error_code": "INTERNAL_SERVER_ERROR",
-                "message": "거래내역 업데이트 중 오류가 발생했습니다",
+                "message": "거래내역 동기화 작업 조회 중 오류가 발생했습니다",
                 "details": str(e),
             },
         )
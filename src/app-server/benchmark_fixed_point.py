@@ -0,0 +1,180 @@
+"""금액/수량 표현 방식 벤치마크 (float / Decimal / 1e-8 고정소수점 정수)
+
+- 집계: 주문별 체결 수량/금액 합계와 평균가, 수수료 (DB 없이 실행)
+- 직렬화: 집계 결과를 COPY에 넣을 문자열로 변환 (고정소수점은 정수 그대로 보내고
+  병합 SQL에서 1e-8을 곱함)
+- 조회 (--user-id를 주면): 사용자 거래내역을 읽어 응답용 float로 변환
+
+사용법:
+    python benchmark_fixed_point.py [--fills 1000000] [--repeat 3] [--user-id <uuid>]
+"""
+
+import argparse
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Any, Dict, List
+from benchmark_order_transform import _best_of, make_orders
+from utils.fixed_point import (
+    FIXED_POINT_SCALE,
+    fixed_div,
+    sum_segments,
+    to_fixed,
+    to_fixed_array,
+)
+
+_EIGHT_DIGITS = Decimal("1e-8")
+
+
+def aggregate_float(orders: List[Dict[str, Any]]) -> List[tuple]:
+    """동기화 변환이 고정소수점 이전에 쓰던 float 합계"""
+    results = []
+    for order in orders:
+        quantity = sum(float(trade["volume"]) for trade in order["trades"])
+        total_price = sum(float(trade["funds"]) for trade in order["trades"])
+        price = total_price / quantity if quantity > 0 else 0
+        results.append((price, quantity, total_price, float(order["paid_fee"])))
+    return results
+
+
+def aggregate_decimal(orders: List[Dict[str, Any]]) -> List[tuple]:
+    """Decimal 합계 (평균가는 Numeric(20, 8)처럼 8자리에서 반올림)"""
+    results = []
+    for order in orders:
+        quantity = sum((Decimal(trade["volume"]) for trade in order["trades"]), Decimal(0))
+        total_price = sum(
+            (Decimal(trade["funds"]) for trade in order["trades"]), Decimal(0)
+        )
+        price = (
+            (total_price / quantity).quantize(_EIGHT_DIGITS, rounding=ROUND_HALF_UP)
+            if quantity > 0
+            else Decimal(0)
+        )
+        results.append((price, quantity, total_price, Decimal(order["paid_fee"])))
+    return results
+
+
+def aggregate_fixed(orders: List[Dict[str, Any]]) -> List[tuple]:
+    """transform_orders와 같은 방식 (필드별 배열로 한 번에 읽고 주문별 구간 합계)"""
+    fill_counts, volumes, funds, fees = [], [], [], []
+    for order in orders:
+        fill_counts.append(len(order["trades"]))
+        for trade in order["trades"]:
+            volumes.append(trade["volume"])
+            funds.append(trade["funds"])
+        fees.append(order["paid_fee"])
+
+    quantities = sum_segments(to_fixed_array(volumes), fill_counts)
+    total_prices = sum_segments(to_fixed_array(funds), fill_counts)
+    return list(
+        zip(
+            map(fixed_div, total_prices, quantities),
+            quantities,
+            total_prices,
+            to_fixed_array(fees).tolist(),
+        )
+    )
+
+
+def _serialize(results: List[tuple], to_text) -> List[str]:
+    return ["\t".join(map(to_text, values)) for values in results]
+
+
+def _read_queries(user_id: str):
+    """(이름, 조회 컬럼, 응답용 float 변환) 목록"""
+    from sqlalchemy import Numeric, Text, cast
+    from model.TradingHistories import TradingHistories
+    from repository.trading_histories_repository import READ_COLUMNS
+
+    money_columns = (
+        TradingHistories.price,
+        TradingHistories.quantity,
+        TradingHistories.total_price,
+        TradingHistories.fee,
+    )
+
+    def with_money(build):
+        return READ_COLUMNS[:5] + tuple(map(build, money_columns)) + READ_COLUMNS[9:]
+
+    def fixed_integer(column):
+        return cast(
+            cast(column * FIXED_POINT_SCALE, Numeric(38, 0)), Text
+        ).label(column.key)
+
+    return [
+        ("double (READ_COLUMNS)", READ_COLUMNS, lambda value: value),
+        ("Decimal", with_money(lambda column: column), float),
+        (
+            "fixed-point int",
+            with_money(fixed_integer),
+            lambda value: int(value) / FIXED_POINT_SCALE,
+        ),
+    ]
+
+
+def benchmark_read(user_id: str, repeat: int):
+    from database.database_connection import db
+    from model.TradingHistories import TradingHistories
+
+    db.create_tables()
+
+    def load(columns, to_float):
+        session = db.get_session()
+        try:
+            rows = (
+                session.query(*columns)
+                .filter(TradingHistories.user_id == user_id)
+                .all()
+            )
+            return [
+                tuple(to_float(value) if value is not None else 0.0 for value in row[5:9])
+                for row in rows
+            ]
+        finally:
+            session.close()
+
+    expected = None
+    for name, columns, to_float in _read_queries(user_id):
+        seconds, result = _best_of(repeat, lambda: load(columns, to_float))
+        if expected is None:
+            expected = result
+            print(f"조회 행 {len(result)}개")
+        elif result != expected:
+            raise AssertionError(f"{name} 응답 값이 다름")
+        print(f"  {name:<24}{seconds:8.3f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="금액/수량 표현 방식 벤치마크")
+    parser.add_argument("--fills", type=int, default=1_000_000, help="체결 수")
+    parser.add_argument("--repeat", type=int, default=3, help="방식별 반복 횟수")
+    parser.add_argument("--user-id", default=None, help="조회 벤치마크 대상 사용자")
+    args = parser.parse_args()
+
+    orders = make_orders(args.fills)
+    print(f"주문 {len(orders)}개, 체결 {args.fills}개")
+
+    # Numeric(20, 8)에 저장될 값(8자리 반올림)으로 비교, 기준은 Decimal
+    exact = None
+    for name, aggregate, to_text, to_stored in (
+        ("Decimal", aggregate_decimal, str, to_fixed),
+        ("float", aggregate_float, repr, to_fixed),
+        ("fixed-point int", aggregate_fixed, str, int),
+    ):
+        aggregate_seconds, results = _best_of(args.repeat, lambda: aggregate(orders))
+        serialize_seconds, texts = _best_of(
+            args.repeat, lambda: _serialize(results, to_text)
+        )
+        stored = [tuple(map(to_stored, text.split("\t"))) for text in texts]
+        if exact is None:
+            exact = stored
+        mismatches = sum(row != expected for row, expected in zip(stored, exact))
+        print(
+            f"  {name:<18}집계 {aggregate_seconds:7.3f}s  "
+            f"직렬화 {serialize_seconds:7.3f}s  Decimal과 다른 주문 {mismatches}"
+        )
+
+    if args.user_id:
+        benchmark_read(args.user_id, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""주문 상세 → 주문 열/체결 열 변환 벤치마크 (DB/거래소 없이 실행)
+
+업비트 KRW 마켓과 비슷한 크기의 가짜 주문 상세를 만들어 세 가지 방식을 비교한다.
+- loop: 주문/체결마다 to_fixed로 읽어 더하는 단순 반복
+- separate: aggregate_orders와 flatten_fills를 따로 호출 (같은 문자열을 두 번 읽음)
+- transform_orders: 한 번 순회하고 숫자 필드마다 한 번씩 배열로 읽음
+
+사용법:
+    python benchmark_order_transform.py [--fills 1000000] [--repeat 3]
+"""
+
+import argparse
+import random
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List
+from utils.fixed_point import fixed_div, to_fixed
+from utils.order_transform import (
+    SIDE_TO_TRADE_TYPE,
+    FillColumns,
+    OrderColumns,
+    aggregate_orders,
+    flatten_fills,
+    order_trades,
+    transform_orders,
+)
+
+
+def make_orders(fill_count: int, seed: int = 1) -> List[Dict[str, Any]]:
+    """주문당 체결 1~3개(평균 2개)인 가짜 주문 상세 목록"""
+    rnd = random.Random(seed)
+    started_at = datetime(2020, 1, 1)
+    orders = []
+    index = 0
+    while fill_count > 0:
+        trade_count = min(rnd.randint(1, 3), fill_count)
+        created_at = (started_at + timedelta(seconds=37 * index)).isoformat() + "+09:00"
+        trades = []
+        for trade_index in range(trade_count):
+            price = rnd.randint(1000, 90000) * 1000
+            volume = rnd.randint(1, 5000000) / 1e8
+            trades.append(
+                {
+                    "market": "KRW-BTC",
+                    "uuid": f"trade-{index}-{trade_index}",
+                    "price": f"{price}.0",
+                    "volume": f"{volume:.8f}",
+                    "funds": f"{price * volume:.4f}",
+                    "trend": "up",
+                    "created_at": created_at,
+                    "side": "bid",
+                }
+            )
+        orders.append(
+            {
+                "uuid": f"order-{index}",
+                "side": "bid" if index % 2 else "ask",
+                "market": "KRW-BTC",
+                "paid_fee": f"{rnd.random() * 100:.8f}",
+                "created_at": created_at,
+                "trades": trades,
+            }
+        )
+        fill_count -= trade_count
+        index += 1
+    return orders
+
+
+def _parse_time(value: str) -> datetime:
+    return datetime.fromisoformat(value).replace(tzinfo=None)
+
+
+def transform_orders_loop(orders: List[Dict[str, Any]]):
+    """비교 기준: 주문/체결마다 값을 하나씩 읽어 더하는 반복 (결과는 transform_orders와 같음)"""
+    order_columns = OrderColumns([], [], [], [], [], [], [], [])
+    fill_columns = FillColumns([], [], [], [], [], [])
+    for order in orders:
+        trades = order_trades(order)
+        if trades is None:
+            continue
+
+        uuid = order.get("uuid")
+        quantity = total_price = 0
+        for index, trade in enumerate(trades):
+            volume = to_fixed(trade.get("volume", 0))
+            funds = to_fixed(trade.get("funds", 0))
+            price = trade.get("price")
+            quantity += volume
+            total_price += funds
+            fill_columns.order_uuids.append(uuid)
+            fill_columns.trade_uuids.append(trade.get("uuid") or f"{uuid}:{index}")
+            fill_columns.prices.append(
+                to_fixed(price) if price is not None else fixed_div(funds, volume)
+            )
+            fill_columns.volumes.append(volume)
+            fill_columns.funds.append(funds)
+            fill_columns.trade_times.append(
+                _parse_time(trade.get("created_at") or order.get("created_at"))
+            )
+
+        order_columns.markets.append(str(order.get("market")))
+        order_columns.trade_uuids.append(uuid)
+        order_columns.trade_types.append(SIDE_TO_TRADE_TYPE.get(order.get("side"), 0))
+        order_columns.prices.append(fixed_div(total_price, quantity))
+        order_columns.quantities.append(quantity)
+        order_columns.total_prices.append(total_price)
+        order_columns.fees.append(to_fixed(order.get("paid_fee", 0)))
+        order_columns.trade_times.append(_parse_time(order.get("created_at")))
+    return order_columns, fill_columns
+
+
+def _best_of(repeat: int, function: Callable[[], Any]):
+    """repeat번 실행한 가장 짧은 시간(초)과 결과"""
+    best = None
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        result = function()
+        elapsed = time.perf_counter() - started_at
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="주문 상세 변환 벤치마크")
+    parser.add_argument("--fills", type=int, default=1_000_000, help="체결 수")
+    parser.add_argument("--repeat", type=int, default=3, help="방식별 반복 횟수")
+    args = parser.parse_args()
+
+    orders = make_orders(args.fills)
+    print(f"주문 {len(orders)}개, 체결 {args.fills}개")
+
+    loop_seconds, expected = _best_of(
+        args.repeat, lambda: transform_orders_loop(orders)
+    )
+    results = [("loop", loop_seconds)]
+    for name, function in (
+        ("separate", lambda: (aggregate_orders(orders), flatten_fills(orders))),
+        ("transform_orders", lambda: transform_orders(orders)),
+    ):
+        seconds, result = _best_of(args.repeat, function)
+        if result != expected:
+            raise AssertionError(f"{name} 결과가 loop와 다름")
+        results.append((name, seconds))
+
+    for name, seconds in results:
+        print(f"{name:<18}{seconds:8.3f}s  (loop 대비 {loop_seconds / seconds:.2f}배)")
+
+
+if __name__ == "__main__":
+    main()
@@ -43,9 +43,24 @@ class DatabaseConnection:
         import model.ExchangeCredentials
         import model.Coins
         import model.TradingHistories
+        import model.TradingSyncCursors
+        import model.TradingFills
+        import model.TradingOrderPayloads
 
         self.Base.metadata.create_all(bind=self.engine)
 
+        # 이미 있는 테이블에 새로 추가된 인덱스 생성
+        for table in self.Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(bind=self.engine, checkfirst=True)
+
+        # 뷰 생성 (정의가 바뀌었으면 교체)
+        from sqlalchemy import text
+
+        with self.engine.begin() as connection:
+            for view_sql in model.TradingFills.TRADING_FILL_VIEWS:
+                connection.execute(text(view_sql))
+
     def test_connection(self):
         """db connection test"""
         try:
@@ -11,6 +11,12 @@ _user_service_instance = None
 _user_repository_instance = None
 _trading_histories_service_instance = None
 _exchange_credentials_service_instance = None
+_job_queue_instance = None
+_coin_registry_instance = None
+_sync_state_store_instance = None
+
+# 작업 유형
+TRADING_HISTORY_SYNC_JOB = "trading_history_sync"
 
 
 # 의존성 주입 함수들
@@ -55,6 +61,24 @@ def get_coin_repository() -> CoinRepository:
     return _coin_repository_instance
 
 
+def get_coin_registry() -> Any:
+    global _coin_registry_instance
+    if _coin_registry_instance is None:
+        from utils.coin_registry import CoinRegistry  # lazy import
+
+        _coin_registry_instance = CoinRegistry()
+    return _coin_registry_instance
+
+
+def get_sync_state_store() -> Any:
+    global _sync_state_store_instance
+    if _sync_state_store_instance is None:
+        from utils.sync_state_store import FileSyncStateStore  # lazy import
+
+        _sync_state_store_instance = FileSyncStateStore()
+    return _sync_state_store_instance
+
+
 def get_trading_histories_service() -> Any:
     global _trading_histories_service_instance
     if _trading_histories_service_instance is None:
@@ -71,3 +95,16 @@ def get_exchange_credentials_service() -> Any:
 
         _exchange_credentials_service_instance = ExchangeCredentialsService()
     return _exchange_credentials_service_instance
+
+
+def get_job_queue() -> Any:
+    global _job_queue_instance
+    if _job_queue_instance is None:
+        from utils.job_queue import JobQueue, create_job_backend  # lazy import
+
+        _job_queue_instance = JobQueue(create_job_backend())
+        _job_queue_instance.register(
+            TRADING_HISTORY_SYNC_JOB,
+            get_trading_histories_service().sync_trading_histories,
+        )
+    return _job_queue_instance
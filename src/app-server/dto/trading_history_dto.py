@@ -0,0 +1,54 @@
+from pydantic import BaseModel, Field
+from typing import Optional, List
+from dto.http_response import SuccessResponse
+
+
+class TradingHistoryItem(BaseModel):
+    """거래내역 응답 DTO - TradingHistories 모델 기반"""
+
+    id: int = Field(..., description="거래내역 ID")
+    coin_id: int = Field(..., description="코인 ID")
+    exchange_code: int = Field(
+        ..., description="1:Upbit, 2:Bithumb, 3:Binance, 4:OKX"
+    )
+    trade_uuid: str = Field(..., description="외부 체결 고유 ID")
+    trade_type: int = Field(..., description="0: 매수, 1: 매도")
+    price: float = Field(..., description="평균 체결가")
+    quantity: float = Field(..., description="체결 수량")
+    total_price: float = Field(..., description="체결 금액")
+    fee: float = Field(..., description="수수료")
+    trade_time: str = Field(..., description="체결시간 (ISO 8601)")
+    created_at: Optional[str] = Field(None, description="저장 시간 (ISO 8601)")
+
+
+class TradingHistoryPage(BaseModel):
+    """거래내역 커서 페이지 DTO"""
+
+    count: int = Field(..., description="이 페이지의 거래내역 수")
+    has_next: bool = Field(..., description="다음 페이지 존재 여부")
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서")
+    trading_histories: List[TradingHistoryItem]
+
+
+class TradingHistoryPageResponse(SuccessResponse):
+    """거래내역 페이지 조회 응답"""
+
+    data: TradingHistoryPage
+
+
+class TradingHistoryDelta(BaseModel):
+    """동기화 이후 새로 저장된 거래내역 DTO"""
+
+    total_count: Optional[int] = Field(
+        None, description="사용자 전체 거래내역 수 (include_total_count일 때만)"
+    )
+    count: int = Field(..., description="이 응답의 신규 거래내역 수")
+    has_next: bool = Field(..., description="이어서 받을 신규 거래내역 존재 여부")
+    sync_cursor: str = Field(..., description="다음 변경분 조회에 넘길 커서")
+    trading_histories: List[TradingHistoryItem]
+
+
+class TradingHistoryDeltaResponse(SuccessResponse):
+    """거래내역 변경분 조회 응답"""
+
+    data: TradingHistoryDelta
@@ -255,12 +255,16 @@ class UpdateTradingHistoryRequest(BaseModel):
     exchange_provider_str: str = Field(
         ..., description="거래소 제공자 (UPBIT, BITHUMB, BINANCE, OKX)"
     )
+    sync_cursor: Optional[str] = Field(
+        None, description="이전 동기화 결과의 sync_cursor (이후 저장된 행만 반환)"
+    )
 
     model_config = ConfigDict(
         json_schema_extra={
             "example": {
                 "user_id": "e953a0e1-5466-40b3-9207-cd86b7d95275",
                 "exchange_provider_str": "UPBIT",
+                "sync_cursor": None,
             }
         }
     )
@@ -6,6 +6,8 @@ import importlib
 from utils.router_utils import register_routers
 from database.database_connection import db
 from utils.app_initializer import initialize_app
+from utils.async_upbit_http_client import close_async_upbit_http_client
+from dependencies import get_job_queue, get_coin_registry
 import logging
 from contextlib import asynccontextmanager
 
@@ -31,6 +33,14 @@ async def lifespan(app: FastAPI):
             # 테이블 생성
             db.create_tables()
             logger.info("✅ 데이터베이스 테이블 생성 완료")
+
+            # 코인 목록 불러오기 (market_code → coin id 조회용)
+            get_coin_registry().refresh()
+            logger.info("✅ 코인 목록 불러오기 완료")
+
+            # 백그라운드 작업 큐 워커 시작
+            await get_job_queue().start()
+            logger.info("✅ 작업 큐 워커 시작 완료")
         else:
             logger.error("❌ 데이터베이스 연결 실패")
             raise Exception("데이터베이스 연결에 실패했습니다")
@@ -46,6 +56,12 @@ async def lifespan(app: FastAPI):
     # 종료 시
     logger.info("🛑 애플리케이션 종료 중...")
 
+    # 작업 큐 워커 정리
+    await get_job_queue().stop()
+
+    # 업비트 비동기 HTTP 커넥션 풀 정리
+    await close_async_upbit_http_client()
+
 
 app = FastAPI(
     title="BIT Diary API",
@@ -0,0 +1,70 @@
+from sqlalchemy import (
+    Column,
+    String,
+    Integer,
+    BigInteger,
+    Numeric,
+    TIMESTAMP,
+    func,
+    ForeignKey,
+    UniqueConstraint,
+)
+from database.database_connection import db
+
+
+class TradingFills(db.Base):
+    """주문(trading_histories)별 개별 체결 내역"""
+
+    __tablename__ = "trading_fills"
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+
+    trading_history_id = Column(
+        Integer,
+        ForeignKey("trading_histories.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    trade_uuid = Column(
+        String(100), nullable=False
+    )  # 업비트 체결 uuid (주문 목록 응답으로 만든 체결은 주문 uuid)
+
+    price = Column(Numeric(20, 8), nullable=False)  # 체결 가격
+    volume = Column(Numeric(20, 8), nullable=False)  # 체결 수량
+    funds = Column(Numeric(20, 8), nullable=False)  # 체결 금액
+    trade_time = Column(TIMESTAMP, nullable=False)  # 체결시간
+    created_at = Column(TIMESTAMP, default=func.now())
+
+    # 제약조건 (trading_history_id로 시작하므로 주문별 조회 인덱스로도 사용)
+    __table_args__ = (
+        UniqueConstraint("trading_history_id", "trade_uuid", name="uq_trading_fill"),
+    )
+
+    def __repr__(self):
+        return f"<TradingFill(id={self.id}, trading_history_id={self.trading_history_id}, trade_uuid={self.trade_uuid})>"
+
+
+# 주문별 체결 집계 뷰 (수량/금액/VWAP을 체결에서 다시 계산, 수수료는 주문 단위 값)
+TRADING_FILL_SUMMARY_VIEW = "trading_fill_summaries"
+CREATE_TRADING_FILL_SUMMARY_VIEW_SQL = f"""
+    CREATE OR REPLACE VIEW {TRADING_FILL_SUMMARY_VIEW} AS
+    SELECT
+        th.id AS trading_history_id,
+        th.user_id,
+        th.coin_id,
+        th.exchange_code,
+        th.trade_type,
+        th.trade_time,
+        th.fee,
+        count(*) AS fill_count,
+        sum(f.volume) AS quantity,
+        sum(f.funds) AS total_price,
+        round(sum(f.funds) / nullif(sum(f.volume), 0), 8) AS vwap_price,
+        min(f.trade_time) AS first_fill_time,
+        max(f.trade_time) AS last_fill_time
+    FROM trading_histories th
+    JOIN trading_fills f ON f.trading_history_id = th.id
+    GROUP BY th.id
+"""
+
+# create_tables에서 테이블 생성 후 실행하는 뷰 정의
+TRADING_FILL_VIEWS = (CREATE_TRADING_FILL_SUMMARY_VIEW_SQL,)
@@ -9,6 +9,7 @@ from sqlalchemy import (
     ForeignKey,
     UniqueConstraint,
     CheckConstraint,
+    Index,
 )
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
@@ -55,6 +56,10 @@ class TradingHistories(db.Base):
         ),
         CheckConstraint("exchange_code IN (1, 2, 3, 4)", name="chk_exchange_code"),
         CheckConstraint("trade_type IN (0, 1)", name="chk_trade_type"),
+        # 사용자별 체결시간 역순 커서 페이지 조회용
+        Index("idx_trading_histories_user_time", user_id, trade_time.desc(), id),
+        # 동기화 이후 새로 저장된 행(delta) 조회용
+        Index("idx_trading_histories_user_id", user_id, id),
     )
 
     def __repr__(self):
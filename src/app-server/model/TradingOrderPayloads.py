@@ -0,0 +1,46 @@
+from sqlalchemy import (
+    Column,
+    String,
+    BigInteger,
+    SmallInteger,
+    TIMESTAMP,
+    func,
+    ForeignKey,
+    UniqueConstraint,
+)
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from database.database_connection import db
+
+
+class TradingOrderPayloads(db.Base):
+    """거래소 주문 상세 원본 응답 보관 (네트워크 없이 trading_histories 재처리용)"""
+
+    __tablename__ = "trading_order_payloads"
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+
+    user_id = Column(
+        UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+    exchange_code = Column(
+        SmallInteger, nullable=False
+    )  # 1:Upbit, 2:Bithumb, 3:Binance, 4:OKX
+    order_uuid = Column(String(100), nullable=False)  # 외부 주문 고유 ID
+
+    payload = Column(
+        JSONB, nullable=False
+    )  # /v1/orders/uuids 항목 또는 /v1/order 응답 원본 (큰 값은 TOAST로 압축 저장)
+    fetched_at = Column(TIMESTAMP, server_default=func.now(), nullable=False)
+
+    # 제약조건 (user_id, exchange_code로 시작하므로 재처리 범위 조회 인덱스로도 사용)
+    __table_args__ = (
+        UniqueConstraint(
+            "user_id",
+            "exchange_code",
+            "order_uuid",
+            name="uq_user_exchange_order_payload",
+        ),
+    )
+
+    def __repr__(self):
+        return f"<TradingOrderPayload(id={self.id}, user_id={self.user_id}, order_uuid={self.order_uuid})>"
@@ -0,0 +1,45 @@
+from sqlalchemy import (
+    Column,
+    Integer,
+    SmallInteger,
+    TIMESTAMP,
+    func,
+    ForeignKey,
+    UniqueConstraint,
+)
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+from database.database_connection import db
+
+
+class TradingSyncCursors(db.Base):
+    """사용자/거래소별 거래내역 동기화 체크포인트"""
+
+    __tablename__ = "trading_sync_cursors"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+
+    user_id = Column(
+        UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+    exchange_code = Column(
+        SmallInteger, nullable=False
+    )  # 1:Upbit, 2:Bithumb, 3:Binance, 4:OKX
+
+    last_window_end = Column(
+        TIMESTAMP(timezone=True)
+    )  # 주문 목록 조회를 마친 마지막 구간의 종료 시각
+    pending_uuids = Column(
+        JSONB, nullable=False, default=list
+    )  # 주문 목록에서 찾았지만 아직 저장하지 않은 주문 uuid
+
+    updated_at = Column(TIMESTAMP, default=func.now(), onupdate=func.now())
+
+    # 제약조건
+    __table_args__ = (
+        UniqueConstraint(
+            "user_id", "exchange_code", name="uq_user_exchange_sync_cursor"
+        ),
+    )
+
+    def __repr__(self):
+        return f"<TradingSyncCursor(user_id={self.user_id}, exchange_code={self.exchange_code}, last_window_end={self.last_window_end})>"
@@ -1,24 +1,109 @@
 import logging
 from typing import List, Dict, Any
+from sqlalchemy import literal_column, or_
+from sqlalchemy.dialects.postgresql import insert
 from database.database_connection import db
 from model.Coins import Coins
 
+# market_code 외에 코인 목록 갱신 시 비교/저장하는 컬럼
+UPSERT_COLUMNS = (
+    "symbol",
+    "quote_currency",
+    "korean_name",
+    "english_name",
+    "img_url",
+    "exchange",
+    "is_active",
+)
+
 
 class CoinRepository:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
 
-    def save_coin_list(self, coin_list: List[Coins]):
+    def save_coin_list(self, coin_list: List[Coins]) -> Dict[str, int]:
+        """market_code 기준 일괄 upsert (값이 바뀐 행만 갱신)
+
+        새 마켓은 추가하고, 기존 마켓은 UPSERT_COLUMNS 중 하나라도 달라졌을 때만
+        UPDATE 한다. 추가/갱신/변경 없음 건수를 반환한다.
+        """
         try:
             session = db.get_session()
 
-            saved_coin_list = session.bulk_save_objects(coin_list)
+            # 같은 market_code가 여러 번 있으면 마지막 값 사용
+            rows = {
+                coin.market_code: self._to_upsert_row(coin) for coin in coin_list
+            }
+            if not rows:
+                return {"inserted": 0, "updated": 0, "unchanged": 0}
+
+            results = session.execute(
+                self._build_upsert_statement(), list(rows.values())
+            ).all()
             session.commit()
 
-            return saved_coin_list
+            inserted = sum(1 for result in results if result.inserted)
+            return {
+                "inserted": inserted,
+                "updated": len(results) - inserted,
+                "unchanged": len(rows) - len(results),
+            }
         except Exception as e:
             self.logger.error(f"코인 목록 저장 중 에러 발생: {e}")
+            session.rollback()
+            raise e
+        finally:
+            session.close()
+
+    def _build_upsert_statement(self):
+        statement = insert(Coins)
+        excluded = statement.excluded
+        return statement.on_conflict_do_update(
+            index_elements=[Coins.market_code],
+            set_={column: excluded[column] for column in UPSERT_COLUMNS},
+            where=or_(
+                *(
+                    getattr(Coins, column).is_distinct_from(excluded[column])
+                    for column in UPSERT_COLUMNS
+                )
+            ),
+        ).returning(
+            Coins.id,
+            # 새로 추가된 행은 xmax가 0
+            literal_column("xmax = 0").label("inserted"),
+        )
+
+    def _to_upsert_row(self, coin: Coins) -> Dict[str, Any]:
+        row = {column: getattr(coin, column) for column in UPSERT_COLUMNS}
+        row["market_code"] = coin.market_code
+        # 목록에 있는 코인은 활성 상태 (상장 폐지 후 재상장 포함)
+        if row["is_active"] is None:
+            row["is_active"] = True
+        return row
+
+    def deactivate_by_market_codes(self, market_codes: List[str]) -> int:
+        """상장 폐지된 마켓 비활성화 (비활성화된 건수 반환)"""
+        if not market_codes:
+            return 0
+
+        try:
+            session = db.get_session()
+            deactivated_count = (
+                session.query(Coins)
+                .filter(
+                    Coins.market_code.in_(market_codes),
+                    Coins.is_active.isnot(False),
+                )
+                .update({Coins.is_active: False}, synchronize_session=False)
+            )
+            session.commit()
+            return deactivated_count
+        except Exception as e:
+            self.logger.error(f"코인 비활성화 중 에러 발생: {e}")
+            session.rollback()
             raise e
+        finally:
+            session.close()
 
     def get_all_coins(self):
         try:
@@ -28,3 +113,5 @@ class CoinRepository:
         except Exception as e:
             self.logger.error(f"코인 목록 조회 중 에러 발생: {e}")
             raise e
+        finally:
+            session.close()
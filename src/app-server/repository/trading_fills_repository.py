@@ -0,0 +1,84 @@
+import logging
+from datetime import datetime
+from typing import List, Optional
+from sqlalchemy import Row, text
+from database.database_connection import db
+from model.TradingFills import TRADING_FILL_SUMMARY_VIEW
+
+# 코인/매수매도별 체결 VWAP (주문별 집계 뷰를 한 번 더 집계, 수수료는 주문 단위로 합산)
+FIND_VWAP_BY_COIN_SQL = f"""
+    SELECT
+        coin_id,
+        trade_type,
+        count(*) AS order_count,
+        sum(fill_count) AS fill_count,
+        sum(quantity) AS quantity,
+        sum(total_price) AS total_price,
+        sum(fee) AS fee,
+        round(sum(total_price) / nullif(sum(quantity), 0), 8) AS vwap_price,
+        min(first_fill_time) AS first_fill_time,
+        max(last_fill_time) AS last_fill_time
+    FROM {TRADING_FILL_SUMMARY_VIEW}
+    WHERE user_id = :user_id
+        AND (CAST(:exchange_code AS SMALLINT) IS NULL OR exchange_code = :exchange_code)
+        AND (CAST(:start_time AS TIMESTAMP) IS NULL OR trade_time >= :start_time)
+        AND (CAST(:end_time AS TIMESTAMP) IS NULL OR trade_time <= :end_time)
+    GROUP BY coin_id, trade_type
+    ORDER BY coin_id, trade_type
+"""
+
+FIND_FILLS_BY_TRADING_HISTORY_SQL = """
+    SELECT f.id, f.trade_uuid, f.price, f.volume, f.funds, f.trade_time
+    FROM trading_fills f
+    JOIN trading_histories th ON th.id = f.trading_history_id
+    WHERE th.user_id = :user_id AND f.trading_history_id = :trading_history_id
+    ORDER BY f.trade_time, f.id
+"""
+
+
+class TradingFillsRepository:
+    """trading_fills 조회 (적재는 TradingHistoriesRepository가 주문 행과 같은 트랜잭션에서 수행)"""
+
+    def __init__(self):
+        self.logger = logging.getLogger(__name__)
+
+    def find_vwap_by_coin(
+        self,
+        user_id: str,
+        exchange_code: Optional[int] = None,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+    ) -> List[Row]:
+        """코인/매수매도별 체결 수량, 금액, 수수료, VWAP 집계 (주문 trade_time 기준 기간 필터)"""
+        try:
+            session = db.get_session()
+            return session.execute(
+                text(FIND_VWAP_BY_COIN_SQL),
+                {
+                    "user_id": user_id,
+                    "exchange_code": exchange_code,
+                    "start_time": start_time,
+                    "end_time": end_time,
+                },
+            ).all()
+        except Exception as e:
+            self.logger.error(f"체결 VWAP 조회 중 에러 발생: {e}")
+            raise e
+        finally:
+            session.close()
+
+    def find_by_trading_history_id(
+        self, user_id: str, trading_history_id: int
+    ) -> List[Row]:
+        """주문 하나의 체결 목록 조회 (체결시간 순)"""
+        try:
+            session = db.get_session()
+            return session.execute(
+                text(FIND_FILLS_BY_TRADING_HISTORY_SQL),
+                {"user_id": user_id, "trading_history_id": trading_history_id},
+            ).all()
+        except Exception as e:
+            self.logger.error(f"체결 목록 조회 중 에러 발생: {e}")
+            raise e
+        finally:
+            session.close()
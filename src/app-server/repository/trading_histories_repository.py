@@ -1,7 +1,170 @@
 import logging
-from typing import List
+from collections import namedtuple
+from datetime import datetime
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Set
+from sqlalchemy import Float, Row, and_, cast, func, or_
+from sqlalchemy.dialects.postgresql import insert
 from database.database_connection import db
 from model.TradingHistories import TradingHistories
+from utils.fixed_point import FIXED_POINT_DIGITS, fixed_to_str, to_fixed
+from utils.pg_copy import CopyLineReader, to_copy_value
+
+# INSERT 한 문장에 담는 최대 행 수
+TRADING_HISTORIES_INSERT_CHUNK_SIZE = 5000
+
+# 저장 시 채우는 컬럼 (id는 시퀀스, created_at은 저장 시점으로 채움)
+INSERT_COLUMNS = (
+    "user_id",
+    "coin_id",
+    "exchange_code",
+    "trade_uuid",
+    "trade_type",
+    "price",
+    "quantity",
+    "total_price",
+    "fee",
+    "trade_time",
+)
+
+# 동기화 변환 결과 행 (ORM 객체 대신 INSERT_COLUMNS 순서의 튜플로 저장)
+# FIXED_POINT_COLUMNS 값은 소수점 8자리 고정소수점 정수 (utils.fixed_point)
+TradingHistoryRow = namedtuple("TradingHistoryRow", INSERT_COLUMNS)
+
+# 체결 적재 시 채우는 컬럼 (order_uuid로 trading_histories 행을 찾아 연결)
+FILL_COPY_COLUMNS = (
+    "user_id",
+    "exchange_code",
+    "order_uuid",
+    "trade_uuid",
+    "price",
+    "volume",
+    "funds",
+    "trade_time",
+)
+
+# 동기화 변환 결과 체결 행 (price/volume/funds는 고정소수점 정수)
+TradingFillRow = namedtuple("TradingFillRow", FILL_COPY_COLUMNS)
+FILL_FIXED_POINT_COLUMNS = ("price", "volume", "funds")
+
+# Numeric(20, 8) 컬럼
+FIXED_POINT_COLUMNS = ("price", "quantity", "total_price", "fee")
+_FIXED_POINT_INDEXES = [INSERT_COLUMNS.index(column) for column in FIXED_POINT_COLUMNS]
+
+
+def _unscaled(columns, fixed_point_columns, prefix=""):
+    """스테이징한 고정소수점 정수 컬럼에 1e-8을 곱하는 SELECT 목록 (numeric 곱셈이라 정확함)"""
+    return ", ".join(
+        f"{prefix}{column} * 1e-{FIXED_POINT_DIGITS}"
+        if column in fixed_point_columns
+        else f"{prefix}{column}"
+        for column in columns
+    )
+
+
+def _float_column(column):
+    """Numeric 컬럼을 DB에서 double precision으로 바꿔 조회
+
+    응답은 float이므로 행마다 Decimal이나 고정소수점 정수를 거치지 않는다.
+    PostgreSQL의 numeric → float8 변환은 가장 가까운 double로 반올림하므로
+    고정소수점 정수 / 1e8과 같은 값이 된다 (benchmark_fixed_point.py).
+    """
+    return cast(column, Float).label(column.key)
+
+
+# 조회 응답에 쓰는 컬럼 (ORM 객체 대신 튜플로 조회, 금액/수량은 float)
+READ_COLUMNS = (
+    TradingHistories.id,
+    TradingHistories.coin_id,
+    TradingHistories.exchange_code,
+    TradingHistories.trade_uuid,
+    TradingHistories.trade_type,
+    _float_column(TradingHistories.price),
+    _float_column(TradingHistories.quantity),
+    _float_column(TradingHistories.total_price),
+    _float_column(TradingHistories.fee),
+    TradingHistories.trade_time,
+    TradingHistories.created_at,
+)
+
+# 일괄 적재용 스테이징 테이블 (트랜잭션 종료 시 삭제)
+# 금액/수량은 고정소수점 정수로 적재해 행마다 소수 문자열을 만들지 않는다
+STAGING_TABLE_NAME = "trading_histories_staging"
+CREATE_STAGING_TABLE_SQL = f"""
+    CREATE TEMP TABLE {STAGING_TABLE_NAME} (
+        user_id UUID NOT NULL,
+        coin_id INTEGER NOT NULL,
+        exchange_code SMALLINT NOT NULL,
+        trade_uuid VARCHAR(100) NOT NULL,
+        trade_type SMALLINT NOT NULL,
+        price NUMERIC(38, 0) NOT NULL,
+        quantity NUMERIC(38, 0) NOT NULL,
+        total_price NUMERIC(38, 0) NOT NULL,
+        fee NUMERIC(38, 0),
+        trade_time TIMESTAMP NOT NULL
+    ) ON COMMIT DROP
+"""
+# created_at의 기본값은 ORM(Python) 쪽에만 있으므로 직접 now()로 채움
+MERGE_STAGING_TABLE_SQL = f"""
+    INSERT INTO trading_histories ({", ".join(INSERT_COLUMNS)}, created_at)
+    SELECT DISTINCT ON (user_id, exchange_code, trade_uuid)
+        {_unscaled(INSERT_COLUMNS, FIXED_POINT_COLUMNS)}, now()
+    FROM {STAGING_TABLE_NAME}
+    ON CONFLICT ON CONSTRAINT uq_user_exchange_trade_uuid DO NOTHING
+"""
+# 재처리용 병합 (이미 있는 주문은 id, created_at을 유지한 채 변환 결과로 덮어씀)
+OVERWRITE_STAGING_TABLE_SQL = f"""
+    INSERT INTO trading_histories ({", ".join(INSERT_COLUMNS)}, created_at)
+    SELECT DISTINCT ON (user_id, exchange_code, trade_uuid)
+        {_unscaled(INSERT_COLUMNS, FIXED_POINT_COLUMNS)}, now()
+    FROM {STAGING_TABLE_NAME}
+    ON CONFLICT ON CONSTRAINT uq_user_exchange_trade_uuid DO UPDATE SET
+        coin_id = EXCLUDED.coin_id,
+        trade_type = EXCLUDED.trade_type,
+        price = EXCLUDED.price,
+        quantity = EXCLUDED.quantity,
+        total_price = EXCLUDED.total_price,
+        fee = EXCLUDED.fee,
+        trade_time = EXCLUDED.trade_time
+"""
+
+# 체결 스테이징 테이블 (주문 행과 같은 트랜잭션에서 병합)
+FILL_STAGING_TABLE_NAME = "trading_fills_staging"
+CREATE_FILL_STAGING_TABLE_SQL = f"""
+    CREATE TEMP TABLE {FILL_STAGING_TABLE_NAME} (
+        user_id UUID NOT NULL,
+        exchange_code SMALLINT NOT NULL,
+        order_uuid VARCHAR(100) NOT NULL,
+        trade_uuid VARCHAR(100) NOT NULL,
+        price NUMERIC(38, 0) NOT NULL,
+        volume NUMERIC(38, 0) NOT NULL,
+        funds NUMERIC(38, 0) NOT NULL,
+        trade_time TIMESTAMP NOT NULL
+    ) ON COMMIT DROP
+"""
+# trading_fills는 이 SQL로만 적재되므로 created_at(ORM 기본값만 있음)도 직접 채움
+MERGE_FILL_STAGING_TABLE_SQL = f"""
+    INSERT INTO trading_fills (
+        trading_history_id, trade_uuid, price, volume, funds, trade_time, created_at
+    )
+    SELECT th.id, s.trade_uuid,
+        {_unscaled(FILL_FIXED_POINT_COLUMNS, FILL_FIXED_POINT_COLUMNS, "s.")},
+        s.trade_time, now()
+    FROM {FILL_STAGING_TABLE_NAME} s
+    JOIN trading_histories th
+        ON th.user_id = s.user_id
+        AND th.exchange_code = s.exchange_code
+        AND th.trade_uuid = s.order_uuid
+    ON CONFLICT ON CONSTRAINT uq_trading_fill DO NOTHING
+"""
+# 재처리 시 스테이징한 주문의 기존 체결 삭제 (체결 uuid가 바뀌어도 남지 않도록)
+DELETE_STAGED_FILLS_SQL = f"""
+    DELETE FROM trading_fills f
+    USING trading_histories th
+    WHERE f.trading_history_id = th.id
+        AND (th.user_id, th.exchange_code, th.trade_uuid) IN (
+            SELECT user_id, exchange_code, order_uuid FROM {FILL_STAGING_TABLE_NAME}
+        )
+"""
 
 
 class TradingHistoriesRepository:
@@ -9,38 +172,36 @@ class TradingHistoriesRepository:
         self.logger = logging.getLogger(__name__)
 
     def save_trading_histories(
-        self, trading_histories: List[TradingHistories]
+        self,
+        trading_histories: List[TradingHistoryRow],
+        trading_fills: Optional[Iterable[TradingFillRow]] = None,
     ) -> List[TradingHistories]:
-        """거래내역 목록 저장"""
+        """거래내역 목록 저장 (이미 있는 trade_uuid는 건너뛰고 새로 저장된 행만 반환)
+
+        uq_user_exchange_trade_uuid 제약조건을 이용해 INSERT ... ON CONFLICT DO NOTHING
+        RETURNING을 청크 단위로 실행하므로 중복 확인과 새로고침을 위한 행 단위 조회가 없다.
+        trading_fills가 있으면 같은 트랜잭션에서 trading_fills에 함께 적재한다.
+        """
         try:
             session = db.get_session()
 
-            # 기존 거래내역과 중복 체크 (trade_uuid 기준)
             saved_histories = []
+            rows = [self._to_insert_row(history) for history in trading_histories]
 
-            for history in trading_histories:
-                # 기존 거래내역 확인
-                existing = (
-                    session.query(TradingHistories)
-                    .filter(
-                        TradingHistories.user_id == history.user_id,
-                        TradingHistories.exchange_code == history.exchange_code,
-                        TradingHistories.trade_uuid == history.trade_uuid,
-                    )
-                    .first()
+            for i in range(0, len(rows), TRADING_HISTORIES_INSERT_CHUNK_SIZE):
+                chunk = rows[i : i + TRADING_HISTORIES_INSERT_CHUNK_SIZE]
+                saved_histories.extend(
+                    session.scalars(self._build_insert_statement(), chunk).all()
                 )
 
-                if existing:
-                    continue
-
-                session.add(history)
-                saved_histories.append(history)
+            if trading_fills is not None:
+                cursor = session.connection().connection.cursor()
+                self._copy_trading_fills(cursor, trading_fills)
 
+            # 커밋 시 만료되지 않도록 세션에서 분리한 뒤 커밋
+            session.expunge_all()
             session.commit()
 
-            for history in saved_histories:
-                session.refresh(history)
-
             self.logger.info(f"거래내역 저장 완료: {len(saved_histories)}개")
             return saved_histories
 
@@ -51,6 +212,99 @@ class TradingHistoriesRepository:
         finally:
             session.close()
 
+    def _build_insert_statement(self):
+        return (
+            insert(TradingHistories)
+            .on_conflict_do_nothing(constraint="uq_user_exchange_trade_uuid")
+            .returning(TradingHistories)
+        )
+
+    def _to_insert_row(self, history: TradingHistoryRow) -> Dict[str, Any]:
+        row = {column: getattr(history, column) for column in INSERT_COLUMNS}
+        if isinstance(history, TradingHistoryRow):
+            # 고정소수점 정수는 float를 거치지 않도록 소수 문자열로 전달
+            for column in FIXED_POINT_COLUMNS:
+                if row[column] is not None:
+                    row[column] = fixed_to_str(row[column])
+        return row
+
+    def backfill_trading_histories(
+        self,
+        trading_histories: Iterable[TradingHistoryRow],
+        trading_fills: Optional[Iterable[TradingFillRow]] = None,
+        overwrite: bool = False,
+    ) -> int:
+        """대량 초기 적재용 저장 (저장된 행 수 반환)
+
+        행을 COPY로 임시 스테이징 테이블에 흘려보낸 뒤 한 번의 INSERT ... SELECT로
+        trading_histories에 병합한다. uq_user_exchange_trade_uuid에 걸리는 행은 건너뛴다.
+        trading_fills가 있으면 주문 병합 뒤 같은 트랜잭션에서 체결도 적재한다.
+        overwrite면 이미 있는 행을 덮어쓰고 그 주문의 체결도 새로 적재한다 (재처리용).
+        """
+        connection = db.engine.raw_connection()
+        try:
+            cursor = connection.cursor()
+            cursor.execute(CREATE_STAGING_TABLE_SQL)
+            cursor.copy_expert(
+                f"COPY {STAGING_TABLE_NAME} ({', '.join(INSERT_COLUMNS)}) FROM STDIN",
+                CopyLineReader(
+                    self._to_copy_line(history) for history in trading_histories
+                ),
+            )
+            cursor.execute(
+                OVERWRITE_STAGING_TABLE_SQL if overwrite else MERGE_STAGING_TABLE_SQL
+            )
+            saved_count = cursor.rowcount
+            if trading_fills is not None:
+                self._copy_trading_fills(cursor, trading_fills, replace=overwrite)
+            connection.commit()
+
+            self.logger.info(f"거래내역 일괄 적재 완료: {saved_count}개")
+            return saved_count
+
+        except Exception as e:
+            self.logger.error(f"거래내역 일괄 적재 중 에러 발생: {e}")
+            connection.rollback()
+            raise e
+        finally:
+            connection.close()
+
+    def _to_copy_line(self, history: TradingHistoryRow) -> str:
+        """COPY 한 줄 (금액/수량은 고정소수점 정수 그대로 보내고 병합 SQL에서 되돌림)"""
+        if isinstance(history, TradingHistoryRow):
+            values = history
+        else:
+            values = [getattr(history, column) for column in INSERT_COLUMNS]
+            for index in _FIXED_POINT_INDEXES:
+                if values[index] is not None:
+                    values[index] = to_fixed(values[index])
+        return "\t".join(map(to_copy_value, values)) + "\n"
+
+    def _copy_trading_fills(
+        self, cursor, trading_fills: Iterable[TradingFillRow], replace: bool = False
+    ) -> int:
+        """체결 행을 COPY로 스테이징한 뒤 주문 행(trade_uuid = order_uuid)에 연결해 병합
+
+        호출한 쪽의 트랜잭션 안에서 실행되며 커밋하지 않는다. 연결할 주문 행이 없는
+        체결과 이미 있는 (주문, 체결 uuid)는 건너뛴다. replace면 스테이징한 주문의
+        기존 체결을 먼저 지운다.
+        """
+        cursor.execute(CREATE_FILL_STAGING_TABLE_SQL)
+        cursor.copy_expert(
+            f"COPY {FILL_STAGING_TABLE_NAME} ({', '.join(FILL_COPY_COLUMNS)}) FROM STDIN",
+            CopyLineReader(self._to_fill_copy_line(fill) for fill in trading_fills),
+        )
+        if replace:
+            cursor.execute(DELETE_STAGED_FILLS_SQL)
+        cursor.execute(MERGE_FILL_STAGING_TABLE_SQL)
+        saved_count = cursor.rowcount
+
+        self.logger.info(f"체결 적재 완료: {saved_count}개")
+        return saved_count
+
+    def _to_fill_copy_line(self, fill: TradingFillRow) -> str:
+        return "\t".join(map(to_copy_value, fill)) + "\n"
+
     def find_by_user_and_exchange(
         self, user_id: str, exchange_code: int
     ) -> List[TradingHistories]:
@@ -90,6 +344,212 @@ class TradingHistoriesRepository:
         finally:
             session.close()
 
+    def find_rows_by_user_id(self, user_id: str) -> List[Row]:
+        """사용자 ID로 모든 거래내역을 READ_COLUMNS 튜플로 조회 (응답 전용)"""
+        try:
+            session = db.get_session()
+            rows = (
+                session.query(*READ_COLUMNS)
+                .filter(TradingHistories.user_id == user_id)
+                .order_by(TradingHistories.trade_time.desc())
+                .all()
+            )
+            return rows
+        except Exception as e:
+            self.logger.error(f"사용자 거래내역 조회 중 에러 발생: {e}")
+            raise e
+        finally:
+            session.close()
+
+    def find_rows_after_id(
+        self, user_id: str, after_id: int, limit: int
+    ) -> List[Row]:
+        """after_id 이후에 저장된 사용자 거래내역을 id 순으로 조회"""
+        try:
+            session = db.get_session()
+            rows = (
+                session.query(*READ_COLUMNS)
+                .filter(
+                    TradingHistories.user_id == user_id,
+                    TradingHistories.id > after_id,
+                )
+                .order_by(TradingHistories.id.asc())
+                .limit(limit)
+                .all()
+            )
+            return rows
+        except Exception as e:
+            self.logger.error(f"신규 거래내역 조회 중 에러 발생: {e}")
+            raise e
+        finally:
+            session.close()
+
+    def find_trade_uuids(
+        self, user_id: str, exchange_code: int, since: Optional[datetime] = None
+    ) -> Set[str]:
+        """이미 저장된 주문 uuid 집합 (since가 있으면 그 이후 체결분만)"""
+        try:
+            session = db.get_session()
+            query = session.query(TradingHistories.trade_uuid).filter(
+                TradingHistories.user_id == user_id,
+                TradingHistories.exchange_code == exchange_code,
+            )
+            if since is not None:
+                query = query.filter(TradingHistories.trade_time >= since)
+            return {trade_uuid for (trade_uuid,) in query}
+        except Exception as e:
+            self.logger.error(f"저장된 주문 uuid 조회 중 에러 발생: {e}")
+            raise e
+        finally:
+            session.close()
+
+    def find_max_id_by_user_id(self, user_id: str) -> int:
+        """사용자 거래내역의 마지막 id (없으면 0)"""
+        try:
+            session = db.get_session()
+            max_id = (
+                session.query(func.max(TradingHistories.id))
+                .filter(TradingHistories.user_id == user_id)
+                .scalar()
+            )
+            return max_id or 0
+        except Exception as e:
+            self.logger.error(f"거래내역 마지막 id 조회 중 에러 발생: {e}")
+            raise e
+        finally:
+            session.close()
+
+    def count_by_user_id(self, user_id: str) -> int:
+        """사용자 거래내역 수"""
+        try:
+            session = db.get_session()
+            return (
+                session.query(func.count(TradingHistories.id))
+                .filter(TradingHistories.user_id == user_id)
+                .scalar()
+            )
+        except Exception as e:
+            self.logger.error(f"거래내역 수 조회 중 에러 발생: {e}")
+            raise e
+        finally:
+            session.close()
+
+    def find_page_by_user_id(
+        self,
+        user_id: str,
+        limit: int,
+        cursor_trade_time: Optional[datetime] = None,  # 이전 페이지 마지막 행
+        cursor_id: Optional[int] = None,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        coin_id: Optional[int] = None,
+        trade_type: Optional[int] = None,
+        exchange_code: Optional[int] = None,
+    ) -> List[Row]:
+        """사용자 거래내역 커서 페이지 조회 (trade_time 역순, id 순)
+
+        idx_trading_histories_user_time 순서 그대로 이전 페이지 마지막 행
+        다음부터 읽으므로 OFFSET 없이 몇 번째 페이지든 같은 비용으로 조회한다.
+        """
+        try:
+            session = db.get_session()
+            query = session.query(*READ_COLUMNS).filter(
+                TradingHistories.user_id == user_id
+            )
+
+            if cursor_trade_time is not None and cursor_id is not None:
+                # trade_time <= 조건은 인덱스 범위 조건으로 쓰이도록 따로 둠
+                query = query.filter(
+                    TradingHistories.trade_time <= cursor_trade_time,
+                    or_(
+                        TradingHistories.trade_time < cursor_trade_time,
+                        and_(
+                            TradingHistories.trade_time == cursor_trade_time,
+                            TradingHistories.id > cursor_id,
+                        ),
+                    )
+                )
+            query = self._apply_filters(
+                query, start_time, end_time, coin_id, trade_type, exchange_code
+            )
+
+            histories = (
+                query.order_by(
+                    TradingHistories.trade_time.desc(), TradingHistories.id.asc()
+                )
+                .limit(limit)
+                .all()
+            )
+            return histories
+        except Exception as e:
+            self.logger.error(f"거래내역 페이지 조회 중 에러 발생: {e}")
+            raise e
+        finally:
+            session.close()
+
+    def iter_batches_by_user_id(
+        self,
+        user_id: str,
+        batch_size: int,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        coin_id: Optional[int] = None,
+        trade_type: Optional[int] = None,
+        exchange_code: Optional[int] = None,
+    ) -> Iterator[List[Row]]:
+        """사용자 거래내역을 서버 측 커서로 batch_size씩 읽어 전달 (페이지 조회와 같은 순서)
+
+        한 번에 batch_size 행만 메모리에 두므로 전체 내역 크기와 관계없이
+        메모리 사용량이 일정하다. 소비가 끝나거나 중단되면 세션을 닫는다.
+        """
+        try:
+            session = db.get_session()
+            query = self._apply_filters(
+                session.query(*READ_COLUMNS).filter(
+                    TradingHistories.user_id == user_id
+                ),
+                start_time,
+                end_time,
+                coin_id,
+                trade_type,
+                exchange_code,
+            ).order_by(TradingHistories.trade_time.desc(), TradingHistories.id.asc())
+
+            batch = []
+            for history in query.yield_per(batch_size):
+                batch.append(history)
+                if len(batch) >= batch_size:
+                    yield batch
+                    batch = []
+            if batch:
+                yield batch
+        except Exception as e:
+            self.logger.error(f"거래내역 스트리밍 조회 중 에러 발생: {e}")
+            raise e
+        finally:
+            session.close()
+
+    def _apply_filters(
+        self,
+        query,
+        start_time: Optional[datetime],
+        end_time: Optional[datetime],
+        coin_id: Optional[int],
+        trade_type: Optional[int],
+        exchange_code: Optional[int],
+    ):
+        if start_time is not None:
+            query = query.filter(TradingHistories.trade_time >= start_time)
+        if end_time is not None:
+            query = query.filter(TradingHistories.trade_time <= end_time)
+        if coin_id is not None:
+            query = query.filter(TradingHistories.coin_id == coin_id)
+        if trade_type is not None:
+            query = query.filter(TradingHistories.trade_type == trade_type)
+        if exchange_code is not None:
+            query = query.filter(TradingHistories.exchange_code == exchange_code)
+        return query
+
     def delete_by_user_and_exchange(self, user_id: str, exchange_code: int) -> bool:
         """사용자와 거래소별 거래내역 삭제"""
         try:
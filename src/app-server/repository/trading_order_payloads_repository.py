@@ -0,0 +1,128 @@
+import logging
+from typing import Any, Dict, Iterable, List, Optional
+import orjson
+from sqlalchemy import Text, cast, func, select
+from database.database_connection import db
+from model.TradingOrderPayloads import TradingOrderPayloads
+from utils.pg_copy import CopyLineReader, to_copy_value
+
+# 원본 보관 시 채우는 컬럼
+PAYLOAD_COPY_COLUMNS = ("user_id", "exchange_code", "order_uuid", "payload")
+
+# 보관용 스테이징 테이블 (트랜잭션 종료 시 삭제)
+PAYLOAD_STAGING_TABLE_NAME = "trading_order_payloads_staging"
+CREATE_PAYLOAD_STAGING_TABLE_SQL = f"""
+    CREATE TEMP TABLE {PAYLOAD_STAGING_TABLE_NAME} (
+        user_id UUID NOT NULL,
+        exchange_code SMALLINT NOT NULL,
+        order_uuid VARCHAR(100) NOT NULL,
+        payload JSONB NOT NULL
+    ) ON COMMIT DROP
+"""
+# 같은 주문을 다시 받으면 내용이 바뀐 경우에만 갱신
+MERGE_PAYLOAD_STAGING_TABLE_SQL = f"""
+    INSERT INTO trading_order_payloads ({", ".join(PAYLOAD_COPY_COLUMNS)})
+    SELECT DISTINCT ON (user_id, exchange_code, order_uuid) {", ".join(PAYLOAD_COPY_COLUMNS)}
+    FROM {PAYLOAD_STAGING_TABLE_NAME}
+    ON CONFLICT ON CONSTRAINT uq_user_exchange_order_payload DO UPDATE SET
+        payload = EXCLUDED.payload,
+        fetched_at = now()
+    WHERE trading_order_payloads.payload IS DISTINCT FROM EXCLUDED.payload
+"""
+
+
+class TradingOrderPayloadsRepository:
+    def __init__(self):
+        self.logger = logging.getLogger(__name__)
+
+    def save_payloads(
+        self, user_id: str, exchange_code: int, orders: Iterable[Dict[str, Any]]
+    ) -> int:
+        """주문 상세 원본을 COPY로 보관 (새로 저장/갱신된 행 수 반환)"""
+        connection = db.engine.raw_connection()
+        try:
+            cursor = connection.cursor()
+            cursor.execute(CREATE_PAYLOAD_STAGING_TABLE_SQL)
+            cursor.copy_expert(
+                f"COPY {PAYLOAD_STAGING_TABLE_NAME} ({', '.join(PAYLOAD_COPY_COLUMNS)}) FROM STDIN",
+                CopyLineReader(
+                    self._to_copy_line(user_id, exchange_code, order)
+                    for order in orders
+                    if order.get("uuid")
+                ),
+            )
+            cursor.execute(MERGE_PAYLOAD_STAGING_TABLE_SQL)
+            saved_count = cursor.rowcount
+            connection.commit()
+
+            self.logger.info(f"주문 원본 보관 완료: {saved_count}개")
+            return saved_count
+
+        except Exception as e:
+            self.logger.error(f"주문 원본 보관 중 에러 발생: {e}")
+            connection.rollback()
+            raise e
+        finally:
+            connection.close()
+
+    def _to_copy_line(
+        self, user_id: str, exchange_code: int, order: Dict[str, Any]
+    ) -> str:
+        values = (user_id, exchange_code, order["uuid"], orjson.dumps(order).decode())
+        return "\t".join(to_copy_value(value) for value in values) + "\n"
+
+    def find_range_starts(
+        self, user_id: str, exchange_code: int, batch_size: int
+    ) -> List[int]:
+        """id 순으로 batch_size개씩 나눈 각 구간의 시작 id (재처리 작업 분할용)"""
+        try:
+            session = db.get_session()
+            numbered = (
+                select(
+                    TradingOrderPayloads.id,
+                    func.row_number()
+                    .over(order_by=TradingOrderPayloads.id)
+                    .label("row_number"),
+                )
+                .where(
+                    TradingOrderPayloads.user_id == user_id,
+                    TradingOrderPayloads.exchange_code == exchange_code,
+                )
+                .subquery()
+            )
+            return list(
+                session.scalars(
+                    select(numbered.c.id)
+                    .where((numbered.c.row_number - 1) % batch_size == 0)
+                    .order_by(numbered.c.id)
+                )
+            )
+        except Exception as e:
+            self.logger.error(f"주문 원본 구간 조회 중 에러 발생: {e}")
+            raise e
+        finally:
+            session.close()
+
+    def find_payload_texts(
+        self,
+        user_id: str,
+        exchange_code: int,
+        start_id: int,
+        end_id: Optional[int] = None,  # 포함하지 않음, None이면 끝까지
+    ) -> List[str]:
+        """구간의 주문 원본을 JSON 문자열로 조회 (파싱은 호출한 쪽에서 orjson으로)"""
+        try:
+            session = db.get_session()
+            query = session.query(cast(TradingOrderPayloads.payload, Text)).filter(
+                TradingOrderPayloads.user_id == user_id,
+                TradingOrderPayloads.exchange_code == exchange_code,
+                TradingOrderPayloads.id >= start_id,
+            )
+            if end_id is not None:
+                query = query.filter(TradingOrderPayloads.id < end_id)
+            return list(session.scalars(query.order_by(TradingOrderPayloads.id)))
+        except Exception as e:
+            self.logger.error(f"주문 원본 조회 중 에러 발생: {e}")
+            raise e
+        finally:
+            session.close()
@@ -0,0 +1,83 @@
+import logging
+from datetime import datetime
+from typing import List, Optional
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert
+from database.database_connection import db
+from model.TradingSyncCursors import TradingSyncCursors
+
+
+class TradingSyncCursorRepository:
+    def __init__(self):
+        self.logger = logging.getLogger(__name__)
+
+    def find_by_user_and_exchange(
+        self, user_id: str, exchange_code: int
+    ) -> Optional[TradingSyncCursors]:
+        """사용자와 거래소별 동기화 체크포인트 조회"""
+        try:
+            session = db.get_session()
+            cursor = (
+                session.query(TradingSyncCursors)
+                .filter(
+                    TradingSyncCursors.user_id == user_id,
+                    TradingSyncCursors.exchange_code == exchange_code,
+                )
+                .first()
+            )
+            return cursor
+        except Exception as e:
+            self.logger.error(f"동기화 체크포인트 조회 중 에러 발생: {e}")
+            raise e
+        finally:
+            session.close()
+
+    def save_checkpoint(
+        self,
+        user_id: str,
+        exchange_code: int,
+        last_window_end: Optional[datetime],
+        pending_uuids: List[str],
+    ):
+        """동기화 체크포인트 저장 (없으면 생성, 있으면 갱신)"""
+        try:
+            session = db.get_session()
+            statement = insert(TradingSyncCursors).values(
+                user_id=user_id,
+                exchange_code=exchange_code,
+                last_window_end=last_window_end,
+                pending_uuids=pending_uuids,
+            )
+            statement = statement.on_conflict_do_update(
+                constraint="uq_user_exchange_sync_cursor",
+                set_={
+                    "last_window_end": statement.excluded.last_window_end,
+                    "pending_uuids": statement.excluded.pending_uuids,
+                    "updated_at": func.now(),
+                },
+            )
+            session.execute(statement)
+            session.commit()
+        except Exception as e:
+            self.logger.error(f"동기화 체크포인트 저장 중 에러 발생: {e}")
+            session.rollback()
+            raise e
+        finally:
+            session.close()
+
+    def delete_by_user_and_exchange(self, user_id: str, exchange_code: int) -> bool:
+        """사용자와 거래소별 동기화 체크포인트 삭제 (처음부터 다시 동기화)"""
+        try:
+            session = db.get_session()
+            session.query(TradingSyncCursors).filter(
+                TradingSyncCursors.user_id == user_id,
+                TradingSyncCursors.exchange_code == exchange_code,
+            ).delete()
+            session.commit()
+            return True
+        except Exception as e:
+            self.logger.error(f"동기화 체크포인트 삭제 중 에러 발생: {e}")
+            session.rollback()
+            raise e
+        finally:
+            session.close()
@@ -0,0 +1,40 @@
+"""보관된 주문 원본으로 거래내역 재처리 (거래소 API를 호출하지 않음)
+
+변환 로직(수수료, 매수/매도, 코인 매핑 등)을 고친 뒤 전체 내역을 다시 받지 않고
+trading_order_payloads에서 trading_histories/trading_fills를 다시 만든다.
+
+사용법:
+    python reprocess_trading_histories.py <user_id> [--exchange UPBIT] [--workers 8]
+"""
+
+import argparse
+import json
+import logging
+from database.database_connection import db
+from dependencies import get_coin_registry, get_trading_histories_service
+
+logging.basicConfig(level=logging.INFO)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="보관된 주문 원본으로 거래내역 재처리")
+    parser.add_argument("user_id")
+    parser.add_argument("--exchange", default="UPBIT", help="거래소명 (기본 UPBIT)")
+    parser.add_argument("--workers", type=int, default=None, help="워커 프로세스 수")
+    parser.add_argument("--batch-size", type=int, default=None, help="워커당 주문 수")
+    args = parser.parse_args()
+
+    db.create_tables()
+    get_coin_registry().refresh()
+
+    result = get_trading_histories_service().reprocess_trading_histories(
+        args.user_id,
+        args.exchange,
+        workers=args.workers,
+        batch_size=args.batch_size,
+    )
+    print(json.dumps(result, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
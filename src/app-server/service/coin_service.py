@@ -1,12 +1,21 @@
+import json
+import hashlib
 import logging
 from typing import List, Dict, Any
 from model.Coins import Coins
+from repository.coin_repository import UPSERT_COLUMNS
+
+# 코인 목록 동기화 상태 이름 (ETag, Last-Modified, 내용 해시)
+COIN_MASTER_SYNC_STATE = "crix_master"
 
 
 class CoinService:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         self._coin_repository = None  # lazy loading
+        self._coin_registry = None
+        self._upbit_service = None
+        self._sync_state_store = None
 
     @property
     def coin_repository(self):
@@ -16,29 +25,182 @@ class CoinService:
             self._coin_repository = get_coin_repository()
         return self._coin_repository
 
-    def save_all_coin_list(self, fetched_data_list: List[Dict[Any, Any]]):
+    @property
+    def coin_registry(self):
+        if self._coin_registry is None:
+            from dependencies import get_coin_registry
+
+            self._coin_registry = get_coin_registry()
+        return self._coin_registry
+
+    @property
+    def upbit_service(self):
+        if self._upbit_service is None:
+            from dependencies import get_upbit_service
+
+            self._upbit_service = get_upbit_service()
+        return self._upbit_service
+
+    @property
+    def sync_state_store(self):
+        if self._sync_state_store is None:
+            from dependencies import get_sync_state_store
+
+            self._sync_state_store = get_sync_state_store()
+        return self._sync_state_store
+
+    def save_all_coin_list(
+        self, fetched_data_list: List[Dict[Any, Any]]
+    ) -> Dict[str, int]:
+        """업비트 코인 목록 저장 (추가/갱신/변경 없음 건수 반환)"""
         try:
-            coin_list = [
-                Coins(
-                    symbol=data.get("baseCurrencyCode"),
-                    quote_currency=data.get("quoteCurrencyCode"),
-                    market_code=self._convert_market_code_format(str(data.get("pair"))),
-                    korean_name=data.get("koreanName"),
-                    english_name=data.get("englishName"),
-                    img_url=f"/data/image/{data.get('baseCurrencyCode')}.png",
-                    exchange=data.get("exchange"),
-                )
-                for data in fetched_data_list
-                if data.get("exchange") == "UPBIT"
-            ]
-
-            saved_coin_list = self.coin_repository.save_coin_list(coin_list)
-
-            return saved_coin_list
+            coin_list = self._to_coins(fetched_data_list)
+
+            saved_counts = self.coin_repository.save_coin_list(coin_list)
+
+            # 추가/변경된 코인이 있을 때만 조회용 코인 목록 갱신
+            if saved_counts["inserted"] or saved_counts["updated"]:
+                self.coin_registry.refresh()
+
+            return saved_counts
         except Exception as e:
             self.logger.error(f"코인 목록 저장 중 에러 발생: {e}")
             raise e
 
+    def sync_coin_master(self) -> Dict[str, Any]:
+        """업비트 코인 목록 변경분 동기화
+
+        이전 응답의 ETag / Last-Modified로 조건부 요청을 보내고, 304이거나
+        내용 해시가 같으면 파싱과 DB 작업 없이 끝낸다. 바뀌었으면 현재 코인
+        목록과 비교해 추가/변경/상장 폐지 마켓만 반영한다. 상태는 DB 반영이
+        끝난 뒤에 저장하므로 중간에 실패하면 다음 동기화에서 다시 반영된다.
+        """
+        try:
+            state = self.sync_state_store.get(COIN_MASTER_SYNC_STATE)
+            fetched = self.upbit_service.fetch_coin_master_if_modified(
+                state.get("etag"), state.get("last_modified")
+            )
+
+            if fetched["not_modified"]:
+                return self._unchanged_coin_master_result("not_modified")
+
+            content_hash = hashlib.sha256(fetched["content"]).hexdigest()
+            next_state = {
+                "etag": fetched["etag"],
+                "last_modified": fetched["last_modified"],
+                "content_hash": content_hash,
+            }
+
+            if content_hash == state.get("content_hash"):
+                # 내용은 같고 ETag만 바뀐 경우 다음 요청부터 304를 받도록 상태만 갱신
+                self.sync_state_store.save(COIN_MASTER_SYNC_STATE, next_state)
+                return self._unchanged_coin_master_result("same_content")
+
+            coins = self._to_coins(json.loads(fetched["content"]))
+            if not coins:
+                # 빈 목록으로 전체 마켓이 상장 폐지 처리되지 않도록 중단
+                raise ValueError("업비트 코인 목록이 비어 있습니다")
+
+            diff = self.diff_coin_master(coins)
+            self.apply_coin_master_diff(diff)
+            self.sync_state_store.save(COIN_MASTER_SYNC_STATE, next_state)
+
+            return {
+                "changed": True,
+                "reason": "modified",
+                "added": [coin.market_code for coin in diff["added"]],
+                "renamed": [coin.market_code for coin in diff["renamed"]],
+                "delisted": diff["delisted"],
+                "counts": {
+                    "added": len(diff["added"]),
+                    "renamed": len(diff["renamed"]),
+                    "delisted": len(diff["delisted"]),
+                    "unchanged": diff["unchanged"],
+                },
+            }
+        except Exception as e:
+            self.logger.error(f"코인 목록 동기화 중 에러 발생: {e}")
+            raise e
+
+    def diff_coin_master(self, coins: List[Coins]) -> Dict[str, Any]:
+        """받아온 코인 목록과 현재 코인 목록 비교
+
+        added: 새 마켓 또는 상장 폐지 후 다시 상장된 마켓
+        renamed: 이름/심볼 등 정보가 바뀐 마켓
+        delisted: 활성 상태인데 받아온 목록에 없는 마켓 (market_code 목록)
+        """
+        current = {
+            str(coin.market_code): coin
+            for coin in self.coin_registry.all()
+            if coin.exchange == "UPBIT"
+        }
+        fetched = {coin.market_code: coin for coin in coins}
+
+        added = []
+        renamed = []
+        unchanged = 0
+        for market_code, coin in fetched.items():
+            existing = current.get(market_code)
+            if existing is None or existing.is_active is False:
+                added.append(coin)
+            elif any(
+                getattr(existing, column) != getattr(coin, column)
+                for column in UPSERT_COLUMNS
+            ):
+                renamed.append(coin)
+            else:
+                unchanged += 1
+
+        delisted = sorted(
+            market_code
+            for market_code, coin in current.items()
+            if market_code not in fetched and coin.is_active is not False
+        )
+
+        return {
+            "added": added,
+            "renamed": renamed,
+            "delisted": delisted,
+            "unchanged": unchanged,
+        }
+
+    def apply_coin_master_diff(self, diff: Dict[str, Any]):
+        """비교 결과 중 바뀐 마켓만 DB에 반영하고 조회용 코인 목록 갱신"""
+        changed_coins = diff["added"] + diff["renamed"]
+        if not changed_coins and not diff["delisted"]:
+            return
+
+        if changed_coins:
+            self.coin_repository.save_coin_list(changed_coins)
+        self.coin_repository.deactivate_by_market_codes(diff["delisted"])
+        self.coin_registry.refresh()
+
+    def _unchanged_coin_master_result(self, reason: str) -> Dict[str, Any]:
+        return {
+            "changed": False,
+            "reason": reason,
+            "added": [],
+            "renamed": [],
+            "delisted": [],
+            "counts": {"added": 0, "renamed": 0, "delisted": 0, "unchanged": 0},
+        }
+
+    def _to_coins(self, fetched_data_list: List[Dict[Any, Any]]) -> List[Coins]:
+        return [
+            Coins(
+                symbol=data.get("baseCurrencyCode"),
+                quote_currency=data.get("quoteCurrencyCode"),
+                market_code=self._convert_market_code_format(str(data.get("pair"))),
+                korean_name=data.get("koreanName"),
+                english_name=data.get("englishName"),
+                img_url=f"/data/image/{data.get('baseCurrencyCode')}.png",
+                exchange=data.get("exchange"),
+                is_active=True,
+            )
+            for data in fetched_data_list
+            if data.get("exchange") == "UPBIT"
+        ]
+
     def _convert_market_code_format(self, market_code: str) -> str:
         """market_code 형식을 BTC/KRW → KRW-BTC로 변환"""
         if not market_code or "/" not in market_code:
@@ -1,22 +1,67 @@
 from dotenv import load_dotenv
+import base64
 import logging
-from datetime import datetime
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+import orjson
 import pytz
 import time
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterable, Iterator, Callable, Tuple
 from fastapi import HTTPException
 from model.TradingHistories import TradingHistories
+from repository.trading_histories_repository import TradingFillRow, TradingHistoryRow
+from utils.order_transform import (
+    OrderColumns,
+    aggregate_orders,
+    build_fill_rows,
+    build_rows,
+    flatten_fills,
+    transform_orders,
+)
+from utils.time_utils import parse_iso8601
 
 load_dotenv()
 
+# 동기화 시 주문 상세 조회 → 저장을 한 번에 처리하는 uuid 수
+TRADING_SYNC_DETAIL_CHUNK_SIZE = int(
+    os.getenv("TRADING_SYNC_DETAIL_CHUNK_SIZE", "1000")
+)
+# 첫 동기화(전체 기간 적재) 시 COPY로 한 번에 저장하는 uuid 수
+TRADING_BACKFILL_CHUNK_SIZE = int(os.getenv("TRADING_BACKFILL_CHUNK_SIZE", "20000"))
+# 거래내역 조회 페이지 크기
+TRADING_HISTORY_PAGE_SIZE = int(os.getenv("TRADING_HISTORY_PAGE_SIZE", "100"))
+TRADING_HISTORY_MAX_PAGE_SIZE = int(
+    os.getenv("TRADING_HISTORY_MAX_PAGE_SIZE", "1000")
+)
+# 동기화 결과/변경분 조회에 한 번에 담는 신규 거래내역 수
+TRADING_SYNC_DELTA_MAX_ROWS = int(os.getenv("TRADING_SYNC_DELTA_MAX_ROWS", "1000"))
+# 전체 거래내역 스트리밍 시 DB에서 한 번에 읽는 행 수
+TRADING_HISTORY_STREAM_BATCH_SIZE = int(
+    os.getenv("TRADING_HISTORY_STREAM_BATCH_SIZE", "1000")
+)
+# 보관된 주문 원본 재처리 시 워커 하나가 한 번에 변환/저장하는 주문 수와 워커 수
+TRADING_REPROCESS_BATCH_SIZE = int(os.getenv("TRADING_REPROCESS_BATCH_SIZE", "20000"))
+TRADING_REPROCESS_WORKERS = int(
+    os.getenv("TRADING_REPROCESS_WORKERS", str(os.cpu_count() or 1))
+)
+
 
 class TradingHistoriesService:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         self._trading_repository = None
+        self._trading_fills_repository = None
+        self._order_payloads_repository = None
         self._coin_repository = None
         self._exchange_credentials_service = None
         self._upbit_service = None
+        self._user_service = None
+        self._sync_cursor_repository = None
+        self._response_cache = None
+        self._response_cache_loaded = False
+        self._coin_registry = None
 
     @property
     def trading_repository(self):
@@ -28,6 +73,52 @@ class TradingHistoriesService:
             self._trading_repository = TradingHistoriesRepository()
         return self._trading_repository
 
+    @property
+    def trading_fills_repository(self):
+        if self._trading_fills_repository is None:
+            from repository.trading_fills_repository import TradingFillsRepository
+
+            self._trading_fills_repository = TradingFillsRepository()
+        return self._trading_fills_repository
+
+    @property
+    def order_payloads_repository(self):
+        if self._order_payloads_repository is None:
+            from repository.trading_order_payloads_repository import (
+                TradingOrderPayloadsRepository,
+            )
+
+            self._order_payloads_repository = TradingOrderPayloadsRepository()
+        return self._order_payloads_repository
+
+    @property
+    def sync_cursor_repository(self):
+        if self._sync_cursor_repository is None:
+            from repository.trading_sync_cursor_repository import (
+                TradingSyncCursorRepository,
+            )
+
+            self._sync_cursor_repository = TradingSyncCursorRepository()
+        return self._sync_cursor_repository
+
+    @property
+    def response_cache(self):
+        """조회 응답 캐시 (RESPONSE_CACHE_BACKEND=none이면 None)"""
+        if not self._response_cache_loaded:
+            from utils.response_cache import create_response_cache
+
+            self._response_cache = create_response_cache()
+            self._response_cache_loaded = True
+        return self._response_cache
+
+    @property
+    def coin_registry(self):
+        if self._coin_registry is None:
+            from dependencies import get_coin_registry
+
+            self._coin_registry = get_coin_registry()
+        return self._coin_registry
+
     @property
     def coin_repository(self):
         if self._coin_repository is None:
@@ -52,110 +143,472 @@ class TradingHistoriesService:
             self._upbit_service = get_upbit_service()
         return self._upbit_service
 
-    def get_trading_histories(
-        self,
-        user_id: str,
-        exchange_provider: str,
-        start_time: Optional[datetime] = None,
-    ):
+    def _get_exchange_keys(self, user_id: str, exchange_provider: str):
+        from dto.exchange_credentials_dto import ExchangeProvider
+
+        credentials = self.exchange_credentials_service.get_credentials(
+            user_id, ExchangeProvider[exchange_provider]
+        )
+        if credentials is None:
+            raise HTTPException(status_code=404, detail="User not found")
+
+        return credentials.access_key, credentials.secret_key
+
+    @property
+    def user_service(self):
+        if self._user_service is None:
+            from dependencies import get_user_service
+
+            self._user_service = get_user_service()
+        return self._user_service
+
+    async def sync_trading_histories(
+        self, payload: Dict[str, Any], progress: Optional[Any] = None
+    ) -> Dict[str, Any]:
+        """거래내역 동기화 작업 (작업 큐 핸들러)
+
+        주문 목록 조회는 구간마다, 주문 상세 조회/저장은 묶음마다 체크포인트를
+        남기므로 중간에 실패해도 다음 실행은 멈춘 지점부터 이어서 진행한다.
+        첫 동기화는 전체 기간을 적재하므로 큰 묶음을 COPY로 저장한다.
+        결과에는 전체 내역 대신 payload의 sync_cursor(없으면 동기화 시작 시점)
+        이후 새로 저장된 행만 담는다. 전체 건수는 세지 않으므로 클라이언트는
+        기존 건수에 saved_count를 더한다. DB 작업은 스레드풀에서 실행한다.
+        """
         try:
+            from fastapi.concurrency import run_in_threadpool
             from dto.exchange_credentials_dto import ExchangeProvider
 
-            credentials = self.exchange_credentials_service.get_credentials(
-                user_id, ExchangeProvider[exchange_provider]
+            user_id = payload["user_id"]
+            exchange_provider = payload["exchange_provider"]
+            exchange_code = ExchangeProvider[exchange_provider.upper()].value
+
+            access_key, secret_key = await run_in_threadpool(
+                self._get_exchange_keys, user_id, exchange_provider
+            )
+
+            sync_cursor = payload.get("sync_cursor")
+            if sync_cursor is None:
+                last_id = await run_in_threadpool(
+                    self.trading_repository.find_max_id_by_user_id, user_id
+                )
+                sync_cursor = self._encode_sync_cursor(last_id)
+
+            # 체크포인트가 있으면 이어서, 없으면 마지막 업데이트 시간부터 조회
+            cursor = await run_in_threadpool(
+                self.sync_cursor_repository.find_by_user_and_exchange,
+                user_id,
+                exchange_code,
+            )
+            pending_uuids = list(cursor.pending_uuids or []) if cursor else []
+            last_window_end = cursor.last_window_end if cursor else None
+
+            if last_window_end is not None:
+                start_time = last_window_end + timedelta(seconds=1)
+            else:
+                user = await run_in_threadpool(
+                    self.user_service.user_repository.find_by_id, user_id
+                )
+                start_time = user.last_trading_history_update_at if user else None
+
+            is_backfill = cursor is None and start_time is None
+            chunk_size = (
+                TRADING_BACKFILL_CHUNK_SIZE
+                if is_backfill
+                else TRADING_SYNC_DETAIL_CHUNK_SIZE
+            )
+
+            # 이미 저장된 주문은 상세 조회 전에 제외 (조회 구간과 겹치는 체결분만 불러옴)
+            stored_uuids = await run_in_threadpool(
+                self.trading_repository.find_trade_uuids,
+                user_id,
+                exchange_code,
+                self._known_uuids_since(start_time),
             )
-            if credentials is None:
-                raise HTTPException(status_code=404, detail="User not found")
+            skipped_count = sum(1 for uuid in pending_uuids if uuid in stored_uuids)
+            pending_uuids = [uuid for uuid in pending_uuids if uuid not in stored_uuids]
+            fetched_count = len(pending_uuids)
+
+            if progress is not None and pending_uuids:
+                await progress.set(uuids_resumed=len(pending_uuids))
+
+            async def save_checkpoint():
+                await run_in_threadpool(
+                    self.sync_cursor_repository.save_checkpoint,
+                    user_id,
+                    exchange_code,
+                    last_window_end,
+                    pending_uuids,
+                )
+
+            # 조회 → 변환 → 저장 파이프라인 (각 단계는 한 묶음씩 넘기는 비동기 제너레이터)
+            async def uuid_chunks():
+                """주문 목록 조회 구간마다 새 uuid를 모으고 chunk_size개씩 내보냄
+
+                내보낸 묶음은 저장 단계가 저장 후 pending_uuids에서 제거한다.
+                """
+                nonlocal last_window_end, skipped_count, fetched_count
+                known_uuids = set(pending_uuids)
+
+                uuid_windows = self.upbit_service.iter_trading_uuids_async(
+                    access_key, secret_key, start_time, progress
+                )
+                async for completed_end, uuids in uuid_windows:
+                    new_uuids = [uuid for uuid in uuids if uuid not in known_uuids]
+                    known_uuids.update(new_uuids)
+                    fresh_uuids = [
+                        uuid for uuid in new_uuids if uuid not in stored_uuids
+                    ]
+                    skipped_count += len(new_uuids) - len(fresh_uuids)
+                    fetched_count += len(fresh_uuids)
+                    pending_uuids.extend(fresh_uuids)
+                    if completed_end is not None:
+                        last_window_end = parse_iso8601(completed_end)
+                    await save_checkpoint()
+
+                    while len(pending_uuids) >= chunk_size:
+                        yield pending_uuids[:chunk_size]
+
+                # 남은 uuid
+                while pending_uuids:
+                    yield pending_uuids[:chunk_size]
+
+            async def order_batches(chunks):
+                """uuid 묶음 → 주문 상세 조회 (변환 전에 원본부터 보관)"""
+                async for chunk in chunks:
+                    trading_histies = (
+                        await self.upbit_service.fetch_all_trading_history_batched_async(
+                            access_key, secret_key, chunk, progress
+                        )
+                    )
+                    await run_in_threadpool(
+                        self.archive_order_payloads,
+                        user_id,
+                        exchange_provider,
+                        trading_histies,
+                    )
+                    yield chunk, trading_histies
+
+            async def row_batches(batches):
+                """주문 상세 묶음 → 저장용 주문 행/체결 행 묶음"""
+                async for chunk, trading_histies in batches:
+                    processed_trading_histies, trading_fills = await run_in_threadpool(
+                        self.process_orders,
+                        user_id,
+                        exchange_provider,
+                        trading_histies,
+                        coin_map,
+                    )
+                    yield chunk, processed_trading_histies, trading_fills
+
+            saved_count = 0
+            coin_map = await run_in_threadpool(self.get_coin_map)
+
+            # 묶음마다 저장(커밋) 후 체크포인트에서 제거하므로 중간에 실패해도 앞선 묶음은 남음
+            async for chunk, processed_trading_histies, trading_fills in row_batches(
+                order_batches(uuid_chunks())
+            ):
+                if is_backfill:
+                    chunk_saved_count = await run_in_threadpool(
+                        self.backfill_trading_histories,
+                        processed_trading_histies,
+                        trading_fills,
+                    )
+                else:
+                    chunk_saved_count = len(
+                        await run_in_threadpool(
+                            self.save_trading_histories,
+                            processed_trading_histies,
+                            trading_fills,
+                        )
+                    )
 
-            access_key = credentials.access_key
-            secret_key = credentials.secret_key
+                del pending_uuids[: len(chunk)]
+                await save_checkpoint()
 
-            uuids = self.upbit_service.fetch_all_trading_uuids(
-                access_key, secret_key, start_time
+                if progress is not None:
+                    await progress.increment(rows_saved=chunk_saved_count)
+                saved_count += chunk_saved_count
+
+            await run_in_threadpool(
+                self.user_service.update_user_trading_history_updated_at, user_id
             )
 
-            trading_histies = self.upbit_service.fetch_all_trading_history(
-                access_key, secret_key, uuids
+            skipped = self._summarize_skipped_uuids(skipped_count, fetched_count)
+            self.logger.info(
+                f"저장된 주문 상세 조회 생략: {skipped['skipped_count']}개 "
+                f"(요청 {skipped['requests_saved']}회 절약)"
             )
+            if progress is not None:
+                await progress.set(
+                    uuids_skipped=skipped["skipped_count"],
+                    requests_saved=skipped["requests_saved"],
+                )
 
-            return trading_histies
+            delta = await run_in_threadpool(
+                self.get_trading_histories_delta, user_id, sync_cursor
+            )
+            return {"saved_count": saved_count, **skipped, **delta}
         except Exception as e:
             raise e
 
+    def _known_uuids_since(self, start_time: Optional[datetime]) -> Optional[datetime]:
+        """저장된 uuid를 불러올 체결시간 하한 (None이면 전체)
+
+        체결시간은 시간대 없이 저장되므로 시간대 차이를 넘도록 하루 앞당긴다.
+        """
+        if start_time is None:
+            return None
+        return start_time.replace(tzinfo=None) - timedelta(days=1)
+
+    def _summarize_skipped_uuids(
+        self, skipped_count: int, fetched_count: int
+    ) -> Dict[str, int]:
+        """제외한 uuid 수와 줄어든 /v1/orders/uuids 요청 수"""
+        from service.upbit_service import UPBIT_ORDERS_UUIDS_BATCH_SIZE
+
+        requests_saved = math.ceil(
+            (skipped_count + fetched_count) / UPBIT_ORDERS_UUIDS_BATCH_SIZE
+        ) - math.ceil(fetched_count / UPBIT_ORDERS_UUIDS_BATCH_SIZE)
+        return {"skipped_count": skipped_count, "requests_saved": requests_saved}
+
+    def get_coin_map(self) -> Dict[str, int]:
+        """market_code → coin id 매핑 (프로세스 공용 코인 목록 기준)"""
+        return self.coin_registry.market_code_map()
+
+    def _resolve_coin_id(self, market_code: str, coin_map: Dict[str, int]) -> int:
+        coin_id = coin_map.get(market_code)
+        if coin_id is None:
+            # 새로 상장된 마켓이면 코인 목록을 한 번 다시 불러와서 찾음
+            coin_id = self.coin_registry.get_id_by_market_code(market_code)
+        if coin_id is None:
+            raise ValueError(f"등록되지 않은 마켓입니다: {market_code}")
+        return coin_id
+
     def process_trading_histories(
         self,
         user_id: str,
         exchange_provider: str,
         trading_histies: List[Dict[str, Any]],
-    ):
+        coin_map: Optional[Dict[str, int]] = None,
+    ) -> List[TradingHistoryRow]:
+        """주문 상세 목록을 저장용 행 튜플로 변환
+
+        주문마다 ORM 객체를 만드는 대신 체결을 열 단위로 모아 수량/금액/평균가를
+        한 번에 집계하고, 체결시간도 한 번에 변환한다.
+        """
         try:
-            from dependencies import get_coin_repository
             from dto.exchange_credentials_dto import ExchangeProvider
 
-            coin_repository = get_coin_repository()
-            coins = coin_repository.get_all_coins()
-
-            coin_map = {str(coin.market_code): coin.id for coin in coins}
+            if coin_map is None:
+                coin_map = self.get_coin_map()
 
             # exchange_provider를 숫자로 변환
             exchange_code = ExchangeProvider[exchange_provider.upper()].value
 
-            trading_history_array = []
+            return self._build_history_rows(
+                user_id, exchange_code, aggregate_orders(trading_histies), coin_map
+            )
+        except Exception as e:
+            raise e
 
-            for trading_history in trading_histies:
-                if trading_history.get("trades") is None:
-                    continue
+    def process_orders(
+        self,
+        user_id: str,
+        exchange_provider: str,
+        trading_histies: List[Dict[str, Any]],
+        coin_map: Optional[Dict[str, int]] = None,
+    ) -> Tuple[List[TradingHistoryRow], List[TradingFillRow]]:
+        """주문 상세 목록을 저장용 행과 체결 행으로 한 번에 변환
 
-                total_quantity = 0
-                total_price = 0
-                for trade in trading_history.get("trades", []):
-                    # 문자열을 숫자로 변환
-                    volume = float(trade.get("volume", 0))
-                    funds = float(trade.get("funds", 0))
+        process_trading_histories와 process_trading_fills를 따로 부르면 같은
+        수량/금액 문자열을 두 번 읽으므로, 둘 다 저장할 때는 이 메서드를 쓴다.
+        """
+        try:
+            from dto.exchange_credentials_dto import ExchangeProvider
 
-                    total_quantity += volume
-                    total_price += funds
+            if coin_map is None:
+                coin_map = self.get_coin_map()
 
-                avg_price = total_price / total_quantity if total_quantity > 0 else 0
+            exchange_code = ExchangeProvider[exchange_provider.upper()].value
+            order_columns, fill_columns = transform_orders(trading_histies)
 
-                # trade_type을 숫자로 변환
-                trade_type_str = trading_history.get("side", "")
-                if trade_type_str == "bid":
-                    trade_type = 0  # 매수
-                elif trade_type_str == "ask":
-                    trade_type = 1  # 매도
-                else:
-                    trade_type = 0  # 기본값
+            return (
+                self._build_history_rows(
+                    user_id, exchange_code, order_columns, coin_map
+                ),
+                build_fill_rows(TradingFillRow, user_id, exchange_code, fill_columns),
+            )
+        except Exception as e:
+            raise e
 
-                trading_histories = TradingHistories(
-                    user_id=user_id,
-                    coin_id=coin_map[str(trading_history.get("market"))],
-                    exchange_code=exchange_code,
-                    trade_uuid=trading_history.get("uuid"),
-                    trade_type=trade_type,  # 숫자로 변환된 값 사용
-                    price=avg_price,
-                    quantity=total_quantity,
-                    total_price=total_price,
-                    fee=float(trading_history.get("paid_fee", 0)),
-                    trade_time=trading_history.get("created_at"),
-                )
-                trading_history_array.append(trading_histories)
+    def _build_history_rows(
+        self,
+        user_id: str,
+        exchange_code: int,
+        columns: OrderColumns,
+        coin_map: Dict[str, int],
+    ) -> List[TradingHistoryRow]:
+        """주문 열을 저장용 행 튜플로 묶음 (마켓별로 한 번만 코인 id 조회)"""
+        coin_ids_by_market = {
+            market: self._resolve_coin_id(market, coin_map)
+            for market in set(columns.markets)
+        }
+        coin_ids = [coin_ids_by_market[market] for market in columns.markets]
+
+        return build_rows(TradingHistoryRow, user_id, exchange_code, coin_ids, columns)
+
+    def archive_order_payloads(
+        self,
+        user_id: str,
+        exchange_provider: str,
+        trading_histies: List[Dict[str, Any]],
+    ) -> int:
+        """주문 조회 응답 원본 보관 (user, 거래소, 주문 uuid별 최신 응답 하나)
+
+        /v1/orders/uuids 항목이나 /v1/order 응답을 변환하거나 trades를 채우지 않은
+        그대로 보관한다.
+        """
+        try:
+            from dto.exchange_credentials_dto import ExchangeProvider
+
+            if not trading_histies:
+                return 0
+
+            exchange_code = ExchangeProvider[exchange_provider.upper()].value
+            return self.order_payloads_repository.save_payloads(
+                user_id, exchange_code, trading_histies
+            )
+        except Exception as e:
+            raise e
+
+    def reprocess_trading_histories(
+        self,
+        user_id: str,
+        exchange_provider: str,
+        workers: Optional[int] = None,
+        batch_size: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """보관된 주문 원본으로 trading_histories/trading_fills 재구성 (네트워크 사용 안 함)
+
+        원본을 id 구간(batch_size개씩)으로 나눠 프로세스 풀에서 구간마다 변환 → COPY
+        적재한다. 이미 있는 주문은 id를 유지한 채 새 변환 결과로 덮어쓴다.
+        workers가 1 이하면 현재 프로세스에서 차례로 처리한다.
+        """
+        try:
+            from dto.exchange_credentials_dto import ExchangeProvider
+
+            started_at = time.monotonic()
+            workers = workers or TRADING_REPROCESS_WORKERS
+            batch_size = batch_size or TRADING_REPROCESS_BATCH_SIZE
+            exchange_code = ExchangeProvider[exchange_provider.upper()].value
+
+            starts = self.order_payloads_repository.find_range_starts(
+                user_id, exchange_code, batch_size
+            )
+            ranges = list(zip(starts, starts[1:] + [None]))
+            coin_map = self.get_coin_map()
+
+            if workers <= 1 or len(ranges) <= 1:
+                results = [
+                    self._reprocess_payload_range(
+                        user_id, exchange_provider, start_id, end_id, coin_map
+                    )
+                    for start_id, end_id in ranges
+                ]
+            else:
+                with ProcessPoolExecutor(
+                    max_workers=min(workers, len(ranges)),
+                    initializer=_init_reprocess_worker,
+                ) as executor:
+                    futures = [
+                        executor.submit(
+                            _reprocess_payload_range_in_worker,
+                            user_id,
+                            exchange_provider,
+                            start_id,
+                            end_id,
+                            coin_map,
+                        )
+                        for start_id, end_id in ranges
+                    ]
+                    results = [future.result() for future in futures]
+
+            # 워커 프로세스에서 지운 응답 캐시와 별개로 이 프로세스 기준으로도 무효화
+            self._invalidate_response_cache({user_id})
+
+            result = {
+                "order_count": sum(order_count for order_count, _ in results),
+                "saved_count": sum(saved_count for _, saved_count in results),
+                "batch_count": len(ranges),
+                "workers": min(workers, max(len(ranges), 1)),
+                "elapsed_seconds": round(time.monotonic() - started_at, 3),
+            }
+            self.logger.info(f"거래내역 재처리 완료: {result}")
+            return result
+        except Exception as e:
+            raise e
+
+    def _reprocess_payload_range(
+        self,
+        user_id: str,
+        exchange_provider: str,
+        start_id: int,
+        end_id: Optional[int],
+        coin_map: Dict[str, int],
+    ) -> Tuple[int, int]:
+        """원본 구간 하나를 변환해 덮어쓰기 적재, (주문 수, 저장된 행 수) 반환
+
+        trades가 없는 주문 목록 항목은 변환 단계에서 체결 합계로 체결을 만든다.
+        """
+        from dto.exchange_credentials_dto import ExchangeProvider
+
+        exchange_code = ExchangeProvider[exchange_provider.upper()].value
+        trading_histies = [
+            orjson.loads(payload)
+            for payload in self.order_payloads_repository.find_payload_texts(
+                user_id, exchange_code, start_id, end_id
+            )
+        ]
+        saved_count = self.backfill_trading_histories(
+            *self.process_orders(user_id, exchange_provider, trading_histies, coin_map),
+            overwrite=True,
+        )
+        return len(trading_histies), saved_count
+
+    def process_trading_fills(
+        self,
+        user_id: str,
+        exchange_provider: str,
+        trading_histies: List[Dict[str, Any]],
+    ) -> List[TradingFillRow]:
+        """주문 상세 목록의 체결을 trading_fills 적재용 행 튜플로 펼침"""
+        try:
+            from dto.exchange_credentials_dto import ExchangeProvider
 
-            return trading_history_array
+            exchange_code = ExchangeProvider[exchange_provider.upper()].value
+            return build_fill_rows(
+                TradingFillRow, user_id, exchange_code, flatten_fills(trading_histies)
+            )
         except Exception as e:
             raise e
 
     def save_trading_histories(
-        self, trading_histories: List[TradingHistories]
+        self,
+        trading_histories: List[TradingHistoryRow],
+        trading_fills: Optional[List[TradingFillRow]] = None,
     ) -> List[TradingHistories]:
-        """거래내역 목록 저장"""
+        """거래내역 목록 저장 (체결 행이 있으면 같은 트랜잭션에서 함께 저장)"""
         try:
             if not trading_histories:
                 return []
 
             saved_histories = self.trading_repository.save_trading_histories(
-                trading_histories
+                trading_histories, trading_fills
             )
+            if saved_histories:
+                self._invalidate_response_cache(
+                    {history.user_id for history in saved_histories}
+                )
 
             self.logger.info(f"거래내역 저장 완료: {len(saved_histories)}개")
             return saved_histories
@@ -163,6 +616,44 @@ class TradingHistoriesService:
         except Exception as e:
             raise e
 
+    def backfill_trading_histories(
+        self,
+        trading_histories: Iterable[TradingHistoryRow],
+        trading_fills: Optional[Iterable[TradingFillRow]] = None,
+        overwrite: bool = False,
+    ) -> int:
+        """대량 거래내역 초기 적재 (COPY 기반, 저장된 행 수 반환, overwrite면 덮어쓰기)"""
+        try:
+            user_ids = set()
+
+            def track_users():
+                for history in trading_histories:
+                    user_ids.add(history.user_id)
+                    yield history
+
+            saved_count = self.trading_repository.backfill_trading_histories(
+                track_users(), trading_fills, overwrite
+            )
+            if saved_count:
+                self._invalidate_response_cache(user_ids)
+            return saved_count
+        except Exception as e:
+            raise e
+
+    def delete_trading_histories(self, user_id: str, exchange_provider: str) -> bool:
+        """사용자와 거래소별 거래내역 삭제"""
+        try:
+            from dto.exchange_credentials_dto import ExchangeProvider
+
+            exchange_code = ExchangeProvider[exchange_provider.upper()].value
+            deleted = self.trading_repository.delete_by_user_and_exchange(
+                user_id, exchange_code
+            )
+            self._invalidate_response_cache({user_id})
+            return deleted
+        except Exception as e:
+            raise e
+
     def get_all_trading_histories_by_user(self, user_id: str) -> List[TradingHistories]:
         """사용자의 모든 거래내역 조회"""
         try:
@@ -175,56 +666,334 @@ class TradingHistoriesService:
             raise e
 
     def get_all_trading_histories_by_user_formatted(self, user_id: str) -> dict:
-        """사용자의 모든 거래내역을 포맷된 형태로 조회"""
+        """사용자의 모든 거래내역을 포맷된 형태로 조회 (응답 캐시, 저장/삭제 시 무효화)"""
         try:
-            histories = self.trading_repository.find_by_user_id(user_id)
 
-            formatted_histories = []
-            for history in histories:
-                try:
-                    # Decimal을 안전하게 float로 변환
-                    def safe_float(value):
-                        if value is None:
-                            return 0.0
-                        try:
-                            return float(str(value))
-                        except (ValueError, TypeError):
-                            return 0.0
-
-                    formatted_history = {
-                        "id": history.id,
-                        "coin_id": history.coin_id,
-                        "exchange_code": history.exchange_code,
-                        "trade_uuid": str(history.trade_uuid),
-                        "trade_type": history.trade_type,
-                        "price": safe_float(history.price),
-                        "quantity": safe_float(history.quantity),
-                        "total_price": safe_float(history.total_price),
-                        "fee": safe_float(history.fee),
-                        "trade_time": (
-                            history.trade_time.isoformat()
-                            if history.trade_time is not None
-                            else None
-                        ),
-                        "created_at": (
-                            history.created_at.isoformat()
-                            if history.created_at is not None
-                            else None
-                        ),
-                    }
-                    formatted_histories.append(formatted_history)
-                except Exception as e:
-                    self.logger.warning(
-                        f"거래내역 포맷 중 오류 발생 (ID: {history.id}): {e}"
-                    )
-                    continue
+            def build():
+                histories = self.trading_repository.find_rows_by_user_id(user_id)
+                self.logger.info(
+                    f"사용자 {user_id}의 거래내역 조회 완료: {len(histories)}개"
+                )
+                return {
+                    "total_count": len(histories),
+                    "trading_histories": self._format_trading_histories(histories),
+                }
 
-            self.logger.info(
-                f"사용자 {user_id}의 거래내역 조회 완료: {len(histories)}개"
+            return self._get_cached_response(user_id, "all", build)
+        except Exception as e:
+            raise e
+
+    def get_trading_histories_page(
+        self,
+        user_id: str,
+        cursor: Optional[str] = None,  # 이전 응답의 next_cursor
+        limit: Optional[int] = None,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        coin_id: Optional[int] = None,
+        trade_type: Optional[int] = None,
+        exchange_code: Optional[int] = None,
+    ) -> dict:
+        """사용자 거래내역을 체결시간 역순으로 한 페이지씩 조회"""
+        try:
+            limit = min(
+                limit or TRADING_HISTORY_PAGE_SIZE, TRADING_HISTORY_MAX_PAGE_SIZE
+            )
+            cursor_trade_time, cursor_id = (
+                self._decode_page_cursor(cursor) if cursor else (None, None)
+            )
+
+            def build():
+                # 다음 페이지 존재 여부 확인을 위해 한 행 더 조회
+                histories = self.trading_repository.find_page_by_user_id(
+                    user_id,
+                    limit + 1,
+                    cursor_trade_time=cursor_trade_time,
+                    cursor_id=cursor_id,
+                    start_time=start_time,
+                    end_time=end_time,
+                    coin_id=coin_id,
+                    trade_type=trade_type,
+                    exchange_code=exchange_code,
+                )
+                has_next = len(histories) > limit
+                histories = histories[:limit]
+
+                return {
+                    "count": len(histories),
+                    "has_next": has_next,
+                    "next_cursor": (
+                        self._encode_page_cursor(histories[-1]) if has_next else None
+                    ),
+                    "trading_histories": self._format_trading_histories(histories),
+                }
+
+            cache_key = ":".join(
+                str(value)
+                for value in (
+                    "page",
+                    cursor,
+                    limit,
+                    start_time,
+                    end_time,
+                    coin_id,
+                    trade_type,
+                    exchange_code,
+                )
+            )
+            return self._get_cached_response(user_id, cache_key, build)
+        except Exception as e:
+            raise e
+
+    def _get_cached_response(
+        self, user_id: str, key: str, build: Callable[[], dict]
+    ) -> dict:
+        """캐시에 있으면 캐시 결과, 없으면 build() 결과를 저장 후 반환
+
+        캐시 저장소 오류는 조회를 막지 않고 DB 조회로 대신한다.
+        """
+        cache = self.response_cache
+        if cache is None:
+            return build()
+
+        user_id = str(user_id)
+        try:
+            generation = cache.generation(user_id)
+            cached = cache.get(user_id, key, generation)
+            if cached is not None:
+                return orjson.loads(cached)
+        except Exception as e:
+            self.logger.warning(f"응답 캐시 조회 실패: {e}")
+            return build()
+
+        response = build()
+        try:
+            cache.set(user_id, key, orjson.dumps(response), generation)
+        except Exception as e:
+            self.logger.warning(f"응답 캐시 저장 실패: {e}")
+        return response
+
+    def _invalidate_response_cache(self, user_ids: Iterable):
+        """저장/삭제된 사용자의 캐시 무효화 (실패해도 TTL이 지나면 갱신됨)"""
+        cache = self.response_cache
+        if cache is None:
+            return
+        for user_id in user_ids:
+            try:
+                cache.invalidate_user(str(user_id))
+            except Exception as e:
+                self.logger.warning(f"응답 캐시 무효화 실패 ({user_id}): {e}")
+
+    def get_trading_histories_delta(
+        self,
+        user_id: str,
+        sync_cursor: Optional[str] = None,  # 이전 동기화 결과의 sync_cursor
+        limit: Optional[int] = None,
+        include_total_count: bool = False,
+    ) -> dict:
+        """sync_cursor 이후 새로 저장된 거래내역만 조회 (클라이언트 병합용)
+
+        응답의 sync_cursor를 다음 조회에 넘기면 그 뒤의 행만 받는다.
+        has_next가 true면 같은 방식으로 이어서 조회한다.
+        전체 건수는 전체 행을 세야 하므로 include_total_count일 때만 채운다.
+        """
+        try:
+            limit = min(
+                limit or TRADING_SYNC_DELTA_MAX_ROWS, TRADING_HISTORY_MAX_PAGE_SIZE
+            )
+            after_id = self._decode_sync_cursor(sync_cursor) if sync_cursor else 0
+
+            histories = self.trading_repository.find_rows_after_id(
+                user_id, after_id, limit + 1
+            )
+            has_next = len(histories) > limit
+            histories = histories[:limit]
+
+            total_count = (
+                self.trading_repository.count_by_user_id(user_id)
+                if include_total_count
+                else None
             )
+
             return {
-                "total_count": len(histories),
-                "trading_histories": formatted_histories,
+                "total_count": total_count,
+                "count": len(histories),
+                "has_next": has_next,
+                "sync_cursor": self._encode_sync_cursor(
+                    histories[-1].id if histories else after_id
+                ),
+                "trading_histories": self._format_trading_histories(histories),
             }
         except Exception as e:
             raise e
+
+    def get_trading_fill_vwap(
+        self,
+        user_id: str,
+        exchange_code: Optional[int] = None,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+    ) -> List[dict]:
+        """코인/매수매도별 체결 VWAP (trading_fills 집계를 DB에서 계산)"""
+        try:
+            rows = self.trading_fills_repository.find_vwap_by_coin(
+                user_id, exchange_code, start_time, end_time
+            )
+            return [
+                {
+                    "coin_id": row.coin_id,
+                    "trade_type": row.trade_type,
+                    "order_count": row.order_count,
+                    "fill_count": int(row.fill_count),
+                    "quantity": float(row.quantity),
+                    "total_price": float(row.total_price),
+                    "fee": float(row.fee) if row.fee is not None else 0.0,
+                    "vwap_price": (
+                        float(row.vwap_price) if row.vwap_price is not None else 0.0
+                    ),
+                    "first_fill_time": row.first_fill_time.isoformat(),
+                    "last_fill_time": row.last_fill_time.isoformat(),
+                }
+                for row in rows
+            ]
+        except Exception as e:
+            raise e
+
+    def get_trading_fills(self, user_id: str, trading_history_id: int) -> List[dict]:
+        """주문 하나의 체결 목록"""
+        try:
+            rows = self.trading_fills_repository.find_by_trading_history_id(
+                user_id, trading_history_id
+            )
+            return [
+                {
+                    "id": row.id,
+                    "trade_uuid": row.trade_uuid,
+                    "price": float(row.price),
+                    "volume": float(row.volume),
+                    "funds": float(row.funds),
+                    "trade_time": row.trade_time.isoformat(),
+                }
+                for row in rows
+            ]
+        except Exception as e:
+            raise e
+
+    def iter_trading_histories_ndjson(
+        self, user_id: str, **filters
+    ) -> Iterator[bytes]:
+        """사용자 전체 거래내역을 NDJSON(한 줄에 한 행)으로 스트리밍"""
+        for formatted_histories in self._iter_formatted_batches(user_id, **filters):
+            yield b"".join(
+                orjson.dumps(history, option=orjson.OPT_APPEND_NEWLINE)
+                for history in formatted_histories
+            )
+
+    def iter_trading_histories_json_array(
+        self, user_id: str, **filters
+    ) -> Iterator[bytes]:
+        """사용자 전체 거래내역을 JSON 배열로 나눠서 스트리밍"""
+        yield b"["
+        separator = b""
+        for formatted_histories in self._iter_formatted_batches(user_id, **filters):
+            if not formatted_histories:
+                continue
+            # 배열 조각 "[a,b]"에서 괄호를 떼고 이어 붙임
+            yield separator + orjson.dumps(formatted_histories)[1:-1]
+            separator = b","
+        yield b"]"
+
+    def _iter_formatted_batches(
+        self, user_id: str, **filters
+    ) -> Iterator[List[dict]]:
+        batches = self.trading_repository.iter_batches_by_user_id(
+            user_id, TRADING_HISTORY_STREAM_BATCH_SIZE, **filters
+        )
+        for histories in batches:
+            yield self._format_trading_histories(histories)
+
+    def _encode_page_cursor(self, history: TradingHistories) -> str:
+        raw = f"{history.trade_time.isoformat()}|{history.id}"
+        return base64.urlsafe_b64encode(raw.encode()).decode()
+
+    def _decode_page_cursor(self, cursor: str):
+        """next_cursor → (trade_time, id), 형식이 잘못되면 ValueError"""
+        try:
+            raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+            trade_time, history_id = raw.split("|")
+            return datetime.fromisoformat(trade_time), int(history_id)
+        except Exception:
+            raise ValueError("잘못된 페이지 커서입니다")
+
+    def _encode_sync_cursor(self, history_id: int) -> str:
+        return base64.urlsafe_b64encode(f"id|{history_id}".encode()).decode()
+
+    def _decode_sync_cursor(self, sync_cursor: str) -> int:
+        """sync_cursor → 마지막으로 받은 id, 형식이 잘못되면 ValueError"""
+        try:
+            prefix, history_id = (
+                base64.urlsafe_b64decode(sync_cursor.encode()).decode().split("|")
+            )
+            if prefix != "id":
+                raise ValueError(prefix)
+            return int(history_id)
+        except Exception:
+            raise ValueError("잘못된 동기화 커서입니다")
+
+    def _format_trading_histories(self, histories: Iterable) -> List[dict]:
+        """READ_COLUMNS 순서의 조회 행 → 응답 dict (금액/수량은 DB에서 float로 조회, 시간은 ISO 문자열)"""
+        return [
+            {
+                "id": history_id,
+                "coin_id": coin_id,
+                "exchange_code": exchange_code,
+                "trade_uuid": trade_uuid,
+                "trade_type": trade_type,
+                "price": price,
+                "quantity": quantity,
+                "total_price": total_price,
+                "fee": fee if fee is not None else 0.0,
+                "trade_time": trade_time.isoformat(),
+                "created_at": (
+                    created_at.isoformat() if created_at is not None else None
+                ),
+            }
+            for (
+                history_id,
+                coin_id,
+                exchange_code,
+                trade_uuid,
+                trade_type,
+                price,
+                quantity,
+                total_price,
+                fee,
+                trade_time,
+                created_at,
+            ) in histories
+        ]
+
+
+# 재처리 프로세스 풀 워커마다 하나씩 쓰는 서비스
+_reprocess_worker_service = None
+
+
+def _init_reprocess_worker():
+    """재처리 워커 초기화 (부모 프로세스에서 물려받은 DB 커넥션은 쓰지 않고 새로 연결)"""
+    global _reprocess_worker_service
+    from database.database_connection import db
+
+    db.engine.dispose(close=False)
+    _reprocess_worker_service = TradingHistoriesService()
+
+
+def _reprocess_payload_range_in_worker(
+    user_id: str,
+    exchange_provider: str,
+    start_id: int,
+    end_id: Optional[int],
+    coin_map: Dict[str, int],
+) -> Tuple[int, int]:
+    return _reprocess_worker_service._reprocess_payload_range(
+        user_id, exchange_provider, start_id, end_id, coin_map
+    )
@@ -1,78 +1,341 @@
 from dotenv import load_dotenv
-from utils.upbit_http_client import UpbitHttpClient
+from utils.upbit_http_client import UpbitHttpClient, UpbitHttpClientError
+from utils.rate_limiter import get_upbit_rate_limiter
+import asyncio
+import hashlib
 import logging
-from utils.time_utils import get_all_trading_time_ranges, get_current_korea_time
-from datetime import datetime
+import os
+import tempfile
+from utils.time_utils import (
+    AdaptiveTimeWindowScanner,
+    format_iso8601,
+    get_current_korea_time,
+    split_time_range_into,
+)
+from datetime import datetime, timedelta
 import pytz
 import time
 from utils.http_client import Http_client
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, AsyncIterator
+from concurrent.futures import ThreadPoolExecutor
 
 load_dotenv()
 
+# 주문 상세 조회 동시 작업자 수
+UPBIT_ORDER_DETAIL_WORKERS = int(os.getenv("UPBIT_ORDER_DETAIL_WORKERS", "8"))
+# 429 응답 시 재시도 횟수
+UPBIT_TOO_MANY_REQUESTS_RETRIES = 3
+# /v1/orders/uuids 한 번에 조회 가능한 최대 uuid 수
+UPBIT_ORDERS_UUIDS_BATCH_SIZE = 100
+# /v1/orders/closed 한 번에 조회 가능한 최대 주문 수
+UPBIT_CLOSED_ORDERS_LIMIT = 1000
+# /v1/orders/closed 조회 구간 폭 (업비트는 최대 7일까지 허용)
+UPBIT_CLOSED_ORDERS_MAX_WINDOW_DAYS = int(
+    os.getenv("UPBIT_CLOSED_ORDERS_MAX_WINDOW_DAYS", "7")
+)
+UPBIT_CLOSED_ORDERS_MIN_WINDOW_MINUTES = int(
+    os.getenv("UPBIT_CLOSED_ORDERS_MIN_WINDOW_MINUTES", "60")
+)
+# 주문 목록 동시 조회 구간 수
+UPBIT_WINDOW_SCAN_PARALLELISM = int(os.getenv("UPBIT_WINDOW_SCAN_PARALLELISM", "4"))
+# 코인 로고 다운로드 설정
+UPBIT_LOGO_BASE_URL = os.getenv("UPBIT_LOGO_BASE_URL", "https://static.upbit.com/logos/")
+UPBIT_LOGO_DIR = os.getenv("UPBIT_LOGO_DIR", "../../data/image")
+UPBIT_LOGO_DOWNLOAD_WORKERS = int(os.getenv("UPBIT_LOGO_DOWNLOAD_WORKERS", "8"))
+# 코인 로고 동기화 상태 이름 (심볼별 ETag, 내용 해시)
+COIN_LOGO_SYNC_STATE = "coin_logos"
+
 
 class UpbitService:
-    def __init__(self):
-        self.upbit_http_client = UpbitHttpClient()
+    def __init__(
+        self,
+        upbit_http_client: Optional[UpbitHttpClient] = None,
+        async_upbit_http_client: Optional[Any] = None,
+    ):
+        self.upbit_http_client = upbit_http_client or UpbitHttpClient(
+            pool_maxsize=UPBIT_ORDER_DETAIL_WORKERS
+        )
+        self._async_upbit_http_client = async_upbit_http_client  # lazy loading
+        self._logo_http_client = None
+        self._sync_state_store = None
         self.logger = logging.getLogger(__name__)
 
-    def fetch_all_trading_uuids(
-        self, access_key: str, secret_key: str, start_time: Optional[datetime] = None
+    @property
+    def async_upbit_http_client(self):
+        if self._async_upbit_http_client is None:
+            from utils.async_upbit_http_client import get_async_upbit_http_client
+
+            self._async_upbit_http_client = get_async_upbit_http_client()
+        return self._async_upbit_http_client
+
+    @property
+    def logo_http_client(self) -> Http_client:
+        if self._logo_http_client is None:
+            self._logo_http_client = Http_client(
+                UPBIT_LOGO_BASE_URL, pool_maxsize=UPBIT_LOGO_DOWNLOAD_WORKERS
+            )
+        return self._logo_http_client
+
+    @property
+    def sync_state_store(self):
+        if self._sync_state_store is None:
+            from dependencies import get_sync_state_store
+
+            self._sync_state_store = get_sync_state_store()
+        return self._sync_state_store
+
+    def _get_with_retry(
+        self, endpoint: str, access_key: str, secret_key: str, params: dict
     ):
-        try:
-            # start_time이 None이면 기본값 사용
-            if start_time is None:
-                first_time = datetime(2017, 11, 1, tzinfo=pytz.timezone("Asia/Seoul"))
+        """인증 GET 요청 (429 응답은 1초 뒤 재시도)"""
+        for attempt in range(UPBIT_TOO_MANY_REQUESTS_RETRIES + 1):
+            try:
+                return self.upbit_http_client.get(
+                    endpoint, access_key, secret_key, params, True
+                )
+            except UpbitHttpClientError as e:
+                if e.status_code != 429 or attempt == UPBIT_TOO_MANY_REQUESTS_RETRIES:
+                    raise
+                time.sleep(1)
+
+    async def _get_with_retry_async(
+        self, endpoint: str, access_key: str, secret_key: str, params: dict
+    ):
+        """_get_with_retry의 비동기 버전"""
+        for attempt in range(UPBIT_TOO_MANY_REQUESTS_RETRIES + 1):
+            try:
+                return await self.async_upbit_http_client.get(
+                    endpoint, access_key, secret_key, params, True
+                )
+            except UpbitHttpClientError as e:
+                if e.status_code != 429 or attempt == UPBIT_TOO_MANY_REQUESTS_RETRIES:
+                    raise
+                await asyncio.sleep(1)
+
+    def _create_window_scanners(
+        self, start_time: Optional[datetime] = None, parallelism: int = 1
+    ) -> List[AdaptiveTimeWindowScanner]:
+        """체결 주문 조회 구간 생성기 (기간을 parallelism개 구간으로 나눠 각각 생성)"""
+        # start_time이 None이면 기본값 사용
+        if start_time is None:
+            first_time = datetime(2017, 11, 1, tzinfo=pytz.timezone("Asia/Seoul"))
+        else:
+            # start_time이 타임존 정보가 없으면 한국 시간으로 설정
+            if start_time.tzinfo is None:
+                first_time = pytz.timezone("Asia/Seoul").localize(start_time)
             else:
-                # start_time이 타임존 정보가 없으면 한국 시간으로 설정
-                if start_time.tzinfo is None:
-                    first_time = pytz.timezone("Asia/Seoul").localize(start_time)
-                else:
-                    first_time = start_time
+                first_time = start_time
 
-            current_time = get_current_korea_time()
-            time_ranges = get_all_trading_time_ranges(first_time, current_time)
+        current_time = get_current_korea_time()
+        max_width = timedelta(days=UPBIT_CLOSED_ORDERS_MAX_WINDOW_DAYS)
+        return [
+            AdaptiveTimeWindowScanner(
+                segment_start,
+                segment_end,
+                limit=UPBIT_CLOSED_ORDERS_LIMIT,
+                max_width=max_width,
+                min_width=timedelta(minutes=UPBIT_CLOSED_ORDERS_MIN_WINDOW_MINUTES),
+            )
+            for segment_start, segment_end in split_time_range_into(
+                first_time, current_time, parallelism, min_span=max_width
+            )
+        ]
 
-            all_uuids = []
+    def _completed_scan_end(
+        self, scanners: List[AdaptiveTimeWindowScanner]
+    ) -> Optional[datetime]:
+        """처음부터 빈틈없이 조회를 마친 마지막 시각 (체크포인트용)"""
+        completed_end = None
+        for scanner in scanners:
+            if scanner.window_count == 0:
+                break
+            completed_end = scanner.completed_window_end
+            if not scanner.is_done:
+                break
+        return completed_end
 
-            for i, (range_start, range_end) in enumerate(time_ranges):
-                params = {
-                    "states[]": ["done", "cancel"],
-                    "start_time": range_start,
-                    "end_time": range_end,
-                    "limit": 1000,
-                }
+    def _get_closed_orders_params(self, range_start: str, range_end: str) -> dict:
+        return {
+            "states[]": ["done", "cancel"],
+            "start_time": range_start,
+            "end_time": range_end,
+            "limit": UPBIT_CLOSED_ORDERS_LIMIT,
+        }
 
-                response = self.upbit_http_client.get(
-                    "/v1/orders/closed", access_key, secret_key, params, True
-                )
+    def _extract_trading_uuids(self, response) -> List[str]:
+        """체결 주문 목록에서 체결량이 있는 주문의 uuid 추출"""
+        uuids = []
+        for r in response or []:
+            if isinstance(r, dict) and r.get("executed_volume") == "0":
+                continue
 
-                if response is None:
-                    continue
+            if isinstance(r, dict) and r.get("uuid"):
+                uuids.append(r.get("uuid"))
+        return uuids
+
+    def _record_closed_orders(
+        self,
+        scanner: AdaptiveTimeWindowScanner,
+        response,
+        window_uuids: Dict[str, None],
+    ) -> bool:
+        """주문 목록 응답을 구간 uuid에 병합하고, 구간 조회가 끝났으면 True 반환"""
+        # 페이지 경계의 주문이 다시 내려올 수 있으므로 순서를 유지하며 중복 제거
+        for uuid in self._extract_trading_uuids(response):
+            window_uuids.setdefault(uuid, None)
+
+        created_ats = [
+            r.get("created_at")
+            for r in response or []
+            if isinstance(r, dict) and r.get("created_at")
+        ]
+        return scanner.record(created_ats)
+
+    def _log_window_scan(
+        self, scanners: List[AdaptiveTimeWindowScanner], uuid_count: int
+    ):
+        self.logger.info(
+            f"주문 목록 조회 완료: 구간 {sum(s.window_count for s in scanners)}개, "
+            f"요청 {sum(s.request_count for s in scanners)}회, "
+            f"uuid {uuid_count}개 (병렬 {len(scanners)})"
+        )
 
-                for r in response:
-                    if isinstance(r, dict) and r.get("executed_volume") == "0":
-                        continue
+    def _scan_window_segment(
+        self, access_key: str, secret_key: str, scanner: AdaptiveTimeWindowScanner
+    ) -> List[str]:
+        all_uuids = []
+        window_uuids: Dict[str, None] = {}
 
-                    if isinstance(r, dict) and r.get("uuid"):
-                        all_uuids.append(r.get("uuid"))
+        while (time_range := scanner.next_window()) is not None:
+            params = self._get_closed_orders_params(*time_range)
 
-                if (i + 1) % 5 == 0:
-                    time.sleep(1)
+            response = self._get_with_retry(
+                "/v1/orders/closed", access_key, secret_key, params
+            )
 
+            if self._record_closed_orders(scanner, response, window_uuids):
+                all_uuids.extend(window_uuids)
+                window_uuids = {}
+
+        return all_uuids
+
+    def fetch_all_trading_uuids(
+        self,
+        access_key: str,
+        secret_key: str,
+        start_time: Optional[datetime] = None,
+        parallelism: Optional[int] = None,  # 기본값 UPBIT_WINDOW_SCAN_PARALLELISM
+    ):
+        try:
+            scanners = self._create_window_scanners(
+                start_time, parallelism or UPBIT_WINDOW_SCAN_PARALLELISM
+            )
+
+            # 구간별 조회는 서로 독립적이므로 동시에 실행 (요청 한도는 rate limiter가 관리)
+            with ThreadPoolExecutor(max_workers=max(1, len(scanners))) as executor:
+                segment_uuids = list(
+                    executor.map(
+                        lambda scanner: self._scan_window_segment(
+                            access_key, secret_key, scanner
+                        ),
+                        scanners,
+                    )
+                )
+
+            # 구간 경계의 중복을 제거하며 시간 구간 순서대로 병합
+            all_uuids = list(
+                dict.fromkeys(uuid for uuids in segment_uuids for uuid in uuids)
+            )
+
+            self._log_window_scan(scanners, len(all_uuids))
             return all_uuids
         except Exception as e:
             raise e
 
+    async def iter_trading_uuids_async(
+        self,
+        access_key: str,
+        secret_key: str,
+        start_time: Optional[datetime] = None,
+        progress: Optional[Any] = None,  # utils.job_queue.JobProgress
+        parallelism: Optional[int] = None,  # 기본값 UPBIT_WINDOW_SCAN_PARALLELISM
+    ) -> AsyncIterator[Tuple[Optional[str], List[str]]]:
+        """구간 조회가 끝날 때마다 (연속 완료 시각, 새로 찾은 uuid 목록)을 yield
+
+        구간들은 백그라운드 task에서 동시에 조회되므로, 호출 측이 받은 uuid로
+        주문 상세를 조회하는 동안에도 주문 목록 조회는 계속 진행된다.
+        연속 완료 시각은 처음부터 빈틈없이 조회를 마친 시각으로, 아직 없으면 None.
+        """
+        scanners = self._create_window_scanners(
+            start_time, parallelism or UPBIT_WINDOW_SCAN_PARALLELISM
+        )
+        queue: asyncio.Queue = asyncio.Queue()
+        seen_uuids = set()
+        total_uuid_count = 0
+
+        async def scan_segment(scanner: AdaptiveTimeWindowScanner):
+            window_uuids: Dict[str, None] = {}
+            while (time_range := scanner.next_window()) is not None:
+                params = self._get_closed_orders_params(*time_range)
+
+                response = await self._get_with_retry_async(
+                    "/v1/orders/closed", access_key, secret_key, params
+                )
+
+                if self._record_closed_orders(scanner, response, window_uuids):
+                    # 완료 시각은 큐에 넣는 시점에 계산해야 호출 측이 받은 구간과 일치함
+                    await queue.put(
+                        (self._completed_scan_end(scanners), list(window_uuids))
+                    )
+                    window_uuids = {}
+
+        async def run_segment(scanner: AdaptiveTimeWindowScanner):
+            try:
+                await scan_segment(scanner)
+            except Exception as e:
+                await queue.put(e)
+            finally:
+                await queue.put(None)
+
+        tasks = [asyncio.create_task(run_segment(scanner)) for scanner in scanners]
+        running_count = len(tasks)
+
+        try:
+            while running_count > 0:
+                item = await queue.get()
+                if item is None:
+                    running_count -= 1
+                    continue
+                if isinstance(item, Exception):
+                    raise item
+
+                # 여러 구간의 결과를 도착 순서대로 병합하며 중복 제거
+                completed_end, uuids = item
+                new_uuids = [uuid for uuid in uuids if uuid not in seen_uuids]
+                seen_uuids.update(new_uuids)
+                total_uuid_count += len(new_uuids)
+
+                if progress is not None:
+                    await progress.increment(
+                        windows_scanned=1, uuids_found=len(new_uuids)
+                    )
+
+                yield (
+                    format_iso8601(completed_end) if completed_end else None,
+                    new_uuids,
+                )
+
+            self._log_window_scan(scanners, total_uuid_count)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
     def fetch_all_trading_history(self, access_key: str, secret_key: str, uuids: list):
         try:
             trading_histories = []
 
-            time.sleep(1)
-            for i, uuid in enumerate(uuids):
-                if (i + 1) % 5 == 0:
-                    time.sleep(1)
-
+            for uuid in uuids:
                 params = {"uuid": uuid}
                 response = self.upbit_http_client.get(
                     "/v1/order", access_key, secret_key, params, True
@@ -88,29 +351,213 @@ class UpbitService:
         except Exception as e:
             raise e
 
-    def fetch_all_coin_list(self) -> Any:
+    def fetch_all_trading_history_concurrent(
+        self,
+        access_key: str,
+        secret_key: str,
+        uuids: list,
+        max_workers: int = UPBIT_ORDER_DETAIL_WORKERS,
+    ):
+        """주문 상세를 작업자 풀로 동시에 조회 (결과는 uuids 순서 유지)"""
         try:
-            base_url = "https://crix-static.upbit.com/crix_master"
-
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/138.0.0.0 Safari/537.36",
-                "Accept": "application/json, text/plain, */*",
-                "Accept-Language": "ko-KR,ko;q=0.9,en;q=0.8",
-                "Accept-Encoding": "gzip, deflate, br",
-                "Origin": "https://upbit.com",
-                "Referer": "https://upbit.com/",
-                "Connection": "keep-alive",
-                "Sec-Fetch-Dest": "empty",
-                "Sec-Fetch-Mode": "cors",
-                "Sec-Fetch-Site": "cross-site",
-            }
+            if not uuids:
+                return []
+
+            started_at = time.monotonic()
+
+            def fetch_order(uuid: str):
+                # 요청 간격은 upbit_http_client의 요청 제한기가 조절
+                return self._get_with_retry(
+                    "/v1/order", access_key, secret_key, {"uuid": uuid}
+                )
+
+            with ThreadPoolExecutor(
+                max_workers=min(max_workers, len(uuids)),
+                thread_name_prefix="upbit-order",
+            ) as executor:
+                # map은 입력 순서대로 결과를 돌려주므로 uuid 순서가 유지됨
+                responses = list(executor.map(fetch_order, uuids))
+
+            trading_histories = [
+                response for response in responses if response is not None
+            ]
+            self._log_throughput(len(trading_histories), len(uuids), started_at)
+
+            return trading_histories
+
+        except Exception as e:
+            raise e
+
+    async def fetch_all_trading_history_concurrent_async(
+        self,
+        access_key: str,
+        secret_key: str,
+        uuids: list,
+        max_concurrency: int = UPBIT_ORDER_DETAIL_WORKERS,
+    ):
+        """fetch_all_trading_history_concurrent의 비동기 버전 (결과는 uuids 순서 유지)"""
+        try:
+            if not uuids:
+                return []
+
+            started_at = time.monotonic()
+            semaphore = asyncio.Semaphore(max_concurrency)
+
+            async def fetch_order(uuid: str):
+                async with semaphore:
+                    return await self._get_with_retry_async(
+                        "/v1/order", access_key, secret_key, {"uuid": uuid}
+                    )
+
+            # gather는 입력 순서대로 결과를 돌려주므로 uuid 순서가 유지됨
+            responses = await asyncio.gather(*(fetch_order(uuid) for uuid in uuids))
+
+            trading_histories = [
+                response for response in responses if response is not None
+            ]
+            self._log_throughput(len(trading_histories), len(uuids), started_at)
 
-            client = Http_client(base_url, headers)
+            return trading_histories
+
+        except Exception as e:
+            raise e
+
+    def _log_throughput(self, fetched_count: int, total_count: int, started_at: float):
+        elapsed = time.monotonic() - started_at
+        throughput = total_count / elapsed if elapsed > 0 else 0.0
+        self.logger.info(
+            f"주문 상세 동시 조회 완료: {fetched_count}/{total_count}개, "
+            f"{elapsed:.2f}초, {throughput:.1f} req/s"
+        )
+
+    def fetch_all_trading_history_batched(
+        self, access_key: str, secret_key: str, uuids: list
+    ):
+        """/v1/orders/uuids로 주문 상세를 100개씩 묶어서 조회 (결과는 uuids 순서 유지)
+
+        결과는 거래소 응답 원본이다. 주문 목록 항목에는 trades가 없으므로
+        utils.order_transform.order_trades로 체결 목록을 얻는다.
+        """
+        try:
+            orders_by_uuid = {}
+
+            for chunk in self._chunk_uuids(uuids):
+                params = {"uuids[]": chunk, "order_by": "asc"}
+                response = self._get_with_retry(
+                    "/v1/orders/uuids", access_key, secret_key, params
+                )
+                self._merge_batched_orders(response, orders_by_uuid)
+
+            # 체결 금액이 없거나 여러 번 체결된 주문은 단건 조회(개별 체결 포함)로 보완
+            missing_uuids = [uuid for uuid in uuids if uuid not in orders_by_uuid]
+            if missing_uuids:
+                for order in self.fetch_all_trading_history_concurrent(
+                    access_key, secret_key, missing_uuids
+                ):
+                    orders_by_uuid[order.get("uuid")] = order
+
+            return self._order_by_uuids(uuids, orders_by_uuid, len(missing_uuids))
+
+        except Exception as e:
+            raise e
+
+    async def fetch_all_trading_history_batched_async(
+        self,
+        access_key: str,
+        secret_key: str,
+        uuids: list,
+        progress: Optional[Any] = None,  # utils.job_queue.JobProgress
+    ):
+        """fetch_all_trading_history_batched의 비동기 버전"""
+        try:
+            orders_by_uuid = {}
+
+            async def fetch_chunk(chunk: list):
+                params = {"uuids[]": chunk, "order_by": "asc"}
+                response = await self._get_with_retry_async(
+                    "/v1/orders/uuids", access_key, secret_key, params
+                )
+                fetched_count = self._merge_batched_orders(response, orders_by_uuid)
+                if progress is not None:
+                    await progress.increment(orders_fetched=fetched_count)
+
+            await asyncio.gather(
+                *(fetch_chunk(chunk) for chunk in self._chunk_uuids(uuids))
+            )
+
+            # 체결 금액이 없거나 여러 번 체결된 주문은 단건 조회(개별 체결 포함)로 보완
+            missing_uuids = [uuid for uuid in uuids if uuid not in orders_by_uuid]
+            if missing_uuids:
+                fallback_orders = await self.fetch_all_trading_history_concurrent_async(
+                    access_key, secret_key, missing_uuids
+                )
+                for order in fallback_orders:
+                    orders_by_uuid[order.get("uuid")] = order
+                if progress is not None:
+                    await progress.increment(orders_fetched=len(fallback_orders))
+
+            return self._order_by_uuids(uuids, orders_by_uuid, len(missing_uuids))
+
+        except Exception as e:
+            raise e
+
+    def _chunk_uuids(self, uuids: list) -> List[list]:
+        return [
+            uuids[i : i + UPBIT_ORDERS_UUIDS_BATCH_SIZE]
+            for i in range(0, len(uuids), UPBIT_ORDERS_UUIDS_BATCH_SIZE)
+        ]
+
+    def _merge_batched_orders(self, response, orders_by_uuid: Dict[str, Any]) -> int:
+        """주문 목록 응답 중 체결 합계로 변환할 수 있는 주문을 원본 그대로 병합 (병합한 개수 반환)
+
+        trades는 만들지 않고 변환 단계(utils.order_transform.order_trades)에서 채우므로
+        보관되는 원본은 거래소 응답 그대로다. 체결 금액이 없는 주문과 여러 번 체결된
+        주문은 병합하지 않고 /v1/order로 다시 조회한다 (합계로 체결 하나를 만들면
+        개별 체결가/시간이 사라짐).
+        """
+        merged_count = 0
+        for order in response or []:
+            if order.get("executed_volume") is None or order.get("executed_funds") is None:
+                continue
+            if int(order.get("trades_count") or 0) > 1:
+                continue
+            orders_by_uuid[order.get("uuid")] = order
+            merged_count += 1
+        return merged_count
+
+    def _order_by_uuids(
+        self, uuids: list, orders_by_uuid: Dict[str, Any], fallback_count: int
+    ) -> List[Dict[str, Any]]:
+        self.logger.info(
+            f"주문 상세 일괄 조회 완료: {len(orders_by_uuid)}/{len(uuids)}개 "
+            f"(단건 보완 {fallback_count}개)"
+        )
+        return [orders_by_uuid[uuid] for uuid in uuids if uuid in orders_by_uuid]
+
+    def _crix_master_client(self) -> Http_client:
+        base_url = "https://crix-static.upbit.com/crix_master"
+
+        headers = {
+            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/138.0.0.0 Safari/537.36",
+            "Accept": "application/json, text/plain, */*",
+            "Accept-Language": "ko-KR,ko;q=0.9,en;q=0.8",
+            "Accept-Encoding": "gzip, deflate, br",
+            "Origin": "https://upbit.com",
+            "Referer": "https://upbit.com/",
+            "Connection": "keep-alive",
+            "Sec-Fetch-Dest": "empty",
+            "Sec-Fetch-Mode": "cors",
+            "Sec-Fetch-Site": "cross-site",
+        }
+
+        return Http_client(base_url, headers)
+
+    def fetch_all_coin_list(self) -> Any:
+        try:
+            client = self._crix_master_client()
             response = client.get_with_nonce()
 
             if response:
-                # self.download_image(response, "https://static.upbit.com/logos/", "data/image/")
-
                 return response
             else:
                 self.logger.error("코인 목록 가져오기 실패")
@@ -120,16 +567,149 @@ class UpbitService:
             self.logger.error(f"코인 목록 가져오기 중 에러 발생: {e}")
             raise e
 
-    def download_image(self, coin_list: List[Dict[Any, Any]], url: str, save_path: str):
+    def fetch_coin_master_if_modified(
+        self, etag: Optional[str] = None, last_modified: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """코인 목록 조건부 조회
+
+        이전 응답의 ETag / Last-Modified를 보내고, 바뀌지 않았으면(304)
+        content 없이 not_modified=True를 반환한다. 본문은 파싱하지 않는다.
+        """
         try:
-            client = Http_client(url)
-            for i, r in enumerate(coin_list):
-                if i % 5 == 0:
-                    time.sleep(1)
-
-                symbol = r.get("baseCurrencyCode")
-                url = f"https://static.upbit.com/logos/{symbol}.png"
-                client.download_image(url, f"../../data/image/{symbol}.png")
-            self.logger.info(f"이미지 다운로드 완료: {len(coin_list)}개")
+            response = self._crix_master_client().get_if_modified(etag, last_modified)
+            not_modified = response.status_code == 304
+
+            return {
+                "not_modified": not_modified,
+                "content": None if not_modified else response.content,
+                "etag": response.headers.get("ETag", etag),
+                "last_modified": response.headers.get("Last-Modified", last_modified),
+            }
+        except Exception as e:
+            raise e
+
+    def sync_coin_logos(
+        self,
+        symbols: List[str],
+        image_dir: str = UPBIT_LOGO_DIR,
+        max_workers: int = UPBIT_LOGO_DOWNLOAD_WORKERS,
+    ) -> Dict[str, Any]:
+        """코인 로고 동시 다운로드 (바뀐 로고만)
+
+        심볼별로 지난 ETag를 보내 304면 건너뛰고, 받은 내용의 해시가 기존
+        파일과 같으면 쓰지 않는다. 파일은 임시 파일에 쓴 뒤 교체한다.
+        요청 한도는 rate limiter의 static 그룹이 관리한다.
+        """
+        try:
+            started_at = time.monotonic()
+            os.makedirs(image_dir, exist_ok=True)
+            rate_limiter = get_upbit_rate_limiter()
+            state = self.sync_state_store.get(COIN_LOGO_SYNC_STATE)
+            symbols = list(dict.fromkeys(symbol for symbol in symbols if symbol))
+
+            def sync_logo(symbol: str):
+                rate_limiter.acquire("static")
+                return self._sync_coin_logo(symbol, image_dir, state.get(symbol, {}))
+
+            results = []
+            if symbols:
+                with ThreadPoolExecutor(
+                    max_workers=min(max_workers, len(symbols)),
+                    thread_name_prefix="upbit-logo",
+                ) as executor:
+                    results = list(executor.map(sync_logo, symbols))
+
+            counts = {"downloaded": 0, "not_modified": 0, "unchanged": 0, "failed": 0}
+            next_state = dict(state)
+            bytes_downloaded = bytes_saved = 0
+            sequential_seconds = 0.0
+            for symbol, status, entry, elapsed in results:
+                counts[status] += 1
+                sequential_seconds += elapsed
+                if status == "failed":
+                    continue
+                next_state[symbol] = entry
+                if status == "not_modified":
+                    bytes_saved += entry.get("size", 0)
+                else:
+                    bytes_downloaded += entry["size"]
+
+            self.sync_state_store.save(COIN_LOGO_SYNC_STATE, next_state)
+
+            elapsed_seconds = time.monotonic() - started_at
+            summary = {
+                **counts,
+                "total": len(symbols),
+                "bytes_downloaded": bytes_downloaded,
+                # 304로 다시 받지 않은 로고 크기
+                "bytes_saved": bytes_saved,
+                "elapsed_seconds": round(elapsed_seconds, 3),
+                # 같은 요청을 하나씩 보냈을 때 대비 줄어든 시간
+                "time_saved_seconds": round(
+                    max(0.0, sequential_seconds - elapsed_seconds), 3
+                ),
+            }
+            self.logger.info(f"코인 로고 동기화 완료: {summary}")
+            return summary
         except Exception as e:
             raise e
+
+    def _sync_coin_logo(
+        self, symbol: str, image_dir: str, previous: Dict[str, Any]
+    ) -> Tuple[str, str, Dict[str, Any], float]:
+        """로고 하나 동기화 → (심볼, 결과, 상태, 걸린 시간)"""
+        started_at = time.monotonic()
+        save_path = os.path.join(image_dir, f"{symbol}.png")
+        # 파일이 없으면 조건 없이 다시 받음
+        has_file = os.path.exists(save_path)
+
+        try:
+            response = self.logo_http_client.fetch_if_modified(
+                f"{self.logo_http_client.base_url.rstrip('/')}/{symbol}.png",
+                previous.get("etag") if has_file else None,
+                previous.get("last_modified") if has_file else None,
+            )
+
+            if response.status_code == 304:
+                return symbol, "not_modified", previous, time.monotonic() - started_at
+
+            content = response.content
+            entry = {
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "content_hash": hashlib.sha256(content).hexdigest(),
+                "size": len(content),
+            }
+
+            if has_file and entry["content_hash"] == self._existing_logo_hash(
+                save_path, previous
+            ):
+                status = "unchanged"
+            else:
+                self._write_file_atomic(save_path, content)
+                status = "downloaded"
+
+            return symbol, status, entry, time.monotonic() - started_at
+        except Exception as e:
+            self.logger.error(f"로고 다운로드 실패 ({symbol}): {e}")
+            return symbol, "failed", previous, time.monotonic() - started_at
+
+    def _existing_logo_hash(self, save_path: str, previous: Dict[str, Any]) -> str:
+        """저장된 해시, 없으면 (이전 방식으로 받은 파일) 파일 내용의 해시"""
+        if previous.get("content_hash"):
+            return previous["content_hash"]
+        with open(save_path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+
+    def _write_file_atomic(self, save_path: str, content: bytes):
+        """임시 파일에 쓴 뒤 교체 (읽는 쪽에서 쓰다 만 파일이 보이지 않음)"""
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(save_path) or ".", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(content)
+            os.replace(tmp_path, save_path)
+        except Exception:
+            os.unlink(tmp_path)
+            raise
@@ -0,0 +1,203 @@
+import json
+import hashlib
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+from utils.time_utils import parse_iso8601
+
+
+def make_order(
+    uuid: str,
+    market: str = "KRW-BTC",
+    side: str = "bid",
+    created_at: str = "2024-01-01T09:00:00+09:00",
+    trades: list = None,
+) -> dict:
+    """테스트용 업비트 주문 상세 응답 생성"""
+    if trades is None:
+        trades = [{"volume": "0.5", "funds": "25000000.0"}]
+
+    return {
+        "uuid": uuid,
+        "side": side,
+        "market": market,
+        "state": "done",
+        "created_at": created_at,
+        "executed_volume": str(sum(float(t["volume"]) for t in trades)),
+        "paid_fee": "12500.0",
+        "trades": trades,
+    }
+
+
+class FakeUpbitServer:
+    """업비트 거래소 API 요청 한도를 흉내 내는 로컬 서버"""
+
+    def __init__(
+        self,
+        orders: dict = None,
+        requests_per_second: int = 30,
+        logos: dict = None,
+    ):
+        self.orders = orders or {}
+        # 심볼 → 로고 이미지 bytes (ETag / If-None-Match 지원)
+        self.logos = logos or {}
+        self.logo_bytes_sent = 0
+        self.requests_per_second = requests_per_second
+        self.request_count = 0
+        self.rejected_count = 0
+        self._window = None
+        self._window_count = 0
+        self._lock = threading.Lock()
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server._handle(self)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def _consume(self):
+        """초 단위 고정 윈도우로 요청 수를 세고 남은 요청 수를 반환 (초과 시 None)"""
+        with self._lock:
+            self.request_count += 1
+            window = int(time.time())
+            if window != self._window:
+                self._window = window
+                self._window_count = 0
+
+            if self._window_count >= self.requests_per_second:
+                self.rejected_count += 1
+                return None
+
+            self._window_count += 1
+            return self.requests_per_second - self._window_count
+
+    def _send_json(self, handler, status: int, body, remaining: int = 0):
+        payload = json.dumps(body).encode("utf-8")
+        handler.send_response(status)
+        handler.send_header("Content-Type", "application/json; charset=utf-8")
+        handler.send_header("Content-Length", str(len(payload)))
+        handler.send_header(
+            "Remaining-Req", f"group=default; min=1800; sec={remaining}"
+        )
+        handler.end_headers()
+        handler.wfile.write(payload)
+
+    def _handle(self, handler):
+        remaining = self._consume()
+        if remaining is None:
+            self._send_json(
+                handler,
+                429,
+                {"error": {"name": "too_many_requests", "message": "Too many requests"}},
+            )
+            return
+
+        parsed = urlparse(handler.path)
+        query = parse_qs(parsed.query)
+
+        if parsed.path == "/v1/order":
+            order = self.orders.get(query.get("uuid", [""])[0])
+            if order is None:
+                self._send_json(
+                    handler,
+                    404,
+                    {"error": {"name": "order_not_found", "message": "Not found"}},
+                    remaining,
+                )
+                return
+            self._send_json(handler, 200, order, remaining)
+            return
+
+        if parsed.path.startswith("/logos/"):
+            self._send_logo(handler, parsed.path[len("/logos/") :])
+            return
+
+        if parsed.path == "/v1/orders/uuids":
+            uuids = query.get("uuids[]", [])
+            if len(uuids) > 100:
+                self._send_json(
+                    handler,
+                    400,
+                    {"error": {"name": "validation_error", "message": "too many uuids"}},
+                    remaining,
+                )
+                return
+            orders = [
+                self._to_list_item(self.orders[uuid])
+                for uuid in uuids
+                if uuid in self.orders
+            ]
+            self._send_json(handler, 200, orders, remaining)
+            return
+
+        if parsed.path == "/v1/orders/closed":
+            start_time = parse_iso8601(query["start_time"][0])
+            end_time = parse_iso8601(query["end_time"][0])
+            limit = int(query.get("limit", ["100"])[0])
+            orders = sorted(
+                (
+                    self._to_list_item(order)
+                    for order in self.orders.values()
+                    if start_time <= parse_iso8601(order["created_at"]) <= end_time
+                ),
+                key=lambda order: order["created_at"],
+                reverse=True,
+            )
+            self._send_json(handler, 200, orders[:limit], remaining)
+            return
+
+        self._send_json(
+            handler, 404, {"error": {"name": "not_found", "message": parsed.path}}
+        )
+
+    def _send_logo(self, handler, file_name: str):
+        content = self.logos.get(file_name.rsplit(".", 1)[0])
+        if content is None:
+            self._send_json(handler, 404, {"error": {"name": "not_found"}})
+            return
+
+        etag = f'"{hashlib.md5(content).hexdigest()}"'
+        if handler.headers.get("If-None-Match") == etag:
+            handler.send_response(304)
+            handler.send_header("ETag", etag)
+            handler.end_headers()
+            return
+
+        with self._lock:
+            self.logo_bytes_sent += len(content)
+        handler.send_response(200)
+        handler.send_header("Content-Type", "image/png")
+        handler.send_header("Content-Length", str(len(content)))
+        handler.send_header("ETag", etag)
+        handler.end_headers()
+        handler.wfile.write(content)
+
+    def _to_list_item(self, order: dict) -> dict:
+        """주문 목록 응답 형태로 변환 (trades 없이 체결 합계만 포함)"""
+        item = {key: value for key, value in order.items() if key != "trades"}
+        if "executed_funds" not in item:
+            item["executed_funds"] = str(
+                sum(float(t["funds"]) for t in order.get("trades", []))
+            )
+        item["trades_count"] = len(order.get("trades", []))
+        return item
@@ -0,0 +1,134 @@
+import pytest
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+from sqlalchemy.dialects import postgresql
+from model.Coins import Coins
+from repository.coin_repository import CoinRepository
+from utils.coin_registry import CoinRegistry
+
+
+def make_coin(coin_id, market_code):
+    symbol = market_code.split("-")[1]
+    return SimpleNamespace(id=coin_id, symbol=symbol, market_code=market_code)
+
+
+@pytest.fixture
+def coin_repository():
+    repository = Mock()
+    repository.get_all_coins.return_value = [
+        make_coin(1, "KRW-BTC"),
+        make_coin(2, "BTC-ETH"),
+        make_coin(3, "KRW-ETH"),
+    ]
+    return repository
+
+
+class TestCoinRegistry:
+    """프로세스 공용 코인 목록 테스트"""
+
+    def test_lookup_by_market_code_symbol_and_id(self, coin_repository):
+        """처음 조회할 때 한 번만 불러오고 market_code / symbol / id로 조회"""
+        # Given
+        registry = CoinRegistry(coin_repository=coin_repository)
+
+        # When & Then
+        assert registry.get_id_by_market_code("KRW-BTC") == 1
+        assert [coin.id for coin in registry.get_by_symbol("ETH")] == [2, 3]
+        assert registry.get_by_id(3).market_code == "KRW-ETH"
+        assert registry.market_code_map() == {
+            "KRW-BTC": 1,
+            "BTC-ETH": 2,
+            "KRW-ETH": 3,
+        }
+        coin_repository.get_all_coins.assert_called_once()
+
+    def test_missing_market_refreshes_once(self, coin_repository):
+        """없는 마켓은 한 번 다시 불러와서 찾음"""
+        # Given
+        registry = CoinRegistry(
+            coin_repository=coin_repository, miss_refresh_interval=0
+        )
+        registry.refresh()
+        coin_repository.get_all_coins.return_value = [
+            *coin_repository.get_all_coins.return_value,
+            make_coin(4, "KRW-NEW"),
+        ]
+
+        # When
+        coin_id = registry.get_id_by_market_code("KRW-NEW")
+
+        # Then
+        assert coin_id == 4
+        assert coin_repository.get_all_coins.call_count == 2
+
+    def test_unknown_market_does_not_refresh_repeatedly(self, coin_repository):
+        """최소 간격 안에서는 없는 마켓을 조회해도 다시 불러오지 않음"""
+        # Given
+        registry = CoinRegistry(
+            coin_repository=coin_repository, miss_refresh_interval=60
+        )
+        registry.refresh()
+
+        # When
+        results = [registry.get_id_by_market_code("KRW-NONE") for _ in range(5)]
+
+        # Then
+        assert results == [None] * 5
+        coin_repository.get_all_coins.assert_called_once()
+
+
+class TestCoinRepository:
+    """코인 저장소 테스트"""
+
+    @patch("repository.coin_repository.db")
+    def test_get_all_coins_closes_session(self, mock_db):
+        """조회 후 세션을 닫음"""
+        # Given
+        mock_session = Mock()
+        mock_db.get_session.return_value = mock_session
+        mock_session.query.return_value.all.return_value = []
+
+        # When
+        CoinRepository().get_all_coins()
+
+        # Then
+        mock_session.close.assert_called_once()
+
+    def test_upsert_statement_only_updates_changed_rows(self):
+        """market_code 충돌 시 값이 달라진 경우에만 UPDATE"""
+        # When
+        statement = CoinRepository()._build_upsert_statement()
+        sql = str(statement.compile(dialect=postgresql.dialect()))
+
+        # Then
+        assert "ON CONFLICT (market_code) DO UPDATE" in sql
+        assert "coins.korean_name IS DISTINCT FROM excluded.korean_name" in sql
+        assert "xmax = 0" in sql
+
+    @patch("repository.coin_repository.db")
+    def test_save_coin_list_counts_and_closes_session(self, mock_db):
+        """추가/갱신/변경 없음 건수를 반환하고 세션을 닫음"""
+        # Given
+        mock_session = Mock()
+        mock_db.get_session.return_value = mock_session
+        mock_session.execute.return_value.all.return_value = [
+            SimpleNamespace(id=1, inserted=True),
+            SimpleNamespace(id=2, inserted=False),
+        ]
+        coin_list = [
+            Coins(symbol=f"S{i}", quote_currency="KRW", market_code=f"KRW-S{i}")
+            for i in range(4)
+        ]
+        # 같은 market_code는 한 번만 저장
+        coin_list.append(
+            Coins(symbol="S0", quote_currency="KRW", market_code="KRW-S0")
+        )
+
+        # When
+        result = CoinRepository().save_coin_list(coin_list)
+
+        # Then
+        assert len(mock_session.execute.call_args.args[1]) == 4
+        assert result == {"inserted": 1, "updated": 1, "unchanged": 2}
+        mock_session.commit.assert_called_once()
+        mock_session.close.assert_called_once()
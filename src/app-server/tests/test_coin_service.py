@@ -0,0 +1,167 @@
+import json
+import pytest
+from types import SimpleNamespace
+from unittest.mock import Mock
+from service.coin_service import CoinService
+from utils.coin_registry import CoinRegistry
+from utils.sync_state_store import FileSyncStateStore
+
+
+def make_master_item(symbol, korean_name, quote="KRW"):
+    return {
+        "pair": f"{symbol}/{quote}",
+        "baseCurrencyCode": symbol,
+        "quoteCurrencyCode": quote,
+        "koreanName": korean_name,
+        "englishName": symbol,
+        "exchange": "UPBIT",
+    }
+
+
+def make_coin(coin_id, symbol, korean_name, is_active=True, quote="KRW"):
+    return SimpleNamespace(
+        id=coin_id,
+        symbol=symbol,
+        quote_currency=quote,
+        market_code=f"{quote}-{symbol}",
+        korean_name=korean_name,
+        english_name=symbol,
+        img_url=f"/data/image/{symbol}.png",
+        exchange="UPBIT",
+        is_active=is_active,
+    )
+
+
+class FakeUpbitService:
+    """조건부 요청을 흉내 내는 업비트 서비스 (ETag가 같으면 304)"""
+
+    def __init__(self, items, etag="v1"):
+        self.items = items
+        self.etag = etag
+        self.requests = []
+
+    def fetch_coin_master_if_modified(self, etag=None, last_modified=None):
+        self.requests.append(etag)
+        if etag == self.etag:
+            return {
+                "not_modified": True,
+                "content": None,
+                "etag": etag,
+                "last_modified": last_modified,
+            }
+        return {
+            "not_modified": False,
+            "content": json.dumps(self.items).encode(),
+            "etag": self.etag,
+            "last_modified": "Sat, 17 Oct 2026 00:00:00 GMT",
+        }
+
+
+@pytest.fixture
+def coin_repository():
+    repository = Mock()
+    repository.get_all_coins.return_value = [
+        make_coin(1, "BTC", "비트코인"),
+        make_coin(2, "ETH", "이더리움"),
+        make_coin(3, "XRP", "리플"),
+        make_coin(4, "OLD", "폐지코인", is_active=False),
+    ]
+    repository.deactivate_by_market_codes.return_value = 1
+    return repository
+
+
+@pytest.fixture
+def coin_service(coin_repository, tmp_path):
+    service = CoinService()
+    service._coin_repository = coin_repository
+    service._coin_registry = CoinRegistry(coin_repository=coin_repository)
+    service._sync_state_store = FileSyncStateStore(str(tmp_path))
+    service._upbit_service = FakeUpbitService(
+        [
+            make_master_item("BTC", "비트코인"),
+            make_master_item("ETH", "이더리움 클래식"),
+            make_master_item("NEW", "신규코인"),
+            make_master_item("OLD", "폐지코인"),
+        ]
+    )
+    return service
+
+
+class TestCoinMasterSync:
+    """코인 목록 변경분 동기화 테스트"""
+
+    def test_sync_applies_only_diff(self, coin_service, coin_repository):
+        """추가/변경/상장 폐지 마켓만 DB에 반영"""
+        # When
+        result = coin_service.sync_coin_master()
+
+        # Then
+        assert result["changed"] is True
+        assert result["added"] == ["KRW-NEW", "KRW-OLD"]
+        assert result["renamed"] == ["KRW-ETH"]
+        assert result["delisted"] == ["KRW-XRP"]
+        assert result["counts"]["unchanged"] == 1
+
+        saved_coins = coin_repository.save_coin_list.call_args[0][0]
+        assert sorted(coin.market_code for coin in saved_coins) == [
+            "KRW-ETH",
+            "KRW-NEW",
+            "KRW-OLD",
+        ]
+        assert all(coin.is_active for coin in saved_coins)
+        coin_repository.deactivate_by_market_codes.assert_called_once_with(
+            ["KRW-XRP"]
+        )
+
+    def test_not_modified_skips_db(self, coin_service, coin_repository):
+        """두 번째 동기화는 304로 끝나고 DB 작업 없음"""
+        # Given
+        coin_service.sync_coin_master()
+        coin_repository.reset_mock()
+
+        # When
+        result = coin_service.sync_coin_master()
+
+        # Then
+        assert result == coin_service._unchanged_coin_master_result("not_modified")
+        assert coin_service.upbit_service.requests == [None, "v1"]
+        coin_repository.save_coin_list.assert_not_called()
+        coin_repository.deactivate_by_market_codes.assert_not_called()
+
+    def test_same_content_with_new_etag_skips_db(
+        self, coin_service, coin_repository
+    ):
+        """ETag만 바뀌고 내용이 같으면 파싱/DB 작업 없이 상태만 갱신"""
+        # Given
+        coin_service.sync_coin_master()
+        coin_repository.reset_mock()
+        coin_service.upbit_service.etag = "v2"
+
+        # When
+        result = coin_service.sync_coin_master()
+
+        # Then
+        assert result["reason"] == "same_content"
+        coin_repository.save_coin_list.assert_not_called()
+        assert coin_service.sync_state_store.get("crix_master")["etag"] == "v2"
+
+    def test_failed_db_work_keeps_previous_state(
+        self, coin_service, coin_repository
+    ):
+        """DB 반영에 실패하면 상태를 저장하지 않아 다음 동기화에서 다시 반영"""
+        # Given
+        coin_repository.save_coin_list.side_effect = RuntimeError("db down")
+
+        # When & Then
+        with pytest.raises(RuntimeError):
+            coin_service.sync_coin_master()
+        assert coin_service.sync_state_store.get("crix_master") == {}
+
+    def test_empty_payload_does_not_delist_everything(self, coin_service):
+        """빈 목록을 받으면 전체 상장 폐지 대신 에러"""
+        # Given
+        coin_service.upbit_service.items = []
+
+        # When & Then
+        with pytest.raises(ValueError):
+            coin_service.sync_coin_master()
@@ -0,0 +1,104 @@
+from decimal import Decimal
+import numpy as np
+import pytest
+from utils.fixed_point import (
+    fixed_div,
+    fixed_to_float,
+    fixed_to_str,
+    sum_segments,
+    to_fixed,
+    to_fixed_array,
+)
+
+
+class TestToFixed:
+    """숫자 문자열 → 소수점 8자리 고정소수점 정수 변환 테스트"""
+
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            ("0.12345678", 12345678),
+            ("1", 100000000),
+            ("-0.5", -50000000),
+            (".5", 50000000),
+            ("25000000.0", 2500000000000000),
+            (3, 300000000),
+            (Decimal("0.1"), 10000000),
+            (None, 0),
+            # 8자리 아래는 반올림 (Numeric(20, 8)과 동일)
+            ("0.123456785", 12345679),
+            ("-0.123456785", -12345679),
+            ("1e-05", 1000),
+        ],
+    )
+    def test_parses_without_float(self, value, expected):
+        assert to_fixed(value) == expected
+
+    def test_array_matches_string_parsing(self):
+        """float로 한 번에 읽은 값이 정확하지 않으면 문자열에서 다시 변환"""
+        # Given
+        values = [
+            "0.12345678",
+            "22517998.13685248",  # float로 읽으면 정확하지 않은 크기
+            "150000000.12345678",
+            "0.123456785",  # 반올림이 필요한 값
+            "1e-05",
+            0,
+            "-3.5",
+        ]
+
+        # When
+        fixed_values = to_fixed_array(values)
+
+        # Then
+        assert fixed_values.dtype == np.int64
+        assert fixed_values.tolist() == [to_fixed(value) for value in values]
+
+    def test_large_values_fall_back_to_python_int(self):
+        """int64를 넘는 값은 object 배열로 정확히 보관"""
+        # When
+        values = to_fixed_array(["1", "999999999999.99999999"])
+
+        # Then
+        assert values.dtype == object
+        assert values.tolist() == [100000000, 99999999999999999999]
+
+
+class TestSumSegments:
+    """주문별 체결 구간 합계 테스트"""
+
+    def test_sums_contiguous_segments_with_empty_ones(self):
+        # Given
+        values = np.array([1, 2, 3, 4, 5], dtype=np.int64)
+
+        # When & Then
+        assert sum_segments(values, [2, 0, 3, 0]) == [3, 0, 12, 0]
+
+    def test_sums_that_may_overflow_use_python_int(self):
+        """int64 합계가 넘칠 수 있으면 Python int로 계산"""
+        # Given
+        big = 2**62
+        values = np.array([big, big, 1], dtype=np.int64)
+
+        # When & Then
+        assert sum_segments(values, [2, 1]) == [2**63, 1]
+
+    def test_no_segments(self):
+        assert sum_segments(np.array([], dtype=np.int64), []) == []
+
+
+class TestFixedArithmetic:
+    def test_division_rounds_half_up(self):
+        """평균가는 8자리에서 반올림, 분모가 0이면 0"""
+        assert fixed_div(to_fixed("1"), to_fixed("3")) == 33333333
+        assert fixed_div(to_fixed("2"), to_fixed("3")) == 66666667
+        assert fixed_div(to_fixed("-2"), to_fixed("3")) == -66666667
+        assert fixed_div(to_fixed("1"), 0) == 0
+
+    def test_serialization(self):
+        """DB용 문자열과 응답용 float 변환"""
+        assert fixed_to_str(12345678) == "0.12345678"
+        assert fixed_to_str(-50000000) == "-0.50000000"
+        assert fixed_to_str(99999999999999999999) == "999999999999.99999999"
+        assert fixed_to_float(to_fixed("0.1")) == 0.1
+        assert fixed_to_float(to_fixed("50000000.5")) == 50000000.5
@@ -0,0 +1,205 @@
+import asyncio
+import pytest
+import utils.job_queue as job_queue_module
+from utils.job_queue import (
+    JobQueue,
+    InMemoryJobBackend,
+    JOB_STATUS_SUCCEEDED,
+    JOB_STATUS_FAILED,
+)
+
+
+async def wait_for_status(job_queue, job_id, statuses, timeout=2.0):
+    """작업이 지정한 상태가 될 때까지 대기"""
+    deadline = asyncio.get_running_loop().time() + timeout
+    while asyncio.get_running_loop().time() < deadline:
+        job = await job_queue.get_job(job_id)
+        if job["status"] in statuses:
+            return job
+        await asyncio.sleep(0.01)
+    raise AssertionError(f"작업 상태가 {statuses}가 되지 않았습니다")
+
+
+class TestJobQueue:
+    """백그라운드 작업 큐 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_runs_job_and_reports_progress(self):
+        """작업 실행 결과와 진행 상황이 저장되는지 확인"""
+        # Given
+        job_queue = JobQueue(InMemoryJobBackend(), workers=2)
+
+        async def handler(payload, progress):
+            await progress.increment(windows_scanned=1, uuids_found=3)
+            await progress.increment(windows_scanned=1)
+            await progress.set(rows_saved=3)
+            return {"saved_count": 3, "user_id": payload["user_id"]}
+
+        job_queue.register("sync", handler)
+        await job_queue.start()
+
+        # When
+        job = await job_queue.submit("sync", {"user_id": "user-1"})
+        finished = await wait_for_status(
+            job_queue, job["job_id"], (JOB_STATUS_SUCCEEDED, JOB_STATUS_FAILED)
+        )
+        await job_queue.stop()
+
+        # Then
+        assert finished["status"] == JOB_STATUS_SUCCEEDED
+        assert finished["progress"] == {
+            "windows_scanned": 2,
+            "uuids_found": 3,
+            "rows_saved": 3,
+        }
+        assert finished["result"] == {"saved_count": 3, "user_id": "user-1"}
+
+    @pytest.mark.asyncio
+    async def test_deduplicates_running_job(self):
+        """같은 dedup_key의 작업이 진행 중이면 기존 작업을 반환"""
+        # Given
+        job_queue = JobQueue(InMemoryJobBackend(), workers=2)
+        release = asyncio.Event()
+        run_count = 0
+
+        async def handler(payload, progress):
+            nonlocal run_count
+            run_count += 1
+            await release.wait()
+
+        job_queue.register("sync", handler)
+        await job_queue.start()
+
+        # When
+        first = await job_queue.submit("sync", {}, dedup_key="user-1:UPBIT")
+        second = await job_queue.submit("sync", {}, dedup_key="user-1:UPBIT")
+        other = await job_queue.submit("sync", {}, dedup_key="user-2:UPBIT")
+        release.set()
+        await wait_for_status(job_queue, first["job_id"], (JOB_STATUS_SUCCEEDED,))
+        await wait_for_status(job_queue, other["job_id"], (JOB_STATUS_SUCCEEDED,))
+
+        # 끝난 뒤에는 새 작업 등록 가능
+        third = await job_queue.submit("sync", {}, dedup_key="user-1:UPBIT")
+        await wait_for_status(job_queue, third["job_id"], (JOB_STATUS_SUCCEEDED,))
+        await job_queue.stop()
+
+        # Then
+        assert second["job_id"] == first["job_id"]
+        assert other["job_id"] != first["job_id"]
+        assert third["job_id"] != first["job_id"]
+        assert run_count == 3
+
+    @pytest.mark.asyncio
+    async def test_failed_job_records_error(self):
+        """핸들러 예외 시 failed 상태와 에러 메시지 저장"""
+        # Given
+        job_queue = JobQueue(InMemoryJobBackend(), workers=1)
+
+        async def handler(payload, progress):
+            raise ValueError("거래소 인증 실패")
+
+        job_queue.register("sync", handler)
+        await job_queue.start()
+
+        # When
+        job = await job_queue.submit("sync", {}, dedup_key="user-1:UPBIT")
+        finished = await wait_for_status(job_queue, job["job_id"], (JOB_STATUS_FAILED,))
+        retried = await job_queue.submit("sync", {}, dedup_key="user-1:UPBIT")
+        await job_queue.stop()
+
+        # Then
+        assert finished["error"] == "거래소 인증 실패"
+        assert retried["job_id"] != job["job_id"]
+
+    @pytest.mark.asyncio
+    async def test_unknown_job_type(self):
+        """등록되지 않은 작업 유형은 ValueError"""
+        # Given
+        job_queue = JobQueue(InMemoryJobBackend(), workers=1)
+
+        # When & Then
+        with pytest.raises(ValueError):
+            await job_queue.submit("unknown", {})
+
+    @pytest.mark.asyncio
+    async def test_refreshes_dedup_key_while_running(self):
+        """실행 중에는 중복 키 유지 시간을 연장하고, 끝나면 연장을 멈춤"""
+        # Given
+        refreshed = []
+
+        class RecordingBackend(InMemoryJobBackend):
+            async def refresh_dedup(self, dedup_key, job_id, ttl):
+                refreshed.append((dedup_key, job_id, ttl))
+
+        job_queue = JobQueue(RecordingBackend(), workers=1, lease_ttl=0.03)
+        release = asyncio.Event()
+
+        async def handler(payload, progress):
+            await release.wait()
+
+        job_queue.register("sync", handler)
+        await job_queue.start()
+
+        # When
+        job = await job_queue.submit("sync", {}, dedup_key="user-1:UPBIT")
+        await asyncio.sleep(0.1)
+        release.set()
+        await wait_for_status(job_queue, job["job_id"], (JOB_STATUS_SUCCEEDED,))
+        refreshed_count = len(refreshed)
+        await asyncio.sleep(0.05)
+        await job_queue.stop()
+
+        # Then
+        assert refreshed_count >= 3
+        assert len(refreshed) == refreshed_count
+        assert set(refreshed) == {("user-1:UPBIT", job["job_id"], 0.03)}
+
+    @pytest.mark.asyncio
+    async def test_finished_job_is_not_run_again(self):
+        """결과 저장 후 큐에 다시 들어온 작업은 실행하지 않음 (워커 재시작 후 되돌린 경우)"""
+        # Given
+        backend = InMemoryJobBackend()
+        job_queue = JobQueue(backend, workers=1)
+        run_count = 0
+
+        async def handler(payload, progress):
+            nonlocal run_count
+            run_count += 1
+
+        job_queue.register("sync", handler)
+        await job_queue.start()
+        job = await job_queue.submit("sync", {})
+        await wait_for_status(job_queue, job["job_id"], (JOB_STATUS_SUCCEEDED,))
+
+        # When
+        await backend.enqueue(job["job_id"])
+        await asyncio.sleep(0.05)
+        await job_queue.stop()
+
+        # Then
+        assert run_count == 1
+
+
+class TestInMemoryJobBackend:
+    """메모리 작업 저장소 만료 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_expires_jobs_and_dedup_keys(self, monkeypatch):
+        """마지막 저장 후 result_ttl이 지난 작업과 그 중복 키는 지움"""
+        # Given
+        now = 1000.0
+        monkeypatch.setattr(job_queue_module.time, "monotonic", lambda: now)
+        backend = InMemoryJobBackend(result_ttl=60)
+        job = {"job_id": "job-1", "dedup_key": "user-1:UPBIT", "status": "succeeded"}
+        await backend.claim_dedup("user-1:UPBIT", job)
+
+        # When
+        now += 30
+        kept = await backend.get("job-1")
+        now += 31
+        await backend.maintain(lease_ttl=60)
+
+        # Then
+        assert kept["job_id"] == "job-1"
+        assert await backend.get("job-1") is None
+        assert backend._jobs == {} and backend._dedup == {}
@@ -0,0 +1,302 @@
+from datetime import datetime
+from decimal import ROUND_HALF_UP, Decimal
+from repository.trading_histories_repository import TradingFillRow, TradingHistoryRow
+from utils.order_transform import (
+    aggregate_orders,
+    build_fill_rows,
+    build_rows,
+    flatten_fills,
+    order_trades,
+    parse_trade_times,
+    transform_orders,
+)
+from tests.fake_upbit_server import make_order
+
+
+def reference_aggregate(order):
+    """주문 하나씩 Decimal로 더한 정확한 값을 고정소수점 정수로 (비교 기준)"""
+    total_quantity = sum(Decimal(trade["volume"]) for trade in order["trades"])
+    total_price = sum(Decimal(trade["funds"]) for trade in order["trades"])
+    avg_price = (
+        (total_price / total_quantity).quantize(
+            Decimal("1e-8"), rounding=ROUND_HALF_UP
+        )
+        if total_quantity > 0
+        else Decimal(0)
+    )
+    return tuple(
+        int(value.scaleb(8))
+        for value in (
+            avg_price,
+            total_quantity,
+            total_price,
+            Decimal(order["paid_fee"]),
+        )
+    )
+
+
+class TestAggregateOrders:
+    """체결 열 단위 주문 집계 테스트"""
+
+    def test_matches_exact_decimal_sums(self):
+        """주문별 수량/금액/평균가/수수료가 Decimal로 계산한 값과 정확히 같음"""
+        # Given
+        orders = [
+            make_order(
+                f"uuid-{i}",
+                trades=[
+                    {"volume": f"0.{i + 1}{j}", "funds": f"{1000 * (i + j + 1)}.1"}
+                    for j in range(i % 4 + 1)
+                ],
+            )
+            for i in range(50)
+        ]
+
+        # When
+        columns = aggregate_orders(orders)
+
+        # Then
+        assert list(
+            zip(columns.prices, columns.quantities, columns.total_prices, columns.fees)
+        ) == [reference_aggregate(order) for order in orders]
+
+    def test_skips_orders_without_trades_and_zero_fills(self):
+        """trades가 없는 주문은 제외하고, 체결이 없는 주문은 0으로 집계"""
+        # Given
+        no_trades = make_order("uuid-none")
+        no_trades["trades"] = None
+        empty = make_order("uuid-empty", trades=[])
+        filled = make_order("uuid-filled", side="ask")
+
+        # When
+        columns = aggregate_orders([no_trades, empty, filled])
+
+        # Then
+        assert columns.trade_uuids == ["uuid-empty", "uuid-filled"]
+        assert columns.quantities == [0, 50000000]
+        assert columns.prices == [0, 5000000000000000]
+        assert columns.trade_types == [0, 1]
+
+    def test_empty_batch(self):
+        assert aggregate_orders([]).trade_uuids == []
+
+
+def make_list_item(uuid: str, volume: str, funds: str) -> dict:
+    """/v1/orders/uuids 응답 항목 (trades 없이 체결 합계만 포함)"""
+    item = make_order(uuid)
+    del item["trades"]
+    item.update(executed_volume=volume, executed_funds=funds, trades_count=1)
+    return item
+
+
+class TestOrderTrades:
+    """주문 목록 항목의 체결 합성 테스트"""
+
+    def test_list_item_becomes_single_fill(self):
+        """trades가 없으면 체결 합계로 체결 하나, 체결 합계도 없으면 None"""
+        # Given
+        item = make_list_item("uuid-a", "2", "50000000.00000001")
+        cancelled = make_list_item("uuid-c", "0.0", "0.0")
+        unknown = make_order("uuid-u")
+        del unknown["trades"]
+
+        # When & Then
+        assert [(t["uuid"], t["volume"], t["funds"]) for t in order_trades(item)] == [
+            ("uuid-a", "2", "50000000.00000001")
+        ]
+        assert "price" not in order_trades(item)[0]
+        assert order_trades(cancelled) == []
+        assert order_trades(unknown) is None
+
+    def test_list_item_matches_order_detail(self):
+        """합성한 체결로 집계/펼친 값이 /v1/order 응답과 같음"""
+        # Given
+        detail = make_order(
+            "uuid-a", trades=[{"volume": "2", "funds": "50000000.00000001"}]
+        )
+        item = make_list_item("uuid-a", "2", "50000000.00000001")
+
+        # When
+        from_item = aggregate_orders([item])
+        fills = flatten_fills([item])
+
+        # Then
+        assert from_item == aggregate_orders([detail])
+        assert fills.trade_uuids == ["uuid-a"]
+        assert fills.prices == [2500000000000001]
+
+
+class TestParseTradeTimes:
+    """체결시간 일괄 변환 테스트"""
+
+    def test_keeps_local_wall_clock(self):
+        """시간대 표기는 버리고 표기된 시각을 그대로 사용 (TIMESTAMP 컬럼과 동일)"""
+        # When
+        result = parse_trade_times(
+            [
+                "2024-01-01T09:00:00+09:00",
+                "2024-01-01T00:00:00.123456Z",
+                "2024-01-01T09:30:00",
+            ]
+        )
+
+        # Then
+        assert result == [
+            datetime(2024, 1, 1, 9, 0, 0),
+            datetime(2024, 1, 1, 0, 0, 0, 123456),
+            datetime(2024, 1, 1, 9, 30, 0),
+        ]
+
+    def test_repeated_values_keep_positions(self):
+        """같은 문자열은 한 번만 변환하고 원래 순서대로 채움"""
+        # When
+        result = parse_trade_times(
+            ["2024-01-01T09:00:00+09:00", "2024-01-02T09:00:00+09:00"] * 2
+        )
+
+        # Then
+        assert result == [datetime(2024, 1, 1, 9), datetime(2024, 1, 2, 9)] * 2
+
+
+class TestTransformOrders:
+    """주문 열/체결 열 한 번에 변환 테스트"""
+
+    def test_matches_separate_transforms(self):
+        """한 번에 만든 주문 열/체결 열이 각각 따로 만든 결과와 같음"""
+        # Given
+        orders = [
+            make_order(
+                f"uuid-{i}",
+                trades=[
+                    {"volume": f"0.{i + 1}{j}", "funds": f"{90000000 * (j + 1)}.5"}
+                    for j in range(i % 3 + 1)
+                ],
+            )
+            for i in range(20)
+        ]
+        orders[3]["trades"] = None
+
+        # When
+        order_columns, fill_columns = transform_orders(orders)
+
+        # Then
+        assert order_columns == aggregate_orders(orders)
+        assert fill_columns == flatten_fills(orders)
+        assert len(order_columns.trade_uuids) == 19
+        assert list(
+            zip(
+                order_columns.prices,
+                order_columns.quantities,
+                order_columns.total_prices,
+                order_columns.fees,
+            )
+        ) == [
+            reference_aggregate(order)
+            for order in orders
+            if order["trades"] is not None
+        ]
+
+
+class TestBuildRows:
+    def test_rows_follow_insert_columns(self):
+        """INSERT_COLUMNS 순서의 행 튜플 생성"""
+        # Given
+        columns = aggregate_orders([make_order("uuid-1")])
+
+        # When
+        rows = build_rows(TradingHistoryRow, "user-1", 1, [7], columns)
+
+        # Then
+        assert rows == [
+            TradingHistoryRow(
+                user_id="user-1",
+                coin_id=7,
+                exchange_code=1,
+                trade_uuid="uuid-1",
+                trade_type=0,
+                price=5000000000000000,
+                quantity=50000000,
+                total_price=2500000000000000,
+                fee=1250000000000,
+                trade_time=datetime(2024, 1, 1, 9, 0, 0),
+            )
+        ]
+
+
+class TestFlattenFills:
+    """체결 단위 펼치기 테스트"""
+
+    def test_keeps_upbit_fill_fields(self):
+        """체결 uuid/가격/시간이 있으면 그대로 사용"""
+        # Given
+        order = make_order(
+            "uuid-1",
+            trades=[
+                {
+                    "uuid": "fill-1",
+                    "price": "50000000",
+                    "volume": "0.1",
+                    "funds": "5000000",
+                    "created_at": "2024-01-01T09:00:01+09:00",
+                },
+                {
+                    "uuid": "fill-2",
+                    "price": "51000000",
+                    "volume": "0.2",
+                    "funds": "10200000",
+                    "created_at": "2024-01-01T09:00:02+09:00",
+                },
+            ],
+        )
+
+        # When
+        rows = build_fill_rows(TradingFillRow, "user-1", 1, flatten_fills([order]))
+
+        # Then
+        assert rows == [
+            TradingFillRow(
+                user_id="user-1",
+                exchange_code=1,
+                order_uuid="uuid-1",
+                trade_uuid="fill-1",
+                price=5000000000000000,
+                volume=10000000,
+                funds=500000000000000,
+                trade_time=datetime(2024, 1, 1, 9, 0, 1),
+            ),
+            TradingFillRow(
+                user_id="user-1",
+                exchange_code=1,
+                order_uuid="uuid-1",
+                trade_uuid="fill-2",
+                price=5100000000000000,
+                volume=20000000,
+                funds=1020000000000000,
+                trade_time=datetime(2024, 1, 1, 9, 0, 2),
+            ),
+        ]
+
+    def test_fills_missing_fields_from_order(self):
+        """체결 uuid/가격/시간이 없으면 순번, 금액/수량, 주문시간으로 채움"""
+        # Given
+        order = make_order(
+            "uuid-1",
+            trades=[
+                {"volume": "3", "funds": "1"},
+                {"volume": "0.5", "funds": "25000000.0"},
+            ],
+        )
+        no_trades = make_order("uuid-none")
+        no_trades["trades"] = None
+
+        # When
+        columns = flatten_fills([order, no_trades])
+
+        # Then
+        assert columns.order_uuids == ["uuid-1", "uuid-1"]
+        assert columns.trade_uuids == ["uuid-1:0", "uuid-1:1"]
+        assert columns.prices == [33333333, 5000000000000000]
+        assert columns.trade_times == [datetime(2024, 1, 1, 9, 0, 0)] * 2
+
+    def test_empty_batch(self):
+        assert flatten_fills([]).trade_uuids == []
@@ -0,0 +1,121 @@
+import asyncio
+import threading
+import time
+import multiprocessing
+import pytest
+from utils.rate_limiter import TokenBucketRateLimiter, parse_remaining_req
+
+
+def _acquire_many(state_dir: str, count: int):
+    """다른 프로세스에서 같은 버킷의 토큰을 소비"""
+    limiter = TokenBucketRateLimiter(state_dir=state_dir, group_rates={"default": 10})
+    for _ in range(count):
+        limiter.acquire("default")
+
+
+class TestParseRemainingReq:
+    """Remaining-Req 헤더 파싱 테스트"""
+
+    def test_parse_success(self):
+        """정상 헤더 파싱"""
+        assert parse_remaining_req("group=default; min=1799; sec=29") == (
+            "default",
+            1799,
+            29,
+        )
+
+    def test_parse_without_min(self):
+        """min 필드가 없는 헤더"""
+        assert parse_remaining_req("group=crix-trades; sec=9") == (
+            "crix-trades",
+            None,
+            9,
+        )
+
+    @pytest.mark.parametrize("header", [None, "", "sec=3"])
+    def test_parse_invalid(self, header):
+        """그룹 정보가 없으면 None 반환"""
+        assert parse_remaining_req(header) is None
+
+
+class TestTokenBucketRateLimiter:
+    """토큰 버킷 요청 제한기 테스트"""
+
+    def test_burst_without_wait(self, tmp_path):
+        """버킷 용량 이내의 요청은 대기하지 않음"""
+        limiter = TokenBucketRateLimiter(
+            state_dir=str(tmp_path), group_rates={"default": 10}
+        )
+
+        waited = sum(limiter.acquire("default") for _ in range(10))
+
+        assert waited == 0
+
+    def test_wait_only_as_needed(self, tmp_path):
+        """토큰이 없으면 다음 토큰이 채워질 만큼만 대기"""
+        limiter = TokenBucketRateLimiter(
+            state_dir=str(tmp_path), group_rates={"default": 10}
+        )
+        for _ in range(10):
+            limiter.acquire("default")
+
+        waited = limiter.acquire("default")
+
+        assert 0.05 <= waited <= 0.2
+
+    def test_update_with_exhausted_server_quota(self, tmp_path):
+        """서버가 잔여 요청 0을 알려주면 다음 초까지 보류"""
+        limiter = TokenBucketRateLimiter(
+            state_dir=str(tmp_path), group_rates={"default": 10}
+        )
+        limiter.update("default", 1800, 0)
+
+        started_at = time.monotonic()
+        limiter.acquire("default")
+
+        assert time.monotonic() - started_at >= 1.0
+
+    def test_buckets_are_separated_by_key(self, tmp_path):
+        """키가 다르면 서로의 한도에 영향을 주지 않음"""
+        limiter = TokenBucketRateLimiter(
+            state_dir=str(tmp_path), group_rates={"default": 10}
+        )
+        limiter.update("default", 1800, 0, key="user-a")
+
+        assert limiter.acquire("default", key="user-b") == 0
+
+    def test_shared_across_processes(self, tmp_path):
+        """여러 프로세스가 같은 버킷을 공유"""
+        # 2개 프로세스 x 10회 = 20회, 초당 10회 → 버스트 10회 이후 약 1초 소요
+        started_at = time.monotonic()
+        processes = [
+            multiprocessing.Process(target=_acquire_many, args=(str(tmp_path), 10))
+            for _ in range(2)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+
+        assert time.monotonic() - started_at >= 0.9
+
+    @pytest.mark.asyncio
+    async def test_acquire_async_does_not_block_event_loop(self, tmp_path):
+        """버킷 잠금을 기다리는 동안에도 이벤트 루프의 다른 코루틴은 진행"""
+        # Given - 다른 스레드가 0.3초 동안 버킷 잠금을 잡고 있음
+        limiter = TokenBucketRateLimiter(
+            state_dir=str(tmp_path), group_rates={"default": 10}
+        )
+        limiter._thread_lock.acquire()
+        threading.Timer(0.3, limiter._thread_lock.release).start()
+
+        # When
+        task = asyncio.create_task(limiter.acquire_async("default"))
+        started_at = time.monotonic()
+        for _ in range(5):
+            await asyncio.sleep(0.01)
+        ticked_in = time.monotonic() - started_at
+
+        # Then
+        assert ticked_in < 0.2
+        assert await task == 0
@@ -0,0 +1,90 @@
+import pytest
+import utils.response_cache as response_cache_module
+from utils.response_cache import InMemoryResponseCache, create_response_cache
+
+
+class TestInMemoryResponseCache:
+    """프로세스 내부 응답 캐시 테스트"""
+
+    def test_evicts_least_recently_used_entry(self):
+        """항목 수 제한을 넘으면 가장 오래 쓰지 않은 항목부터 제거"""
+        # Given
+        cache = InMemoryResponseCache(max_entries=2)
+        cache.set("user-1", "a", b"1", cache.generation("user-1"))
+        cache.set("user-1", "b", b"2", cache.generation("user-1"))
+        cache.get("user-1", "a")
+
+        # When
+        cache.set("user-1", "c", b"3", cache.generation("user-1"))
+
+        # Then
+        assert cache.get("user-1", "a") == b"1"
+        assert cache.get("user-1", "b") is None
+        assert cache.get("user-1", "c") == b"3"
+
+    def test_evicts_by_total_bytes(self):
+        """전체 바이트 수 제한을 넘으면 제거하고, 제한보다 큰 항목은 저장하지 않음"""
+        # Given
+        cache = InMemoryResponseCache(max_bytes=10)
+        cache.set("user-1", "a", b"x" * 6, 0)
+
+        # When
+        cache.set("user-1", "b", b"y" * 6, 0)
+        cache.set("user-1", "c", b"z" * 11, 0)
+
+        # Then
+        assert cache.get("user-1", "a") is None
+        assert cache.get("user-1", "b") == b"y" * 6
+        assert cache.get("user-1", "c") is None
+        assert cache.size == 6
+
+    def test_expires_after_ttl(self, monkeypatch):
+        """TTL이 지나면 조회되지 않음"""
+        # Given
+        now = 1000.0
+        monkeypatch.setattr(response_cache_module.time, "monotonic", lambda: now)
+        cache = InMemoryResponseCache(ttl_seconds=10)
+        cache.set("user-1", "a", b"1", 0)
+
+        # When
+        now = 1011.0
+
+        # Then
+        assert cache.get("user-1", "a") is None
+        assert len(cache) == 0
+
+    def test_invalidate_user_only_removes_that_user(self):
+        """무효화는 해당 사용자 항목만 제거"""
+        # Given
+        cache = InMemoryResponseCache()
+        cache.set("user-1", "a", b"1", 0)
+        cache.set("user-2", "a", b"2", 0)
+
+        # When
+        cache.invalidate_user("user-1")
+
+        # Then
+        assert cache.get("user-1", "a") is None
+        assert cache.get("user-2", "a") == b"2"
+
+    def test_skips_result_read_before_invalidation(self):
+        """조회 시작 후 무효화되었다면 그 결과는 저장하지 않음"""
+        # Given
+        cache = InMemoryResponseCache()
+        generation = cache.generation("user-1")
+        cache.invalidate_user("user-1")
+
+        # When
+        cache.set("user-1", "a", b"stale", generation)
+
+        # Then
+        assert cache.get("user-1", "a") is None
+
+
+@pytest.mark.parametrize(
+    "backend_name, expected",
+    [("memory", InMemoryResponseCache), ("none", type(None))],
+)
+def test_create_response_cache(backend_name, expected):
+    """설정에 맞는 캐시 생성"""
+    assert isinstance(create_response_cache(backend_name), expected)
@@ -0,0 +1,124 @@
+from datetime import datetime, timedelta
+from utils.time_utils import (
+    AdaptiveTimeWindowScanner,
+    KOREA_TIMEZONE,
+    format_iso8601,
+    parse_iso8601,
+    split_time_range_into,
+)
+
+
+def kst(*args) -> datetime:
+    return KOREA_TIMEZONE.localize(datetime(*args))
+
+
+def scan(scanner, created_ats):
+    """created_ats 중 요청 구간에 속하는 최신 limit건을 돌려주며 끝까지 조회"""
+    windows = []
+    while (time_range := scanner.next_window()) is not None:
+        start, end = (parse_iso8601(value) for value in time_range)
+        matched = sorted(
+            (c for c in created_ats if start <= c <= end), reverse=True
+        )[: scanner.limit]
+        windows.append((start, end, len(matched)))
+        scanner.record([format_iso8601(c) for c in matched])
+    return windows
+
+
+class TestAdaptiveTimeWindowScanner:
+    """적응형 주문 목록 조회 구간 테스트"""
+
+    def test_windows_cover_range_without_gaps(self):
+        """구간이 겹치거나 빠진 시간 없이 전체 기간을 덮는지 확인"""
+        # Given
+        scanner = AdaptiveTimeWindowScanner(kst(2024, 1, 1), kst(2024, 3, 1))
+
+        # When
+        windows = scan(scanner, [])
+
+        # Then
+        assert windows[0][0] == kst(2024, 1, 1)
+        assert windows[-1][1] == kst(2024, 3, 1)
+        for (_, previous_end, _), (next_start, _, _) in zip(windows, windows[1:]):
+            assert next_start - previous_end == timedelta(seconds=1)
+        assert all(end - start < timedelta(days=7) for start, end, _ in windows)
+
+    def test_full_window_is_paginated_without_truncation(self):
+        """limit건이 가득 찬 구간은 커서로 이어서 조회하여 누락이 없음"""
+        # Given - 하루에 1분 간격 주문 2500건
+        created_ats = [kst(2024, 1, 2) + timedelta(minutes=i) for i in range(2500)]
+        scanner = AdaptiveTimeWindowScanner(
+            kst(2024, 1, 1), kst(2024, 1, 8), limit=1000
+        )
+
+        # When
+        seen = set()
+        while (time_range := scanner.next_window()) is not None:
+            start, end = (parse_iso8601(value) for value in time_range)
+            matched = sorted(
+                (c for c in created_ats if start <= c <= end), reverse=True
+            )[:1000]
+            seen.update(matched)
+            scanner.record([format_iso8601(c) for c in matched])
+
+        # Then
+        assert seen == set(created_ats)
+
+    def test_width_shrinks_after_full_page_and_widens_when_empty(self):
+        """가득 찬 구간 뒤에는 폭을 줄이고, 빈 구간이 이어지면 최대 폭까지 넓힘"""
+        # Given - 첫 주에만 주문이 몰려 있음
+        created_ats = [kst(2024, 1, 1) + timedelta(minutes=i) for i in range(1500)]
+        scanner = AdaptiveTimeWindowScanner(
+            kst(2024, 1, 1), kst(2024, 3, 1), limit=1000
+        )
+
+        # When
+        scanner.next_window()
+        scanner.record(
+            [format_iso8601(c) for c in sorted(created_ats, reverse=True)[:1000]]
+        )
+        width_after_full_page = scanner.width
+        windows = scan(scanner, created_ats)
+
+        # Then
+        assert width_after_full_page == timedelta(days=3, hours=12)
+        assert scanner.width == timedelta(days=7)
+        assert windows[-1][1] - windows[-1][0] < timedelta(days=7)
+        assert sum(count for _, _, count in windows) >= 500
+
+    def test_same_second_burst_does_not_loop_forever(self):
+        """같은 초에 limit건 이상이 몰려도 커서가 앞으로 진행"""
+        # Given
+        created_ats = [kst(2024, 1, 3)] * 5
+        scanner = AdaptiveTimeWindowScanner(kst(2024, 1, 1), kst(2024, 1, 8), limit=5)
+
+        # When
+        windows = scan(scanner, created_ats)
+
+        # Then
+        assert len(windows) < 10
+        assert scanner.is_done
+
+
+class TestSplitTimeRangeInto:
+    """기간 균등 분할 테스트"""
+
+    def test_contiguous_segments(self):
+        """구간이 1초 간격으로 이어지고 전체 기간을 덮는지 확인"""
+        # When
+        segments = split_time_range_into(kst(2024, 1, 1), kst(2024, 3, 1), 4)
+
+        # Then
+        assert len(segments) == 4
+        assert segments[0][0] == kst(2024, 1, 1)
+        assert segments[-1][1] == kst(2024, 3, 1)
+        for (_, previous_end), (next_start, _) in zip(segments, segments[1:]):
+            assert next_start - previous_end == timedelta(seconds=1)
+
+    def test_short_range_is_not_split_below_min_span(self):
+        """min_span보다 짧게 나누지 않음"""
+        # When
+        segments = split_time_range_into(kst(2024, 1, 1), kst(2024, 1, 10), 4)
+
+        # Then
+        assert segments == [(kst(2024, 1, 1), kst(2024, 1, 10))]
@@ -0,0 +1,269 @@
+import re
+import pytest
+from datetime import datetime
+from unittest.mock import Mock, patch
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateIndex
+import repository.trading_histories_repository as trading_histories_repository_module
+from repository.trading_histories_repository import TradingHistoriesRepository
+from model.TradingHistories import TradingHistories
+
+
+def make_history(i: int) -> TradingHistories:
+    return TradingHistories(
+        user_id="e953a0e1-5466-40b3-9207-cd86b7d95275",
+        coin_id=1,
+        exchange_code=1,
+        trade_uuid=f"uuid-{i}",
+        trade_type=0,
+        price=50000000.0,
+        quantity=0.5,
+        total_price=25000000.0,
+        fee=12500.0,
+        trade_time=datetime(2024, 1, 1, 9, 0, 0),
+    )
+
+
+class TestTradingHistoriesRepositorySave:
+    """거래내역 일괄 저장 테스트"""
+
+    def test_insert_statement_skips_duplicates(self):
+        """uq_user_exchange_trade_uuid 충돌은 건너뛰고 저장된 행을 반환하는 INSERT"""
+        # When
+        statement = TradingHistoriesRepository()._build_insert_statement()
+        sql = str(statement.compile(dialect=postgresql.dialect()))
+
+        # Then
+        assert "ON CONFLICT ON CONSTRAINT uq_user_exchange_trade_uuid DO NOTHING" in sql
+        assert "RETURNING" in sql
+
+    @patch("repository.trading_histories_repository.db")
+    def test_saves_in_chunks_with_single_commit(self, mock_db, monkeypatch):
+        """청크마다 INSERT 한 번, 행 단위 조회/새로고침 없이 한 번만 커밋"""
+        # Given
+        monkeypatch.setattr(
+            trading_histories_repository_module,
+            "TRADING_HISTORIES_INSERT_CHUNK_SIZE",
+            1000,
+        )
+        mock_session = Mock()
+        mock_db.get_session.return_value = mock_session
+        inserted = [make_history(i) for i in range(0, 2500, 2)]
+        mock_session.scalars.return_value.all.side_effect = [
+            inserted[:500],
+            inserted[500:1000],
+            inserted[1000:],
+        ]
+        histories = [make_history(i) for i in range(2500)]
+
+        # When
+        result = TradingHistoriesRepository().save_trading_histories(histories)
+
+        # Then
+        assert mock_session.scalars.call_count == 3
+        chunk_sizes = [len(call.args[1]) for call in mock_session.scalars.call_args_list]
+        assert chunk_sizes == [1000, 1000, 500]
+        assert result == inserted
+        mock_session.query.assert_not_called()
+        mock_session.refresh.assert_not_called()
+        mock_session.commit.assert_called_once()
+        mock_session.close.assert_called_once()
+
+    @patch("repository.trading_histories_repository.db")
+    def test_rollback_on_error(self, mock_db):
+        """저장 실패 시 롤백 후 예외 전달"""
+        # Given
+        mock_session = Mock()
+        mock_db.get_session.return_value = mock_session
+        mock_session.scalars.side_effect = RuntimeError("connection lost")
+
+        # When & Then
+        with pytest.raises(RuntimeError):
+            TradingHistoriesRepository().save_trading_histories([make_history(0)])
+        mock_session.rollback.assert_called_once()
+        mock_session.close.assert_called_once()
+
+
+class TestTradingHistoriesRepositoryBackfill:
+    """COPY 기반 대량 적재 테스트"""
+
+    @patch("repository.trading_histories_repository.db")
+    def test_copies_into_staging_and_merges(self, mock_db):
+        """스테이징 테이블에 COPY 후 충돌을 건너뛰는 INSERT ... SELECT로 병합"""
+        # Given
+        connection = mock_db.engine.raw_connection.return_value
+        cursor = connection.cursor.return_value
+        copied = []
+        cursor.copy_expert.side_effect = lambda sql, file: copied.append(file.read())
+        cursor.rowcount = 2
+        histories = [make_history(0), make_history(1), make_history(2)]
+        histories[2].fee = None
+        histories[2].trade_uuid = "uuid\twith\ttab"
+
+        # When
+        saved_count = TradingHistoriesRepository().backfill_trading_histories(
+            iter(histories)
+        )
+
+        # Then
+        executed = [call.args[0] for call in cursor.execute.call_args_list]
+        assert "CREATE TEMP TABLE" in executed[0]
+        assert "ON CONFLICT ON CONSTRAINT uq_user_exchange_trade_uuid" in executed[1]
+        # created_at은 ORM 기본값만 있으므로 병합 SQL에서 직접 채움
+        assert "created_at)" in executed[1] and "now()" in executed[1]
+        lines = copied[0].splitlines()
+        assert len(lines) == 3
+        assert lines[0].split("\t")[3] == "uuid-0"
+        assert lines[0].split("\t")[-1] == "2024-01-01T09:00:00"
+        assert "uuid\\twith\\ttab" in lines[2]
+        assert lines[2].split("\t")[-2] == "\\N"
+        # 금액/수량은 고정소수점 정수로 적재하고 병합 시 1e-8을 곱함
+        assert lines[0].split("\t")[5:9] == [
+            "5000000000000000",
+            "50000000",
+            "2500000000000000",
+            "1250000000000",
+        ]
+        assert "price * 1e-8" in executed[1]
+        assert saved_count == 2
+        connection.commit.assert_called_once()
+        connection.close.assert_called_once()
+
+    @patch("repository.trading_histories_repository.db")
+    def test_overwrite_keeps_id_and_created_at(self, mock_db):
+        """재처리 병합은 변환 값만 덮어쓰고, 새로 들어가는 행의 created_at은 now()로 채움"""
+        # Given
+        connection = mock_db.engine.raw_connection.return_value
+        cursor = connection.cursor.return_value
+        cursor.copy_expert.side_effect = lambda sql, file: file.read()
+
+        # When
+        TradingHistoriesRepository().backfill_trading_histories(
+            iter([make_history(0)]), overwrite=True
+        )
+
+        # Then
+        merge_sql = cursor.execute.call_args_list[1].args[0]
+        insert_sql, update_sql = merge_sql.split("DO UPDATE SET")
+        assert "created_at)" in insert_sql and "now()" in insert_sql
+        assert "created_at" not in update_sql
+        assert re.search(r"\bid =", update_sql) is None
+
+    def test_fill_merge_sets_created_at(self):
+        """체결 병합은 주문 행에 연결하고 created_at을 now()로 채움"""
+        # Given
+        cursor = Mock()
+        cursor.copy_expert.side_effect = lambda sql, file: file.read()
+
+        # When
+        TradingHistoriesRepository()._copy_trading_fills(cursor, [])
+
+        # Then
+        merge_sql = cursor.execute.call_args_list[-1].args[0]
+        assert "INSERT INTO trading_fills" in merge_sql
+        assert "created_at" in merge_sql and "now()" in merge_sql
+
+    @patch("repository.trading_histories_repository.db")
+    def test_rollback_on_copy_error(self, mock_db):
+        """COPY 실패 시 롤백 후 예외 전달"""
+        # Given
+        connection = mock_db.engine.raw_connection.return_value
+        connection.cursor.return_value.copy_expert.side_effect = RuntimeError(
+            "connection lost"
+        )
+
+        # When & Then
+        with pytest.raises(RuntimeError):
+            TradingHistoriesRepository().backfill_trading_histories([make_history(0)])
+        connection.rollback.assert_called_once()
+        connection.commit.assert_not_called()
+        connection.close.assert_called_once()
+
+
+class TestTradingHistoriesRepositoryPage:
+    """거래내역 커서 페이지 조회 테스트"""
+
+    def test_page_index_matches_keyset_order(self):
+        """(user_id, trade_time DESC, id) 복합 인덱스 정의"""
+        # When
+        index = next(
+            index
+            for index in TradingHistories.__table__.indexes
+            if index.name == "idx_trading_histories_user_time"
+        )
+        sql = str(CreateIndex(index).compile(dialect=postgresql.dialect()))
+
+        # Then
+        assert "(user_id, trade_time DESC, id)" in sql
+
+    def test_money_columns_are_read_as_double(self):
+        """금액/수량은 DB에서 double precision으로 바꿔 조회 (행마다 Decimal을 만들지 않음)"""
+        # Given
+        total_price = next(
+            column
+            for column in trading_histories_repository_module.READ_COLUMNS
+            if column.key == "total_price"
+        )
+
+        # When
+        sql = str(total_price.compile(dialect=postgresql.dialect()))
+
+        # Then
+        assert "CAST(trading_histories.total_price AS FLOAT)" in sql
+        assert "BIGINT" not in sql
+
+    @patch("repository.trading_histories_repository.db")
+    def test_page_query_uses_cursor_and_filters(self, mock_db):
+        """커서 다음 행부터 필터를 적용해 limit만큼 조회"""
+        # Given
+        mock_session = Mock()
+        mock_db.get_session.return_value = mock_session
+        query = mock_session.query.return_value
+        query.filter.return_value = query
+        query.order_by.return_value = query
+        query.limit.return_value = query
+        query.all.return_value = []
+
+        # When
+        TradingHistoriesRepository().find_page_by_user_id(
+            "user-1",
+            101,
+            cursor_trade_time=datetime(2024, 1, 1, 9, 0, 0),
+            cursor_id=10,
+            coin_id=1,
+            trade_type=0,
+        )
+
+        # Then
+        where = " AND ".join(
+            str(condition.compile(dialect=postgresql.dialect()))
+            for call in query.filter.call_args_list
+            for condition in call.args
+        )
+        assert "trading_histories.trade_time <= " in where
+        assert "trading_histories.id > " in where
+        assert "trading_histories.coin_id = " in where
+        assert "trading_histories.trade_type = " in where
+        query.limit.assert_called_once_with(101)
+        mock_session.close.assert_called_once()
+
+    @patch("repository.trading_histories_repository.db")
+    def test_iter_batches_streams_with_yield_per(self, mock_db):
+        """서버 측 커서(yield_per)로 읽어 batch_size씩 전달하고, 중단해도 세션을 닫음"""
+        # Given
+        mock_session = Mock()
+        mock_db.get_session.return_value = mock_session
+        query = mock_session.query.return_value
+        query.filter.return_value = query
+        query.order_by.return_value = query
+        query.yield_per.return_value = iter([make_history(i) for i in range(25)])
+
+        # When
+        batches = TradingHistoriesRepository().iter_batches_by_user_id("user-1", 10)
+        first = next(batches)
+        batches.close()
+
+        # Then
+        query.yield_per.assert_called_once_with(10)
+        assert len(first) == 10
+        mock_session.close.assert_called_once()
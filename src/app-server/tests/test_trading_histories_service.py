@@ -0,0 +1,804 @@
+import asyncio
+import json
+import pytest
+from collections import namedtuple
+from datetime import timedelta
+from types import SimpleNamespace
+from unittest.mock import Mock
+import service.trading_histories_service as trading_histories_module
+import service.upbit_service as upbit_service_module
+import utils.order_transform as order_transform_module
+from service.trading_histories_service import TradingHistoriesService
+from service.upbit_service import UpbitService
+from utils.upbit_http_client import UpbitHttpClient, UpbitHttpClientError
+from utils.async_upbit_http_client import AsyncUpbitHttpClient
+from utils.rate_limiter import TokenBucketRateLimiter
+from utils.response_cache import InMemoryResponseCache
+from utils.coin_registry import CoinRegistry
+from utils.fixed_point import fixed_to_float
+from utils.time_utils import get_current_korea_time, parse_iso8601
+from tests.fake_upbit_server import FakeUpbitServer, make_order
+
+
+# TradingHistoriesRepository.READ_COLUMNS 순서의 조회 행
+HistoryRow = namedtuple(
+    "HistoryRow",
+    "id coin_id exchange_code trade_uuid trade_type price quantity total_price "
+    "fee trade_time created_at",
+)
+
+
+class InMemorySyncCursorRepository:
+    """TradingSyncCursorRepository와 같은 인터페이스의 메모리 저장소"""
+
+    def __init__(self):
+        self.cursors = {}
+
+    def find_by_user_and_exchange(self, user_id, exchange_code):
+        return self.cursors.get((user_id, exchange_code))
+
+    def save_checkpoint(self, user_id, exchange_code, last_window_end, pending_uuids):
+        self.cursors[(user_id, exchange_code)] = SimpleNamespace(
+            last_window_end=last_window_end, pending_uuids=list(pending_uuids)
+        )
+
+
+class InMemoryOrderPayloadsRepository:
+    """TradingOrderPayloadsRepository와 같은 인터페이스의 메모리 저장소"""
+
+    def __init__(self):
+        self.payloads = {}  # (user_id, exchange_code, uuid) → (id, JSON 문자열)
+
+    def save_payloads(self, user_id, exchange_code, orders):
+        for order in orders:
+            key = (user_id, exchange_code, order["uuid"])
+            payload_id = self.payloads.get(key, (len(self.payloads) + 1, None))[0]
+            self.payloads[key] = (payload_id, json.dumps(order))
+        return len(orders)
+
+    def _rows(self, user_id, exchange_code):
+        return sorted(
+            row
+            for key, row in self.payloads.items()
+            if key[:2] == (user_id, exchange_code)
+        )
+
+    def find_range_starts(self, user_id, exchange_code, batch_size):
+        return [row[0] for row in self._rows(user_id, exchange_code)[::batch_size]]
+
+    def find_payload_texts(self, user_id, exchange_code, start_id, end_id=None):
+        return [
+            payload
+            for payload_id, payload in self._rows(user_id, exchange_code)
+            if payload_id >= start_id and (end_id is None or payload_id < end_id)
+        ]
+
+
+class RecordingAsyncUpbitHttpClient(AsyncUpbitHttpClient):
+    """요청을 기록하고, 지정한 번째 주문 목록 조회에서 실패하는 클라이언트"""
+
+    def __init__(self, *args, fail_on_closed_call=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fail_on_closed_call = fail_on_closed_call
+        self.closed_calls = 0
+        self.closed_start_times = []
+        self.requested_uuids = []
+        self.events = []
+        self.closed_delay = 0.0
+
+    async def get(self, endpoint, access_key, secret_key, params=None, *args, **kwargs):
+        self.events.append(endpoint)
+        if endpoint == "/v1/orders/closed":
+            await asyncio.sleep(self.closed_delay)
+            self.closed_calls += 1
+            self.closed_start_times.append(params["start_time"])
+            if self.closed_calls == self.fail_on_closed_call:
+                raise UpbitHttpClientError("connection reset", 500)
+        if endpoint == "/v1/orders/uuids":
+            self.requested_uuids.extend(params["uuids[]"])
+        return await super().get(
+            endpoint, access_key, secret_key, params, *args, **kwargs
+        )
+
+
+class SavedTradingHistoriesRepository:
+    """저장된 거래내역으로 변경분 조회를 흉내 내는 저장소"""
+
+    def __init__(self):
+        self.rows = []
+
+    def add(self, histories):
+        # uq_user_exchange_trade_uuid처럼 이미 저장된 주문은 건너뜀
+        saved_uuids = {row.trade_uuid for row in self.rows}
+        for history in histories:
+            if history.trade_uuid in saved_uuids:
+                continue
+            self.rows.append(
+                HistoryRow(
+                    id=len(self.rows) + 1,
+                    coin_id=history.coin_id,
+                    exchange_code=history.exchange_code,
+                    trade_uuid=history.trade_uuid,
+                    trade_type=history.trade_type,
+                    # READ_COLUMNS의 금액/수량은 DB에서 float로 조회
+                    price=fixed_to_float(history.price),
+                    quantity=fixed_to_float(history.quantity),
+                    total_price=fixed_to_float(history.total_price),
+                    fee=fixed_to_float(history.fee),
+                    trade_time=history.trade_time,
+                    created_at=None,
+                )
+            )
+
+    def find_trade_uuids(self, user_id, exchange_code, since=None):
+        return {
+            row.trade_uuid
+            for row in self.rows
+            if since is None or row.trade_time.replace(tzinfo=None) >= since
+        }
+
+    def find_max_id_by_user_id(self, user_id):
+        return len(self.rows)
+
+    def find_rows_after_id(self, user_id, after_id, limit):
+        return self.rows[after_id : after_id + limit]
+
+    def count_by_user_id(self, user_id):
+        return len(self.rows)
+
+
+@pytest.fixture
+def fake_upbit_server():
+    """최근 20일 동안 15시간 간격으로 체결된 주문 30개를 가진 가짜 서버"""
+    now = get_current_korea_time().replace(microsecond=0)
+    orders = {}
+    for i in range(30):
+        uuid = f"uuid-{i:04d}"
+        created_at = (now - timedelta(hours=15 * (i + 1))).isoformat()
+        orders[uuid] = make_order(uuid, created_at=created_at)
+    server = FakeUpbitServer(orders=orders, requests_per_second=50).start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def sync_context(fake_upbit_server, tmp_path):
+    """외부 의존성을 가짜 서버와 메모리 저장소로 바꾼 TradingHistoriesService"""
+    rate_limiter = TokenBucketRateLimiter(
+        state_dir=str(tmp_path), group_rates={"default": 50}
+    )
+    async_client = RecordingAsyncUpbitHttpClient(
+        base_url=fake_upbit_server.base_url, rate_limiter=rate_limiter
+    )
+    upbit_service = UpbitService(
+        UpbitHttpClient(base_url=fake_upbit_server.base_url, rate_limiter=rate_limiter),
+        async_client,
+    )
+
+    service = TradingHistoriesService()
+    service._upbit_service = upbit_service
+    service._sync_cursor_repository = InMemorySyncCursorRepository()
+    service._order_payloads_repository = InMemoryOrderPayloadsRepository()
+    service._exchange_credentials_service = Mock()
+    service._exchange_credentials_service.get_credentials.return_value = (
+        SimpleNamespace(access_key="access", secret_key="secret")
+    )
+    service._user_service = Mock()
+    service._user_service.user_repository.find_by_id.return_value = SimpleNamespace(
+        last_trading_history_update_at=(
+            get_current_korea_time() - timedelta(days=20)
+        ).replace(tzinfo=None)
+    )
+
+    coin_repository = Mock()
+    coin_repository.get_all_coins.return_value = [
+        SimpleNamespace(id=1, symbol="BTC", market_code="KRW-BTC")
+    ]
+    service._coin_registry = CoinRegistry(coin_repository=coin_repository)
+
+    saved = []
+    service._trading_repository = SavedTradingHistoriesRepository()
+
+    def save_trading_histories(histories, trading_fills=None):
+        saved.extend(history.trade_uuid for history in histories)
+        service.trading_repository.add(histories)
+        return histories
+
+    service.save_trading_histories = save_trading_histories
+
+    yield SimpleNamespace(service=service, async_client=async_client, saved=saved)
+
+
+class TestTradingHistoriesSyncCheckpoint:
+    """체크포인트 기반 이어받기 동기화 테스트 (구간 순차 조회)"""
+
+    payload = {"user_id": "user-1", "exchange_provider": "UPBIT"}
+
+    @pytest.fixture(autouse=True)
+    def sequential_scan(self, monkeypatch):
+        monkeypatch.setattr(upbit_service_module, "UPBIT_WINDOW_SCAN_PARALLELISM", 1)
+
+    @pytest.mark.asyncio
+    async def test_resumes_after_window_scan_failure(self, fake_upbit_server, sync_context):
+        """주문 목록 조회 중 실패하면 다음 실행은 끝난 구간을 다시 조회하지 않음"""
+        # Given - 3개 구간 중 3번째 구간 조회에서 실패
+        service = sync_context.service
+        sync_context.async_client.fail_on_closed_call = 3
+        with pytest.raises(UpbitHttpClientError):
+            await service.sync_trading_histories(self.payload)
+
+        cursor = service.sync_cursor_repository.find_by_user_and_exchange("user-1", 1)
+        assert cursor.last_window_end is not None
+        assert len(cursor.pending_uuids) > 0
+        assert sync_context.saved == []
+
+        # When
+        sync_context.async_client.fail_on_closed_call = None
+        sync_context.async_client.closed_calls = 0
+        result = await service.sync_trading_histories(self.payload)
+        await sync_context.async_client.aclose()
+
+        # Then - 남은 1개 구간만 조회하고 모든 주문을 한 번씩 저장
+        assert sync_context.async_client.closed_calls == 1
+        assert parse_iso8601(
+            sync_context.async_client.closed_start_times[-1]
+        ) == cursor.last_window_end + timedelta(seconds=1)
+        assert sorted(sync_context.saved) == sorted(fake_upbit_server.orders)
+        assert result["saved_count"] == 30
+        cursor = service.sync_cursor_repository.find_by_user_and_exchange("user-1", 1)
+        assert cursor.pending_uuids == []
+
+    @pytest.mark.asyncio
+    async def test_resumes_pending_uuids_after_save_failure(
+        self, fake_upbit_server, sync_context, monkeypatch
+    ):
+        """저장 중 실패하면 저장을 마친 묶음의 주문 상세는 다시 조회하지 않음"""
+        # Given - 10개씩 처리하고 두 번째 묶음 저장에서 실패
+        monkeypatch.setattr(
+            trading_histories_module, "TRADING_SYNC_DETAIL_CHUNK_SIZE", 10
+        )
+        service = sync_context.service
+        save_trading_histories = service.save_trading_histories
+        save_calls = 0
+
+        def failing_save(histories, trading_fills=None):
+            nonlocal save_calls
+            save_calls += 1
+            if save_calls == 2:
+                raise RuntimeError("database unavailable")
+            return save_trading_histories(histories, trading_fills)
+
+        service.save_trading_histories = failing_save
+        with pytest.raises(RuntimeError):
+            await service.sync_trading_histories(self.payload)
+
+        cursor = service.sync_cursor_repository.find_by_user_and_exchange("user-1", 1)
+        first_run_uuids = list(sync_context.async_client.requested_uuids)
+        assert set(first_run_uuids[:10]).isdisjoint(cursor.pending_uuids)
+        # 파이프라인은 한 묶음씩 진행하므로 실패한 묶음 뒤의 주문 상세는 조회하지 않음
+        assert len(first_run_uuids) == 20
+
+        # When
+        sync_context.async_client.requested_uuids = []
+        sync_context.async_client.closed_calls = 0
+        result = await service.sync_trading_histories(self.payload)
+        await sync_context.async_client.aclose()
+
+        # Then - 저장된 첫 묶음은 다시 조회하지 않음
+        assert set(first_run_uuids[:10]).isdisjoint(
+            sync_context.async_client.requested_uuids
+        )
+        assert len(sync_context.async_client.requested_uuids) == 20
+        assert sorted(sync_context.saved) == sorted(fake_upbit_server.orders)
+        assert result["saved_count"] == 20
+
+        # 결과에는 이번 실행에서 저장된 행만 담기고 전체 건수는 세지 않음
+        assert result["total_count"] is None
+        assert result["count"] == 20
+        assert {history["trade_uuid"] for history in result["trading_histories"]} == (
+            set(sync_context.saved[10:])
+        )
+
+
+class TestTradingHistoriesSyncStreaming:
+    """주문 목록 병렬 조회와 주문 상세 조회 파이프라인 테스트"""
+
+    payload = {"user_id": "user-1", "exchange_provider": "UPBIT"}
+
+    @pytest.mark.asyncio
+    async def test_detail_fetch_starts_before_scan_finishes(
+        self, fake_upbit_server, sync_context, monkeypatch
+    ):
+        """주문 목록 조회가 끝나기 전에 주문 상세 조회가 시작되고 결과는 중복 없음"""
+        # Given - 80일 동안 15시간 간격 주문 120개, 4개 구간 병렬 조회, 10개씩 저장
+        # (주문 목록 응답마다 20ms 지연)
+        now = get_current_korea_time().replace(microsecond=0)
+        fake_upbit_server.orders = {
+            f"uuid-{i:04d}": make_order(
+                f"uuid-{i:04d}",
+                created_at=(now - timedelta(hours=15 * (i + 1))).isoformat(),
+            )
+            for i in range(120)
+        }
+        sync_context.service._user_service.user_repository.find_by_id.return_value = (
+            SimpleNamespace(
+                last_trading_history_update_at=(now - timedelta(days=80)).replace(
+                    tzinfo=None
+                )
+            )
+        )
+        monkeypatch.setattr(
+            trading_histories_module, "TRADING_SYNC_DETAIL_CHUNK_SIZE", 10
+        )
+        client = sync_context.async_client
+        client.closed_delay = 0.02
+
+        # When
+        result = await sync_context.service.sync_trading_histories(self.payload)
+        await client.aclose()
+
+        # Then
+        first_detail = client.events.index("/v1/orders/uuids")
+        last_scan = len(client.events) - 1 - client.events[::-1].index(
+            "/v1/orders/closed"
+        )
+        assert first_detail < last_scan
+        assert len(set(client.closed_start_times)) == client.closed_calls
+        assert sorted(sync_context.saved) == sorted(fake_upbit_server.orders)
+        assert result["saved_count"] == 120
+
+
+class TestTradingHistoriesProcess:
+    """주문 상세 → 저장용 행 변환 테스트"""
+
+    def test_unknown_market_raises_value_error(self, sync_context):
+        """코인 목록을 다시 불러와도 없는 마켓이면 KeyError 대신 ValueError"""
+        # Given
+        order = make_order("uuid-x", created_at=get_current_korea_time().isoformat())
+        order["market"] = "KRW-NONE"
+
+        # When & Then
+        with pytest.raises(ValueError):
+            sync_context.service.process_trading_histories("user-1", "UPBIT", [order])
+
+
+class TestTradingHistoriesSyncBackfill:
+    """첫 동기화 대량 적재 테스트"""
+
+    payload = {"user_id": "user-1", "exchange_provider": "UPBIT"}
+
+    @pytest.mark.asyncio
+    async def test_first_sync_uses_backfill(self, fake_upbit_server, sync_context):
+        """체크포인트와 마지막 업데이트 시간이 없으면 COPY 적재로 저장"""
+        # Given
+        service = sync_context.service
+        service._user_service.user_repository.find_by_id.return_value = (
+            SimpleNamespace(last_trading_history_update_at=None)
+        )
+        backfilled = []
+        backfilled_fills = []
+
+        def backfill_trading_histories(histories, trading_fills=None):
+            backfilled.extend(history.trade_uuid for history in histories)
+            backfilled_fills.extend(trading_fills)
+            service.trading_repository.add(histories)
+            return len(histories)
+
+        service.backfill_trading_histories = backfill_trading_histories
+
+        # When
+        result = await service.sync_trading_histories(self.payload)
+        await sync_context.async_client.aclose()
+
+        # Then
+        assert sync_context.saved == []
+        assert sorted(backfilled) == sorted(fake_upbit_server.orders)
+        assert result["saved_count"] == 30
+        # 주문마다 체결 행이 같은 적재 호출로 함께 전달됨
+        assert sorted(fill.order_uuid for fill in backfilled_fills) == sorted(
+            fake_upbit_server.orders
+        )
+
+
+class TestTradingHistoriesReprocess:
+    """보관된 주문 원본 재처리 테스트"""
+
+    payload = {"user_id": "user-1", "exchange_provider": "UPBIT"}
+
+    @pytest.mark.asyncio
+    async def test_rebuilds_from_archive_without_network(
+        self, fake_upbit_server, sync_context, monkeypatch
+    ):
+        """동기화 때 보관한 원본만으로 바뀐 변환 로직을 다시 적용"""
+        # Given - 동기화로 원본 30개 보관 후 매도/매수 매핑이 바뀜
+        service = sync_context.service
+        await service.sync_trading_histories(self.payload)
+        await sync_context.async_client.aclose()
+        request_count = len(sync_context.async_client.events)
+
+        monkeypatch.setitem(order_transform_module.SIDE_TO_TRADE_TYPE, "bid", 1)
+        rebuilt = []
+        rebuilt_fills = []
+
+        def backfill_trading_histories(histories, trading_fills=None, overwrite=False):
+            assert overwrite
+            rebuilt.extend(histories)
+            rebuilt_fills.extend(trading_fills)
+            return len(histories)
+
+        service.backfill_trading_histories = backfill_trading_histories
+
+        # When - 7개씩 구간을 나눠 현재 프로세스에서 처리
+        result = await asyncio.to_thread(
+            service.reprocess_trading_histories,
+            "user-1",
+            "UPBIT",
+            workers=1,
+            batch_size=7,
+        )
+
+        # Then
+        assert len(sync_context.async_client.events) == request_count
+        assert result["order_count"] == 30
+        assert result["saved_count"] == 30
+        assert result["batch_count"] == 5
+        assert sorted(history.trade_uuid for history in rebuilt) == sorted(
+            fake_upbit_server.orders
+        )
+        assert {history.trade_type for history in rebuilt} == {1}
+        # 보관된 원본은 주문 목록 항목 그대로이고, 체결은 재처리 때 합계로 만듦
+        archived = [
+            json.loads(payload)
+            for _, payload in service.order_payloads_repository.payloads.values()
+        ]
+        assert all("trades" not in order for order in archived)
+        assert {(h.quantity, h.total_price) for h in rebuilt} == {
+            (50000000, 2500000000000000)
+        }
+        assert sorted(fill.trade_uuid for fill in rebuilt_fills) == sorted(
+            fake_upbit_server.orders
+        )
+
+    def test_empty_archive(self, sync_context):
+        """보관된 원본이 없으면 아무것도 하지 않음"""
+        result = sync_context.service.reprocess_trading_histories(
+            "user-1", "UPBIT", workers=1
+        )
+
+        assert result["order_count"] == 0
+        assert result["batch_count"] == 0
+
+
+class TestTradingHistoriesSyncDedupe:
+    """이미 저장된 주문 상세 조회 생략 테스트"""
+
+    payload = {"user_id": "user-1", "exchange_provider": "UPBIT"}
+
+    @pytest.mark.asyncio
+    async def test_rescan_fetches_only_new_orders(
+        self, fake_upbit_server, sync_context, monkeypatch
+    ):
+        """겹치는 구간을 다시 조회해도 저장된 주문은 상세 조회하지 않음"""
+        # Given - 첫 동기화 후 새 주문 3개 체결, 체크포인트 없이 같은 구간 다시 조회
+        monkeypatch.setattr(upbit_service_module, "UPBIT_ORDERS_UUIDS_BATCH_SIZE", 10)
+        service = sync_context.service
+        await service.sync_trading_histories(self.payload)
+
+        now = get_current_korea_time().replace(microsecond=0)
+        for i in range(3):
+            uuid = f"new-{i}"
+            fake_upbit_server.orders[uuid] = make_order(
+                uuid, created_at=(now - timedelta(minutes=i + 1)).isoformat()
+            )
+        service.sync_cursor_repository.cursors.clear()
+        sync_context.async_client.requested_uuids.clear()
+
+        # When
+        result = await service.sync_trading_histories(self.payload)
+        await sync_context.async_client.aclose()
+
+        # Then - 33개 중 새 주문 3개만 상세 조회 (10개씩 4회 → 1회)
+        assert sorted(sync_context.async_client.requested_uuids) == [
+            "new-0",
+            "new-1",
+            "new-2",
+        ]
+        assert result["saved_count"] == 3
+        assert result["skipped_count"] == 30
+        assert result["requests_saved"] == 3
+
+    @pytest.mark.asyncio
+    async def test_loads_only_uuids_overlapping_scan(self, sync_context):
+        """조회 시작 시간이 있으면 그 이후 체결분의 uuid만 불러옴"""
+        # Given
+        service = sync_context.service
+        service._trading_repository = Mock(wraps=service.trading_repository)
+
+        # When
+        await service.sync_trading_histories(self.payload)
+        await sync_context.async_client.aclose()
+
+        # Then
+        user = service.user_service.user_repository.find_by_id.return_value
+        service.trading_repository.find_trade_uuids.assert_called_once_with(
+            "user-1", 1, user.last_trading_history_update_at - timedelta(days=1)
+        )
+
+
+class InMemoryTradingHistoriesRepository:
+    """find_page_by_user_id를 메모리 목록으로 흉내 내는 저장소"""
+
+    def __init__(self, histories):
+        self.histories = histories
+        self.calls = []
+
+    def find_page_by_user_id(
+        self, user_id, limit, cursor_trade_time=None, cursor_id=None, **filters
+    ):
+        self.calls.append(dict(limit=limit, cursor_id=cursor_id, **filters))
+        rows = sorted(self.histories, key=lambda h: (-h.trade_time.timestamp(), h.id))
+        if cursor_id is not None:
+            rows = [
+                h
+                for h in rows
+                if h.trade_time < cursor_trade_time
+                or (h.trade_time == cursor_trade_time and h.id > cursor_id)
+            ]
+        return rows[:limit]
+
+    def find_rows_by_user_id(self, user_id):
+        self.calls.append(dict(user_id=user_id))
+        return sorted(self.histories, key=lambda h: -h.trade_time.timestamp())
+
+    def iter_batches_by_user_id(self, user_id, batch_size, **filters):
+        self.calls.append(dict(batch_size=batch_size, **filters))
+        rows = sorted(self.histories, key=lambda h: (-h.trade_time.timestamp(), h.id))
+        for i in range(0, len(rows), batch_size):
+            yield rows[i : i + batch_size]
+
+
+@pytest.fixture
+def history_service():
+    """체결시간이 2개씩 겹치는 거래내역 25개를 가진 메모리 저장소 서비스"""
+    now = get_current_korea_time().replace(microsecond=0, tzinfo=None)
+    histories = [
+        HistoryRow(
+            id=i,
+            coin_id=1,
+            exchange_code=1,
+            trade_uuid=f"uuid-{i}",
+            trade_type=i % 2,
+            # READ_COLUMNS의 금액/수량은 DB에서 float로 조회
+            price=50000000.5,
+            quantity=0.00012345,
+            total_price=6172.5,
+            fee=None,
+            # 같은 체결시간이 2개씩 있도록 생성
+            trade_time=now - timedelta(minutes=i // 2),
+            created_at=None,
+        )
+        for i in range(25)
+    ]
+    service = TradingHistoriesService()
+    service._trading_repository = InMemoryTradingHistoriesRepository(histories)
+    return service
+
+
+class TestTradingHistoriesPage:
+    """거래내역 커서 페이지 조회 테스트"""
+
+    def test_pages_cover_all_rows_once(self, history_service):
+        """next_cursor를 따라가면 같은 체결시간이 있어도 모든 행을 한 번씩 조회"""
+        # When
+        ids = []
+        cursor = None
+        while True:
+            page = history_service.get_trading_histories_page(
+                "user-1", cursor=cursor, limit=4
+            )
+            ids.extend(history["id"] for history in page["trading_histories"])
+            if not page["has_next"]:
+                break
+            cursor = page["next_cursor"]
+
+        # Then
+        assert ids == list(range(25))
+        assert page["next_cursor"] is None
+        assert page["count"] == 1
+
+    def test_passes_filters_and_fetches_one_extra_row(self, history_service):
+        """필터는 저장소에 그대로 전달하고 다음 페이지 확인용으로 한 행 더 조회"""
+        # When
+        history_service.get_trading_histories_page(
+            "user-1", limit=10, coin_id=1, trade_type=0, exchange_code=1
+        )
+
+        # Then
+        call = history_service.trading_repository.calls[-1]
+        assert call["limit"] == 11
+        assert call["coin_id"] == 1
+        assert call["trade_type"] == 0
+        assert call["exchange_code"] == 1
+
+    def test_invalid_cursor(self, history_service):
+        """잘못된 커서는 ValueError"""
+        with pytest.raises(ValueError):
+            history_service.get_trading_histories_page(
+                "user-1", cursor="not-a-cursor"
+            )
+
+
+class TestTradingHistoriesStream:
+    """전체 거래내역 스트리밍 테스트"""
+
+    @pytest.fixture
+    def service(self, history_service, monkeypatch):
+        monkeypatch.setattr(
+            trading_histories_module, "TRADING_HISTORY_STREAM_BATCH_SIZE", 10
+        )
+        return history_service
+
+    def test_ndjson_streams_one_row_per_line(self, service):
+        """DB 배치마다 한 덩어리씩, 한 줄에 한 행"""
+        # When
+        chunks = list(service.iter_trading_histories_ndjson("user-1", coin_id=1))
+
+        # Then
+        assert len(chunks) == 3
+        rows = [json.loads(line) for line in b"".join(chunks).splitlines()]
+        assert [row["id"] for row in rows] == list(range(25))
+        assert service.trading_repository.calls[-1]["coin_id"] == 1
+
+    def test_json_array_is_valid_json(self, service):
+        """나눠 보낸 조각을 이으면 하나의 JSON 배열"""
+        # When
+        body = b"".join(service.iter_trading_histories_json_array("user-1"))
+
+        # Then
+        assert [row["id"] for row in json.loads(body)] == list(range(25))
+
+    def test_rows_are_converted_to_response_values(self, service):
+        """고정소수점 정수는 float, 시간은 ISO 문자열, 수수료가 없으면 0"""
+        # When
+        first_chunk = next(service.iter_trading_histories_ndjson("user-1"))
+        row = json.loads(first_chunk.splitlines()[0])
+
+        # Then
+        assert row["price"] == 50000000.5
+        assert row["quantity"] == 0.00012345
+        assert row["fee"] == 0.0
+        first = service.trading_repository.histories[0]
+        assert row["trade_time"] == first.trade_time.isoformat()
+        assert row["created_at"] is None
+
+
+class TestTradingHistoriesResponseCache:
+    """거래내역 조회 응답 캐시 테스트"""
+
+    @pytest.fixture
+    def service(self, history_service):
+        history_service._response_cache = InMemoryResponseCache()
+        history_service._response_cache_loaded = True
+        repository = history_service.trading_repository
+        repository.save_trading_histories = (
+            lambda histories, trading_fills=None: histories
+        )
+        repository.delete_by_user_and_exchange = lambda user_id, exchange_code: True
+        return history_service
+
+    def test_repeated_page_is_served_from_cache(self, service):
+        """같은 사용자/조건 페이지는 DB를 다시 조회하지 않음"""
+        # When
+        first = service.get_trading_histories_page("user-1", limit=5)
+        second = service.get_trading_histories_page("user-1", limit=5)
+        service.get_trading_histories_page("user-1", limit=5, trade_type=1)
+
+        # Then - 조건이 다른 페이지만 다시 조회
+        assert second == first
+        assert len(service.trading_repository.calls) == 2
+
+    def test_save_and_delete_invalidate_user_pages(self, service):
+        """저장/삭제가 일어난 사용자의 캐시만 무효화"""
+        # Given
+        service.get_trading_histories_page("user-1", limit=5)
+        service.get_trading_histories_page("user-2", limit=5)
+
+        # When
+        service.save_trading_histories([SimpleNamespace(user_id="user-1")])
+        service.get_trading_histories_page("user-1", limit=5)
+        service.get_trading_histories_page("user-2", limit=5)
+        service.delete_trading_histories("user-2", "UPBIT")
+        service.get_trading_histories_page("user-2", limit=5)
+
+        # Then
+        assert len(service.trading_repository.calls) == 4
+
+    def test_whole_history_is_cached_until_save(self, service):
+        """전체 거래내역 응답도 캐시하고 저장 시 무효화"""
+        # When
+        first = service.get_all_trading_histories_by_user_formatted("user-1")
+        second = service.get_all_trading_histories_by_user_formatted("user-1")
+        service.save_trading_histories([SimpleNamespace(user_id="user-1")])
+        service.get_all_trading_histories_by_user_formatted("user-1")
+
+        # Then
+        assert first["total_count"] == 25
+        assert second == first
+        assert len(service.trading_repository.calls) == 2
+
+
+class TestTradingHistoriesDelta:
+    """동기화 이후 신규 거래내역(변경분) 조회 테스트"""
+
+    payload = {"user_id": "user-1", "exchange_provider": "UPBIT"}
+
+    @pytest.mark.asyncio
+    async def test_sync_result_contains_only_new_rows(
+        self, fake_upbit_server, sync_context
+    ):
+        """두 번째 동기화 결과에는 새로 체결된 주문만 담기고 sync_cursor로 이어받음"""
+        # Given - 첫 동기화
+        service = sync_context.service
+        first = await service.sync_trading_histories(self.payload)
+        assert first["count"] == 30
+
+        # When - 새 주문 3개 체결 후 이전 sync_cursor로 동기화
+        now = get_current_korea_time().replace(microsecond=0)
+        for i in range(3):
+            uuid = f"new-{i}"
+            fake_upbit_server.orders[uuid] = make_order(
+                uuid, created_at=(now - timedelta(minutes=i + 1)).isoformat()
+            )
+        service.sync_cursor_repository.cursors.clear()
+        second = await service.sync_trading_histories(
+            {**self.payload, "sync_cursor": first["sync_cursor"]}
+        )
+        await sync_context.async_client.aclose()
+
+        # Then
+        assert second["total_count"] is None
+        assert second["saved_count"] == 3
+        assert second["count"] == 3
+        assert second["has_next"] is False
+        assert {history["trade_uuid"] for history in second["trading_histories"]} == {
+            "new-0",
+            "new-1",
+            "new-2",
+        }
+
+    def test_delta_pages_with_sync_cursor(self, sync_context):
+        """limit을 넘는 변경분은 sync_cursor로 이어서 조회"""
+        # Given
+        service = sync_context.service
+        service.trading_repository.rows = [
+            HistoryRow(
+                i, 1, 1, f"uuid-{i}", 0, 1, 1, 1, 0, get_current_korea_time(), None
+            )
+            for i in range(1, 6)
+        ]
+
+        # When
+        first = service.get_trading_histories_delta("user-1", limit=3)
+        second = service.get_trading_histories_delta(
+            "user-1", sync_cursor=first["sync_cursor"], limit=3
+        )
+        last = service.get_trading_histories_delta(
+            "user-1", sync_cursor=second["sync_cursor"], limit=3
+        )
+
+        # Then
+        assert [h["id"] for h in first["trading_histories"]] == [1, 2, 3]
+        assert first["has_next"] is True
+        assert [h["id"] for h in second["trading_histories"]] == [4, 5]
+        assert second["has_next"] is False
+        assert last["count"] == 0
+        assert last["sync_cursor"] == second["sync_cursor"]
+        assert first["total_count"] is None
+        assert (
+            service.get_trading_histories_delta("user-1", include_total_count=True)[
+                "total_count"
+            ]
+            == 5
+        )
+        with pytest.raises(ValueError):
+            service.get_trading_histories_delta("user-1", sync_cursor="bad")
@@ -0,0 +1,452 @@
+import asyncio
+import socket
+import time
+from datetime import timedelta
+import pytest
+from service.upbit_service import UpbitService
+from utils.upbit_http_client import UpbitHttpClient, UpbitHttpClientError
+from utils.async_upbit_http_client import AsyncUpbitHttpClient
+from utils.rate_limiter import TokenBucketRateLimiter
+from utils.http_client import Http_client
+from utils.order_transform import flatten_fills
+from utils.sync_state_store import FileSyncStateStore
+from utils.time_utils import get_current_korea_time
+from tests.fake_upbit_server import FakeUpbitServer, make_order
+
+
+@pytest.fixture
+def fake_upbit_server():
+    """초당 요청 한도를 가진 로컬 업비트 서버"""
+    orders = {f"uuid-{i:04d}": make_order(f"uuid-{i:04d}") for i in range(60)}
+    server = FakeUpbitServer(orders=orders, requests_per_second=20).start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def upbit_http_client(fake_upbit_server, tmp_path):
+    """가짜 서버와 같은 한도(초당 20회)를 가진 UpbitHttpClient"""
+    rate_limiter = TokenBucketRateLimiter(
+        state_dir=str(tmp_path), group_rates={"default": 20}
+    )
+    return UpbitHttpClient(
+        base_url=fake_upbit_server.base_url, rate_limiter=rate_limiter
+    )
+
+
+class TestUpbitServiceConcurrentFetch:
+    """주문 상세 동시 조회 테스트"""
+
+    def test_results_keep_uuid_order(self, fake_upbit_server, upbit_http_client):
+        """결과가 입력 uuid 순서대로 반환되는지 확인"""
+        # Given
+        service = UpbitService(upbit_http_client)
+        uuids = list(fake_upbit_server.orders.keys())
+
+        # When
+        result = service.fetch_all_trading_history_concurrent(
+            "access", "secret", uuids, max_workers=8
+        )
+
+        # Then
+        assert [order["uuid"] for order in result] == uuids
+
+    def test_respects_requests_per_second(self, fake_upbit_server, upbit_http_client):
+        """초당 요청 한도를 넘지 않고 예산을 채워서 조회하는지 확인"""
+        # Given
+        service = UpbitService(upbit_http_client)
+        uuids = list(fake_upbit_server.orders.keys())
+
+        # When
+        started_at = time.monotonic()
+        result = service.fetch_all_trading_history_concurrent(
+            "access", "secret", uuids, max_workers=8
+        )
+        elapsed = time.monotonic() - started_at
+
+        # Then - 60건 / 초당 20건 → 최소 2초, 순차 조회(5건/초)보다 빠름
+        # 윈도우 경계에서 발생한 429는 재시도로 복구되어야 함
+        assert len(result) == 60
+        assert fake_upbit_server.rejected_count <= 3
+        assert 2.0 <= elapsed < 6.0
+
+    def test_empty_uuids(self, fake_upbit_server, upbit_http_client):
+        """빈 uuid 목록이면 요청 없이 빈 리스트 반환"""
+        # Given
+        service = UpbitService(upbit_http_client)
+
+        # When
+        result = service.fetch_all_trading_history_concurrent("access", "secret", [])
+
+        # Then
+        assert result == []
+        assert fake_upbit_server.request_count == 0
+
+
+class TestUpbitServiceBatchedFetch:
+    """/v1/orders/uuids 일괄 조회 테스트"""
+
+    def test_batches_of_100(self, fake_upbit_server, upbit_http_client):
+        """uuid 250개 → 요청 3회로 조회하고 uuids 순서 유지"""
+        # Given
+        for i in range(60, 250):
+            uuid = f"uuid-{i:04d}"
+            fake_upbit_server.orders[uuid] = make_order(uuid)
+        service = UpbitService(upbit_http_client)
+        uuids = list(fake_upbit_server.orders.keys())
+
+        # When
+        result = service.fetch_all_trading_history_batched("access", "secret", uuids)
+
+        # Then
+        assert fake_upbit_server.request_count == 3
+        assert [order["uuid"] for order in result] == uuids
+
+    def test_single_fill_order_is_kept_as_list_item(
+        self, fake_upbit_server, upbit_http_client
+    ):
+        """한 번에 체결된 주문은 주문 목록 항목 원본 그대로 반환 (trades는 변환 단계에서 합성)"""
+        # Given
+        trades = [{"volume": "2", "funds": "50000000.00000001"}]
+        order = make_order("uuid-a", trades=trades)
+        fake_upbit_server.orders = {"uuid-a": order}
+        service = UpbitService(upbit_http_client)
+
+        # When
+        result = service.fetch_all_trading_history_batched(
+            "access", "secret", ["uuid-a"]
+        )
+
+        # Then
+        assert result == [fake_upbit_server._to_list_item(order)]
+        assert "trades" not in result[0]
+        assert flatten_fills(result).prices == [2500000000000001]
+        assert fake_upbit_server.request_count == 1
+
+    def test_multi_fill_order_fetches_trades(
+        self, fake_upbit_server, upbit_http_client
+    ):
+        """여러 번 체결된 주문은 /v1/order로 개별 체결을 받아옴"""
+        # Given
+        trades = [
+            {"volume": "0.1", "funds": "5000000.0"},
+            {"volume": "0.3", "funds": "15300000.0"},
+        ]
+        order = make_order("uuid-a", trades=trades)
+        fake_upbit_server.orders = {
+            "uuid-a": order,
+            "uuid-b": make_order("uuid-b"),
+        }
+        service = UpbitService(upbit_http_client)
+
+        # When
+        result = service.fetch_all_trading_history_batched(
+            "access", "secret", ["uuid-a", "uuid-b"]
+        )
+
+        # Then
+        assert [o["uuid"] for o in result] == ["uuid-a", "uuid-b"]
+        assert result[0] == order
+        assert flatten_fills(result[:1]).volumes == [10000000, 30000000]
+        assert fake_upbit_server.request_count == 2
+
+    def test_falls_back_to_order_detail(self, fake_upbit_server, upbit_http_client):
+        """체결 금액이 없는 주문은 /v1/order 단건 조회로 보완"""
+        # Given
+        order = make_order("uuid-b")
+        fake_upbit_server.orders = {"uuid-b": order}
+        original_to_list_item = fake_upbit_server._to_list_item
+
+        def without_executed_funds(order):
+            item = original_to_list_item(order)
+            item.pop("executed_funds")
+            return item
+
+        fake_upbit_server._to_list_item = without_executed_funds
+        service = UpbitService(upbit_http_client)
+
+        # When
+        result = service.fetch_all_trading_history_batched(
+            "access", "secret", ["uuid-b"]
+        )
+
+        # Then
+        assert result == [order]
+        assert fake_upbit_server.request_count == 2
+
+
+@pytest.fixture
+def async_upbit_http_client(fake_upbit_server, tmp_path):
+    """가짜 서버와 같은 한도(초당 20회)를 가진 AsyncUpbitHttpClient"""
+    rate_limiter = TokenBucketRateLimiter(
+        state_dir=str(tmp_path), group_rates={"default": 20}
+    )
+    return AsyncUpbitHttpClient(
+        base_url=fake_upbit_server.base_url, rate_limiter=rate_limiter
+    )
+
+
+class TestUpbitServiceAsyncFetch:
+    """비동기 주문 상세 조회 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_keeps_uuid_order(
+        self, fake_upbit_server, upbit_http_client, async_upbit_http_client
+    ):
+        """결과가 입력 uuid 순서대로 반환되고 요청 한도를 지키는지 확인"""
+        # Given
+        service = UpbitService(upbit_http_client, async_upbit_http_client)
+        uuids = list(fake_upbit_server.orders.keys())
+
+        # When
+        started_at = time.monotonic()
+        result = await service.fetch_all_trading_history_concurrent_async(
+            "access", "secret", uuids, max_concurrency=8
+        )
+        elapsed = time.monotonic() - started_at
+        await async_upbit_http_client.aclose()
+
+        # Then
+        assert [order["uuid"] for order in result] == uuids
+        assert fake_upbit_server.rejected_count <= 3
+        assert 2.0 <= elapsed < 6.0
+
+    @pytest.mark.asyncio
+    async def test_batched_matches_sync(
+        self, fake_upbit_server, upbit_http_client, async_upbit_http_client
+    ):
+        """비동기 일괄 조회 결과가 동기 버전과 같음"""
+        # Given
+        service = UpbitService(upbit_http_client, async_upbit_http_client)
+        uuids = list(fake_upbit_server.orders.keys())
+
+        # When
+        result = await service.fetch_all_trading_history_batched_async(
+            "access", "secret", uuids
+        )
+        await async_upbit_http_client.aclose()
+
+        # Then
+        assert result == service.fetch_all_trading_history_batched(
+            "access", "secret", uuids
+        )
+
+    @pytest.mark.asyncio
+    async def test_does_not_block_event_loop(
+        self, fake_upbit_server, upbit_http_client, async_upbit_http_client
+    ):
+        """요청 한도로 대기하는 동안 다른 코루틴이 실행되는지 확인"""
+        # Given
+        service = UpbitService(upbit_http_client, async_upbit_http_client)
+        uuids = list(fake_upbit_server.orders.keys())[:40]
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.05)
+
+        # When
+        ticker_task = asyncio.create_task(ticker())
+        await service.fetch_all_trading_history_concurrent_async(
+            "access", "secret", uuids
+        )
+        ticker_task.cancel()
+        await async_upbit_http_client.aclose()
+
+        # Then - 약 1초 대기 동안 ticker가 계속 실행되어야 함
+        assert ticks >= 10
+
+
+class TestUpbitServiceWindowScan:
+    """주문 목록 적응형 구간 조회 테스트"""
+
+    def test_full_window_is_not_truncated(self, fake_upbit_server, upbit_http_client):
+        """한 구간에 1000건이 넘는 주문도 누락 없이 조회"""
+        # Given - 최근 이틀 동안 1분 간격 주문 2500건
+        now = get_current_korea_time().replace(microsecond=0)
+        fake_upbit_server.orders = {
+            f"uuid-{i:04d}": make_order(
+                f"uuid-{i:04d}",
+                created_at=(now - timedelta(minutes=i + 1)).isoformat(),
+            )
+            for i in range(2500)
+        }
+        service = UpbitService(upbit_http_client)
+
+        # When
+        result = service.fetch_all_trading_uuids(
+            "access", "secret", now - timedelta(days=3)
+        )
+
+        # Then
+        assert sorted(result) == sorted(fake_upbit_server.orders)
+        assert fake_upbit_server.request_count <= 5
+
+    def test_parallel_scan_matches_sequential(
+        self, fake_upbit_server, upbit_http_client
+    ):
+        """구간 병렬 조회 결과가 순차 조회와 같은 uuid 집합이고 중복이 없음"""
+        # Given - 최근 60일 동안 12시간 간격 주문 120개
+        now = get_current_korea_time().replace(microsecond=0)
+        fake_upbit_server.orders = {
+            f"uuid-{i:04d}": make_order(
+                f"uuid-{i:04d}",
+                created_at=(now - timedelta(hours=12 * (i + 1))).isoformat(),
+            )
+            for i in range(120)
+        }
+        service = UpbitService(upbit_http_client)
+        start_time = now - timedelta(days=61)
+
+        # When
+        sequential = service.fetch_all_trading_uuids(
+            "access", "secret", start_time, parallelism=1
+        )
+        parallel = service.fetch_all_trading_uuids(
+            "access", "secret", start_time, parallelism=4
+        )
+
+        # Then
+        assert len(parallel) == len(set(parallel)) == 120
+        assert set(parallel) == set(sequential)
+
+
+@pytest.fixture
+def logo_server():
+    """로고 이미지를 ETag와 함께 내려주는 로컬 서버"""
+    logos = {f"C{i:02d}": f"png-{i}".encode() * 100 for i in range(20)}
+    server = FakeUpbitServer(logos=logos, requests_per_second=1000).start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def logo_service(logo_server, tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        "service.upbit_service.get_upbit_rate_limiter",
+        lambda: TokenBucketRateLimiter(
+            state_dir=str(tmp_path / "rate"), group_rates={"static": 1000}
+        ),
+    )
+    service = UpbitService()
+    service._logo_http_client = Http_client(f"{logo_server.base_url}/logos/")
+    service._sync_state_store = FileSyncStateStore(str(tmp_path / "state"))
+    return service
+
+
+class TestUpbitServiceLogoSync:
+    """코인 로고 동시/증분 다운로드 테스트"""
+
+    def test_first_sync_downloads_all(self, logo_server, logo_service, tmp_path):
+        """처음에는 모든 로고를 받아서 저장"""
+        # Given
+        image_dir = tmp_path / "image"
+        symbols = list(logo_server.logos.keys())
+
+        # When
+        summary = logo_service.sync_coin_logos(symbols, image_dir=str(image_dir))
+
+        # Then
+        assert summary["downloaded"] == 20
+        assert summary["bytes_downloaded"] == logo_server.logo_bytes_sent
+        assert (image_dir / "C03.png").read_bytes() == logo_server.logos["C03"]
+        assert not list(image_dir.glob("*.tmp"))
+
+    def test_second_sync_skips_unchanged(self, logo_server, logo_service, tmp_path):
+        """ETag가 같으면 304로 건너뛰고 바뀐 로고만 다시 받음"""
+        # Given
+        image_dir = tmp_path / "image"
+        symbols = list(logo_server.logos.keys())
+        first = logo_service.sync_coin_logos(symbols, image_dir=str(image_dir))
+        logo_server.logos["C05"] = b"new-logo"
+        sent_before = logo_server.logo_bytes_sent
+
+        # When
+        summary = logo_service.sync_coin_logos(symbols, image_dir=str(image_dir))
+
+        # Then
+        assert summary["downloaded"] == 1
+        assert summary["not_modified"] == 19
+        assert logo_server.logo_bytes_sent - sent_before == len(b"new-logo")
+        assert summary["bytes_saved"] == first["bytes_downloaded"] - len(
+            b"png-5" * 100
+        )
+        assert (image_dir / "C05.png").read_bytes() == b"new-logo"
+
+    def test_missing_file_is_downloaded_again(
+        self, logo_server, logo_service, tmp_path
+    ):
+        """상태가 있어도 파일이 없으면 다시 받음"""
+        # Given
+        image_dir = tmp_path / "image"
+        logo_service.sync_coin_logos(["C01", "C02"], image_dir=str(image_dir))
+        (image_dir / "C01.png").unlink()
+
+        # When
+        summary = logo_service.sync_coin_logos(["C01", "C02"], image_dir=str(image_dir))
+
+        # Then
+        assert summary["downloaded"] == 1
+        assert summary["not_modified"] == 1
+        assert (image_dir / "C01.png").exists()
+
+    def test_existing_file_with_same_content_is_not_rewritten(
+        self, logo_server, logo_service, tmp_path
+    ):
+        """상태 없이 이미 받아 둔 파일은 내용이 같으면 다시 쓰지 않음"""
+        # Given
+        image_dir = tmp_path / "image"
+        image_dir.mkdir()
+        (image_dir / "C01.png").write_bytes(logo_server.logos["C01"])
+
+        # When
+        summary = logo_service.sync_coin_logos(["C01", "NONE"], image_dir=str(image_dir))
+
+        # Then
+        assert summary["unchanged"] == 1
+        assert summary["failed"] == 1
+        assert logo_service.sync_state_store.get("coin_logos").keys() == {"C01"}
+
+
+class TestUpbitHttpClientTimeout:
+    """동기 클라이언트 타임아웃 테스트"""
+
+    def test_raises_when_server_does_not_respond(self):
+        """응답하지 않는 서버에서 타임아웃 후 UpbitHttpClientError가 나는지 확인"""
+        # Given: 연결만 받고 응답하지 않는 서버
+        listener = socket.socket()
+        listener.bind(("127.0.0.1", 0))
+        listener.listen(1)
+        base_url = f"http://127.0.0.1:{listener.getsockname()[1]}"
+        client = UpbitHttpClient(base_url=base_url, timeout=0.2)
+
+        try:
+            # When / Then
+            started_at = time.monotonic()
+            with pytest.raises(UpbitHttpClientError):
+                client.get("/v1/order", "access", "secret")
+            assert time.monotonic() - started_at < 2
+        finally:
+            listener.close()
+
+    def test_request_timeout_overrides_default(self, monkeypatch):
+        """요청별 timeout이 (연결, 읽기) 타임아웃으로 전달되는지 확인"""
+        # Given
+        client = UpbitHttpClient(timeout=3)
+        timeouts = []
+
+        def fake_get(url, **kwargs):
+            timeouts.append(kwargs["timeout"])
+            raise UpbitHttpClientError("stop")
+
+        monkeypatch.setattr(client.session, "get", fake_get)
+
+        # When
+        for timeout in (None, 0.5):
+            with pytest.raises(UpbitHttpClientError):
+                client.get("/v1/order", "access", "secret", timeout=timeout)
+
+        # Then
+        assert timeouts == [(3, 3), (0.5, 0.5)]
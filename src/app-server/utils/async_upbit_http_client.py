@@ -0,0 +1,143 @@
+import os
+import importlib.util
+import httpx
+from typing import Dict, Any, Mapping, Optional
+from dotenv import load_dotenv
+from utils.rate_limiter import TokenBucketRateLimiter
+from utils.upbit_http_client import (
+    UPBIT_HTTP_TIMEOUT,
+    BaseUpbitHttpClient,
+    UpbitHttpClientError,
+)
+
+load_dotenv()
+
+# 커넥션 풀 설정 (타임아웃은 동기 클라이언트와 같은 UPBIT_HTTP_TIMEOUT)
+UPBIT_HTTP_MAX_CONNECTIONS = int(os.getenv("UPBIT_HTTP_MAX_CONNECTIONS", "20"))
+UPBIT_HTTP_MAX_KEEPALIVE_CONNECTIONS = int(
+    os.getenv("UPBIT_HTTP_MAX_KEEPALIVE_CONNECTIONS", "10")
+)
+UPBIT_HTTP_KEEPALIVE_EXPIRY = float(os.getenv("UPBIT_HTTP_KEEPALIVE_EXPIRY", "30"))
+
+
+class AsyncUpbitHttpClient(BaseUpbitHttpClient):
+    """httpx.AsyncClient 기반 비동기 Upbit HTTP Client
+
+    UpbitHttpClient와 같은 get() 계약을 가지며, 커넥션 풀과 keep-alive를
+    공유하므로 하나의 이벤트 루프에서 여러 동기화 작업을 동시에 처리할 수 있다.
+    h2 패키지가 설치되어 있으면 HTTP/2를 사용한다.
+    """
+
+    def __init__(
+        self,
+        base_url: str = "https://api.upbit.com",
+        max_connections: int = UPBIT_HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections: int = UPBIT_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float = UPBIT_HTTP_KEEPALIVE_EXPIRY,
+        timeout: float = UPBIT_HTTP_TIMEOUT,
+        http2: Optional[bool] = None,
+        rate_limiter: Optional[TokenBucketRateLimiter] = None,
+    ):
+        super().__init__(base_url, rate_limiter)
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.timeout = httpx.Timeout(timeout)
+        self.http2 = (
+            importlib.util.find_spec("h2") is not None if http2 is None else http2
+        )
+        self._client: Optional[httpx.AsyncClient] = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        # 이벤트 루프 안에서 처음 사용할 때 생성
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                limits=self.limits,
+                timeout=self.timeout,
+                http2=self.http2,
+            )
+        return self._client
+
+    async def get(
+        self,
+        endpoint: str,
+        access_key: str,
+        secret_key: str,
+        params: Optional[Dict[str, Any]] = None,
+        require_auth: bool = False,  # 인증 헤더가 필요한지 체크
+        timeout: Optional[float] = None,  # 요청별 타임아웃 (초)
+    ) -> Optional[Dict[str, Any]]:
+        try:
+            # 인증 헤더가 필요할때만 생성
+            headers = (
+                self._get_headers(access_key, secret_key, params)
+                if require_auth
+                else None
+            )
+
+            key = self._rate_limit_key(access_key, require_auth)
+            await self.rate_limiter.acquire_async(self._resolve_group(endpoint), key)
+
+            response = await self.client.get(
+                endpoint,
+                params=params,
+                headers=headers,
+                timeout=(
+                    httpx.Timeout(timeout)
+                    if timeout is not None
+                    else httpx.USE_CLIENT_DEFAULT
+                ),
+            )
+            await self._apply_remaining_req_async(endpoint, response.headers, key)
+            response.raise_for_status()
+
+            return response.json()
+
+        except httpx.HTTPStatusError as e:
+            error_msg = f"AsyncUpbitHttpClient GET request failed for endpoint {endpoint}: {e}"
+            raise UpbitHttpClientError(error_msg, e.response.status_code)
+        except httpx.HTTPError as e:
+            error_msg = f"AsyncUpbitHttpClient GET request failed for endpoint {endpoint}: {e}"
+            raise UpbitHttpClientError(error_msg)
+        except Exception as e:
+            error_msg = f"AsyncUpbitHttpClient unexpected error in GET method for endpoint {endpoint}: {e}"
+            raise UpbitHttpClientError(error_msg)
+
+    async def _apply_remaining_req_async(
+        self, endpoint: str, response_headers: Mapping[str, str], key: Optional[str]
+    ):
+        """_apply_remaining_req의 비동기 버전 (요청 제한기 파일 잠금을 스레드에서 처리)"""
+        remaining = self._parse_remaining_req(endpoint, response_headers)
+        if remaining is None:
+            return
+
+        group, remaining_min, remaining_sec = remaining
+        await self.rate_limiter.update_async(group, remaining_min, remaining_sec, key)
+
+    async def aclose(self):
+        """커넥션 풀 정리"""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+
+
+# 싱글톤 인스턴스
+_async_upbit_http_client: Optional[AsyncUpbitHttpClient] = None
+
+
+def get_async_upbit_http_client() -> AsyncUpbitHttpClient:
+    """비동기 Upbit HTTP Client 싱글톤 인스턴스 반환"""
+    global _async_upbit_http_client
+    if _async_upbit_http_client is None:
+        _async_upbit_http_client = AsyncUpbitHttpClient()
+    return _async_upbit_http_client
+
+
+async def close_async_upbit_http_client():
+    """비동기 Upbit HTTP Client 커넥션 풀 정리 (애플리케이션 종료 시)"""
+    if _async_upbit_http_client is not None:
+        await _async_upbit_http_client.aclose()
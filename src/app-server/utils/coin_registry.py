@@ -0,0 +1,121 @@
+import os
+import time
+import logging
+import threading
+from typing import Dict, List, Optional
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# 없는 마켓 조회로 인한 재조회 최소 간격 (초)
+COIN_REGISTRY_MISS_REFRESH_INTERVAL = float(
+    os.getenv("COIN_REGISTRY_MISS_REFRESH_INTERVAL", "10")
+)
+
+
+class CoinRegistry:
+    """프로세스 공용 코인 목록 (market_code / symbol / id로 O(1) 조회)
+
+    시작 시 한 번 불러오고, 코인 목록이 저장되면 refresh()로 다시 불러온다.
+    없는 마켓을 조회하면 한 번 다시 불러와서 찾는다 (너무 자주 다시
+    불러오지 않도록 최소 간격을 둔다). 다시 불러올 때는 새 색인을 만든 뒤
+    한 번에 바꾸므로 조회는 잠금 없이 처리된다.
+    """
+
+    def __init__(
+        self,
+        coin_repository=None,
+        miss_refresh_interval: float = COIN_REGISTRY_MISS_REFRESH_INTERVAL,
+    ):
+        self.logger = logging.getLogger(__name__)
+        self._coin_repository = coin_repository
+        self.miss_refresh_interval = miss_refresh_interval
+        self._by_market_code: Dict[str, object] = {}
+        self._by_symbol: Dict[str, List[object]] = {}
+        self._by_id: Dict[int, object] = {}
+        self._loaded = False
+        self._last_refresh_at = float("-inf")
+        self._refresh_lock = threading.Lock()
+
+    @property
+    def coin_repository(self):
+        if self._coin_repository is None:
+            from dependencies import get_coin_repository
+
+            self._coin_repository = get_coin_repository()
+        return self._coin_repository
+
+    def refresh(self):
+        """DB에서 코인 목록을 다시 불러와 색인 교체"""
+        with self._refresh_lock:
+            self._refresh()
+
+    def _refresh(self):
+        coins = self.coin_repository.get_all_coins()
+
+        by_market_code = {}
+        by_symbol = {}
+        by_id = {}
+        for coin in coins:
+            by_market_code[str(coin.market_code)] = coin
+            by_symbol.setdefault(str(coin.symbol), []).append(coin)
+            by_id[coin.id] = coin
+
+        self._by_market_code, self._by_symbol, self._by_id = (
+            by_market_code,
+            by_symbol,
+            by_id,
+        )
+        self._loaded = True
+        self._last_refresh_at = time.monotonic()
+        self.logger.info(f"코인 목록 불러오기 완료: {len(by_id)}개")
+
+    def _ensure_loaded(self):
+        if not self._loaded:
+            with self._refresh_lock:
+                if not self._loaded:
+                    self._refresh()
+
+    def _refresh_on_miss(self, attempted_at: float) -> bool:
+        """조회 실패 시 한 번 다시 불러오기 (다른 스레드가 이미 불러왔으면 생략)"""
+        with self._refresh_lock:
+            if self._last_refresh_at > attempted_at:
+                return True
+            if time.monotonic() - self._last_refresh_at < self.miss_refresh_interval:
+                return False
+            self._refresh()
+            return True
+
+    def get_by_market_code(self, market_code: str):
+        """market_code(KRW-BTC)로 코인 조회, 없으면 한 번 다시 불러온 뒤 조회"""
+        self._ensure_loaded()
+        attempted_at = time.monotonic()
+        coin = self._by_market_code.get(market_code)
+        if coin is None and self._refresh_on_miss(attempted_at):
+            coin = self._by_market_code.get(market_code)
+        return coin
+
+    def get_id_by_market_code(self, market_code: str) -> Optional[int]:
+        coin = self.get_by_market_code(market_code)
+        return coin.id if coin is not None else None
+
+    def get_by_symbol(self, symbol: str) -> List[object]:
+        """심볼(BTC)로 코인 조회 (마켓별로 여러 개일 수 있음)"""
+        self._ensure_loaded()
+        return list(self._by_symbol.get(symbol, []))
+
+    def get_by_id(self, coin_id: int):
+        self._ensure_loaded()
+        return self._by_id.get(coin_id)
+
+    def all(self) -> List[object]:
+        """불러온 전체 코인 목록"""
+        self._ensure_loaded()
+        return list(self._by_id.values())
+
+    def market_code_map(self) -> Dict[str, int]:
+        """market_code → coin id 매핑"""
+        self._ensure_loaded()
+        return {
+            market_code: coin.id for market_code, coin in self._by_market_code.items()
+        }
@@ -0,0 +1,114 @@
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Any, Iterable, List
+import numpy as np
+
+# 금액/수량은 Numeric(20, 8)과 같은 소수점 8자리 고정소수점 정수로 다룬다
+FIXED_POINT_DIGITS = 8
+FIXED_POINT_SCALE = 10**FIXED_POINT_DIGITS
+
+# int64로 더해도 넘치지 않는 최대 합계 (넘으면 Python int로 계산)
+_INT64_MAX = np.iinfo(np.int64).max
+# 이보다 작은 값은 float로 읽어 1e8배 후 반올림해도 정확한 정수가 된다
+# (|값| * 1e8 < 2^51 이면 float 오차가 0.5 미만)
+_FLOAT_EXACT_LIMIT = 2**51 / FIXED_POINT_SCALE
+
+
+def to_fixed(value: Any) -> int:
+    """"0.12345678" / 1 / Decimal → 12345678 / 100000000 / ... (8자리 아래는 반올림)
+
+    업비트 응답의 숫자 문자열은 float를 거치지 않고 그대로 정수로 바꾼다.
+    """
+    if value is None:
+        return 0
+    if isinstance(value, int):
+        return value * FIXED_POINT_SCALE
+
+    text = value if isinstance(value, str) else str(value)
+    whole, _, fraction = text.partition(".")
+    if len(fraction) <= FIXED_POINT_DIGITS and "e" not in text and "E" not in text:
+        return int(whole + fraction.ljust(FIXED_POINT_DIGITS, "0"))
+
+    # 지수 표기나 8자리보다 긴 소수는 Decimal로 반올림 (0.5는 0에서 먼 쪽으로, Numeric과 동일)
+    return int(
+        Decimal(text)
+        .scaleb(FIXED_POINT_DIGITS)
+        .to_integral_value(rounding=ROUND_HALF_UP)
+    )
+
+
+def to_fixed_array(values: Iterable[Any]) -> np.ndarray:
+    """숫자 문자열 목록 → 고정소수점 정수 배열 (int64에 못 담으면 Python int 배열)
+
+    한 번에 float로 읽어 1e8배 후 반올림하고, 결과를 다시 나눈 값이 읽은 float와
+    같으면(소수점 8자리 이하이고 충분히 작은 값) 그 정수가 정확한 값이다.
+    그렇지 않은 값만 to_fixed로 문자열에서 다시 변환한다.
+    """
+    values = list(values)
+    floats = np.fromiter(map(float, values), dtype=np.float64, count=len(values))
+    scaled = np.rint(floats * FIXED_POINT_SCALE)
+    exact = (np.abs(floats) < _FLOAT_EXACT_LIMIT) & (
+        scaled / FIXED_POINT_SCALE == floats
+    )
+    scaled[~exact] = 0
+    fixed_values = scaled.astype(np.int64)
+
+    inexact_indexes = np.flatnonzero(~exact).tolist()
+    if inexact_indexes:
+        fallback = [to_fixed(values[i]) for i in inexact_indexes]
+        if any(abs(value) > _INT64_MAX for value in fallback):
+            fixed_values = fixed_values.astype(object)
+        fixed_values[inexact_indexes] = fallback
+
+    return fixed_values
+
+
+def sum_segments(values: np.ndarray, counts: List[int]) -> List[int]:
+    """연속된 구간(counts개씩)별 합계
+
+    모든 합계가 int64 안에 들어오면 reduceat으로 한 번에 더하고,
+    넘칠 수 있으면 Python int로 정확히 더한다. 빈 구간의 합은 0이다.
+    """
+    segment_count = len(counts)
+    if segment_count == 0:
+        return []
+
+    counts_array = np.asarray(counts, dtype=np.int64)
+    ends = np.cumsum(counts_array)
+    starts = ends - counts_array
+
+    if values.dtype == np.int64 and (
+        len(values) == 0
+        or int(np.abs(values).max()) * int(counts_array.max()) <= _INT64_MAX
+    ):
+        sums = np.zeros(segment_count, dtype=np.int64)
+        non_empty = counts_array > 0
+        if non_empty.any():
+            sums[non_empty] = np.add.reduceat(values, starts[non_empty])
+        return sums.tolist()
+
+    fixed_values = values.tolist()
+    return [
+        sum(fixed_values[start:end]) for start, end in zip(starts.tolist(), ends.tolist())
+    ]
+
+
+def fixed_div(numerator: int, denominator: int) -> int:
+    """고정소수점 나눗셈 (numerator / denominator, 8자리에서 반올림), 분모가 0이면 0"""
+    if denominator == 0:
+        return 0
+    quotient, remainder = divmod(abs(numerator) * FIXED_POINT_SCALE, abs(denominator))
+    if remainder * 2 >= abs(denominator):
+        quotient += 1
+    return quotient if (numerator < 0) == (denominator < 0) else -quotient
+
+
+def fixed_to_str(value: int) -> str:
+    """12345678 → "0.12345678" (COPY / Numeric 바인딩용)"""
+    sign = "-" if value < 0 else ""
+    whole, fraction = divmod(abs(value), FIXED_POINT_SCALE)
+    return f"{sign}{whole}.{fraction:0{FIXED_POINT_DIGITS}d}"
+
+
+def fixed_to_float(value: int) -> float:
+    """응답용 float 변환 (정수 나눗셈이라 가장 가까운 float로 정확히 반올림됨)"""
+    return value / FIXED_POINT_SCALE
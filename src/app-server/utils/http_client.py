@@ -1,4 +1,5 @@
 import requests
+from requests.adapters import HTTPAdapter
 import time
 import os
 from typing import Optional, Dict, Any
@@ -6,7 +7,9 @@ import logging
 
 
 class Http_client:
-    def __init__(self, base_url: str, headers: Optional[dict] = None):
+    def __init__(
+        self, base_url: str, headers: Optional[dict] = None, pool_maxsize: int = 10
+    ):
         self.base_url = base_url
         self.headers = (
             headers
@@ -24,9 +27,15 @@ class Http_client:
         )
         self.logger = logging.getLogger(__name__)
 
+        # 연결을 재사용하도록 세션 하나를 공유 (여러 스레드에서 동시에 사용)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
     def get(self, params: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
         try:
-            response = requests.get(
+            response = self.session.get(
                 self.base_url, headers=self.headers, params=params, timeout=30
             )
 
@@ -61,15 +70,31 @@ class Http_client:
         params = {"nonce": nonce}
         return self.get(params)
 
-    def download_image(self, url: str, save_path: str) -> bool:
-        try:
-            os.makedirs(os.path.dirname(save_path), exist_ok=True)
-            response = requests.get(url, headers=self.headers, timeout=30)
+    def get_if_modified(
+        self, etag: Optional[str] = None, last_modified: Optional[str] = None
+    ) -> requests.Response:
+        """
+        If-None-Match / If-Modified-Since 조건부 요청을 보냅니다.
+        바뀐 내용이 없으면 본문 없이 304 응답을 반환합니다.
+        """
+        return self.fetch_if_modified(self.base_url, etag, last_modified)
+
+    def fetch_if_modified(
+        self,
+        url: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> requests.Response:
+        """
+        url에 조건부 요청을 보냅니다 (이미지 등 base_url 아래의 파일 조회용).
+        """
+        headers = dict(self.headers)
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+        response = self.session.get(url, headers=headers, timeout=30)
+        if response.status_code != 304:
             response.raise_for_status()
-            with open(save_path, "wb") as f:
-                f.write(response.content)
-            self.logger.info(f"이미지 저장 성공: {save_path}")
-            return True
-        except Exception as e:
-            self.logger.error(f"이미지 다운로드 실패: {e}")
-            return False
+        return response
@@ -0,0 +1,471 @@
+import os
+import json
+import asyncio
+import logging
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, Optional
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# 작업 큐 설정
+JOB_QUEUE_BACKEND = os.getenv("JOB_QUEUE_BACKEND", "memory")  # memory | redis
+JOB_QUEUE_WORKERS = int(os.getenv("JOB_QUEUE_WORKERS", "4"))
+JOB_QUEUE_REDIS_URL = os.getenv("JOB_QUEUE_REDIS_URL", "redis://localhost:6379/0")
+JOB_RESULT_TTL_SECONDS = int(os.getenv("JOB_RESULT_TTL_SECONDS", "86400"))
+# 워커 생존 임대 시간 (lease_ttl / 3마다 연장, 워커 프로세스가 죽으면 만료)
+# 실행 중인 작업의 중복 키와 Redis 처리 중 목록의 소유권이 이 시간 안에 풀린다
+JOB_LEASE_TTL_SECONDS = int(os.getenv("JOB_LEASE_TTL_SECONDS", "60"))
+
+# 작업 상태
+JOB_STATUS_QUEUED = "queued"
+JOB_STATUS_RUNNING = "running"
+JOB_STATUS_SUCCEEDED = "succeeded"
+JOB_STATUS_FAILED = "failed"
+JOB_FINISHED_STATUSES = (JOB_STATUS_SUCCEEDED, JOB_STATUS_FAILED)
+
+# 중복 키 확인, 선점, 작업 저장을 한 번에 실행 (진행 중인 작업 id 또는 nil 반환)
+# KEYS[1]: 중복 키, KEYS[2]: 새 작업 키
+# ARGV: 새 작업 id, 작업 JSON, 유지 시간, 작업 키 prefix, 완료 상태들
+_CLAIM_DEDUP_SCRIPT = """
+local existing_job_id = redis.call('GET', KEYS[1])
+if existing_job_id then
+    local raw = redis.call('GET', ARGV[4] .. existing_job_id)
+    if raw then
+        local status = cjson.decode(raw)['status']
+        if status ~= ARGV[5] and status ~= ARGV[6] then
+            return existing_job_id
+        end
+    end
+end
+redis.call('SET', KEYS[2], ARGV[2], 'EX', ARGV[3])
+redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[3])
+return nil
+"""
+# 중복 키가 아직 이 작업의 것일 때만 유지 시간 연장 / 삭제
+_REFRESH_DEDUP_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('EXPIRE', KEYS[1], ARGV[2])
+end
+return 0
+"""
+_RELEASE_DEDUP_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+# 임대가 만료된 소비자의 처리 중 목록을 큐 앞쪽으로 되돌리고 소비자 목록에서 제거
+# KEYS[1]: 소비자 임대 키, KEYS[2]: 처리 중 목록, KEYS[3]: 큐, KEYS[4]: 소비자 목록
+# ARGV[1]: 소비자 id (되돌린 작업 id 목록 반환, 살아 있는 소비자면 nil)
+_REQUEUE_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    return nil
+end
+local job_ids = redis.call('LRANGE', KEYS[2], 0, -1)
+for i = #job_ids, 1, -1 do
+    redis.call('LPUSH', KEYS[3], job_ids[i])
+end
+redis.call('DEL', KEYS[2])
+redis.call('SREM', KEYS[4], ARGV[1])
+return job_ids
+"""
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+class InMemoryJobBackend:
+    """프로세스 내부 작업 저장소 (단일 워커 프로세스용)
+
+    작업 기록은 Redis 저장소처럼 마지막 저장 후 result_ttl이 지나면 지운다.
+    """
+
+    def __init__(self, result_ttl: float = JOB_RESULT_TTL_SECONDS):
+        self.result_ttl = result_ttl
+        self._jobs: Dict[str, Dict[str, Any]] = {}
+        self._expires_at: Dict[str, float] = {}
+        self._dedup: Dict[str, str] = {}
+        self._queue: Optional[asyncio.Queue] = None
+
+    @property
+    def queue(self) -> asyncio.Queue:
+        # 이벤트 루프 안에서 처음 사용할 때 생성
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+        return self._queue
+
+    async def enqueue(self, job_id: str):
+        await self.queue.put(job_id)
+
+    async def dequeue(self, timeout: float) -> Optional[str]:
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def ack(self, job_id: str):
+        # 프로세스가 죽으면 큐도 함께 사라지므로 되돌릴 처리 중 목록이 없음
+        pass
+
+    async def save(self, job: Dict[str, Any]):
+        self._jobs[job["job_id"]] = dict(job)
+        self._expires_at[job["job_id"]] = time.monotonic() + self.result_ttl
+
+    async def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        if self._expires_at.get(job_id, 0) < time.monotonic():
+            self._remove(job_id)
+            return None
+        return dict(self._jobs[job_id])
+
+    async def maintain(self, lease_ttl: float):
+        """만료된 작업 기록과 그 중복 키 정리"""
+        now = time.monotonic()
+        for job_id in [
+            job_id for job_id, expires_at in self._expires_at.items() if expires_at < now
+        ]:
+            self._remove(job_id)
+
+    def _remove(self, job_id: str):
+        self._jobs.pop(job_id, None)
+        self._expires_at.pop(job_id, None)
+        for dedup_key in [key for key, value in self._dedup.items() if value == job_id]:
+            del self._dedup[dedup_key]
+
+    async def claim_dedup(self, dedup_key: str, job: Dict[str, Any]) -> Optional[str]:
+        """중복 키를 선점하며 작업을 저장하고, 이미 진행 중인 작업이 있으면 그 작업 id 반환"""
+        existing_job_id = self._dedup.get(dedup_key)
+        if existing_job_id is not None:
+            existing = await self.get(existing_job_id)
+            if existing and existing["status"] not in JOB_FINISHED_STATUSES:
+                return existing_job_id
+
+        await self.save(job)
+        self._dedup[dedup_key] = job["job_id"]
+        return None
+
+    async def refresh_dedup(self, dedup_key: str, job_id: str, ttl: int):
+        # 프로세스가 죽으면 상태도 함께 사라지므로 만료가 필요 없음
+        pass
+
+    async def release_dedup(self, dedup_key: str, job_id: str):
+        if self._dedup.get(dedup_key) == job_id:
+            del self._dedup[dedup_key]
+
+
+class RedisJobBackend:
+    """Redis 호환 작업 저장소 (여러 워커 프로세스가 큐와 상태를 공유)
+
+    꺼낸 작업은 이 저장소(소비자) 전용 처리 중 목록으로 옮겨 두고 끝나면 ack로
+    지운다. 소비자는 임대 키를 주기적으로 연장하며, 임대가 만료된 소비자의 처리 중
+    작업은 다른 프로세스의 maintain이 큐로 되돌려 다시 실행한다.
+    """
+
+    def __init__(self, url: str = JOB_QUEUE_REDIS_URL, prefix: str = "bitriever:job"):
+        import redis.asyncio as redis
+
+        self.logger = logging.getLogger(__name__)
+        self.redis = redis.from_url(url, decode_responses=True)
+        self.prefix = prefix
+        self.consumer_id = str(uuid.uuid4())
+        self._claim_dedup_script = self.redis.register_script(_CLAIM_DEDUP_SCRIPT)
+        self._refresh_dedup_script = self.redis.register_script(
+            _REFRESH_DEDUP_SCRIPT
+        )
+        self._release_dedup_script = self.redis.register_script(
+            _RELEASE_DEDUP_SCRIPT
+        )
+        self._requeue_script = self.redis.register_script(_REQUEUE_SCRIPT)
+
+    def _job_key(self, job_id: str) -> str:
+        return f"{self.prefix}:{job_id}"
+
+    def _dedup_key(self, dedup_key: str) -> str:
+        return f"{self.prefix}:dedup:{dedup_key}"
+
+    @property
+    def _queue_key(self) -> str:
+        return f"{self.prefix}:queue"
+
+    @property
+    def _consumers_key(self) -> str:
+        return f"{self.prefix}:consumers"
+
+    def _lease_key(self, consumer_id: str) -> str:
+        return f"{self.prefix}:consumer:{consumer_id}"
+
+    def _processing_key(self, consumer_id: str) -> str:
+        return f"{self.prefix}:processing:{consumer_id}"
+
+    async def enqueue(self, job_id: str):
+        await self.redis.rpush(self._queue_key, job_id)
+
+    async def dequeue(self, timeout: float) -> Optional[str]:
+        # 꺼내는 동시에 처리 중 목록으로 옮기므로 실행 중에 죽어도 작업이 사라지지 않음
+        return await self.redis.blmove(
+            self._queue_key,
+            self._processing_key(self.consumer_id),
+            timeout,
+            "LEFT",
+            "RIGHT",
+        )
+
+    async def ack(self, job_id: str):
+        await self.redis.lrem(self._processing_key(self.consumer_id), 1, job_id)
+
+    async def maintain(self, lease_ttl: int):
+        """이 소비자의 임대를 연장하고, 임대가 만료된 소비자의 처리 중 작업을 큐로 되돌림"""
+        await self.redis.set(self._lease_key(self.consumer_id), _now(), ex=lease_ttl)
+        await self.redis.sadd(self._consumers_key, self.consumer_id)
+
+        for consumer_id in await self.redis.smembers(self._consumers_key):
+            if consumer_id == self.consumer_id:
+                continue
+            job_ids = await self._requeue_script(
+                keys=[
+                    self._lease_key(consumer_id),
+                    self._processing_key(consumer_id),
+                    self._queue_key,
+                    self._consumers_key,
+                ],
+                args=[consumer_id],
+            )
+            for job_id in job_ids or []:
+                # 중복 키가 만료됐으면 대기 중인 작업으로 다시 선점 (이미 다른 작업이 가졌으면 유지)
+                job = await self.get(job_id)
+                if job and job["dedup_key"] is not None:
+                    await self.redis.set(
+                        self._dedup_key(job["dedup_key"]),
+                        job_id,
+                        ex=JOB_RESULT_TTL_SECONDS,
+                        nx=True,
+                    )
+            if job_ids:
+                self.logger.warning(
+                    f"응답 없는 작업 소비자 {consumer_id}의 작업 {len(job_ids)}개를 큐로 되돌림"
+                )
+
+    async def save(self, job: Dict[str, Any]):
+        await self.redis.set(
+            self._job_key(job["job_id"]), json.dumps(job), ex=JOB_RESULT_TTL_SECONDS
+        )
+
+    async def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        raw = await self.redis.get(self._job_key(job_id))
+        return json.loads(raw) if raw else None
+
+    async def claim_dedup(self, dedup_key: str, job: Dict[str, Any]) -> Optional[str]:
+        """중복 키를 선점하며 작업을 저장하고, 이미 진행 중인 작업이 있으면 그 작업 id 반환
+
+        확인, 선점, 작업 저장을 Lua 스크립트 하나로 실행하므로 동시에 등록해도
+        한 작업만 키를 가진다. 대기 중인 작업은 큐에 남아 언젠가 실행되므로 결과
+        보관 시간 동안 키를 유지하고, 실행을 시작하면 워커가 짧은 유지 시간으로 바꾼다.
+        """
+        return await self._claim_dedup_script(
+            keys=[self._dedup_key(dedup_key), self._job_key(job["job_id"])],
+            args=[
+                job["job_id"],
+                json.dumps(job),
+                JOB_RESULT_TTL_SECONDS,
+                f"{self.prefix}:",
+                *JOB_FINISHED_STATUSES,
+            ],
+        )
+
+    async def refresh_dedup(self, dedup_key: str, job_id: str, ttl: int):
+        await self._refresh_dedup_script(
+            keys=[self._dedup_key(dedup_key)], args=[job_id, ttl]
+        )
+
+    async def release_dedup(self, dedup_key: str, job_id: str):
+        await self._release_dedup_script(
+            keys=[self._dedup_key(dedup_key)], args=[job_id]
+        )
+
+
+class JobProgress:
+    """작업 진행 상황 기록기 (핸들러가 카운터를 올리면 저장소에 반영)"""
+
+    def __init__(self, backend, job: Dict[str, Any]):
+        self._backend = backend
+        self._job = job
+
+    @property
+    def values(self) -> Dict[str, Any]:
+        return dict(self._job["progress"])
+
+    async def increment(self, **counts: int):
+        for name, count in counts.items():
+            self._job["progress"][name] = self._job["progress"].get(name, 0) + count
+        await self._backend.save(self._job)
+
+    async def set(self, **values: Any):
+        self._job["progress"].update(values)
+        await self._backend.save(self._job)
+
+
+JobHandler = Callable[[Dict[str, Any], JobProgress], Awaitable[Any]]
+
+
+class JobQueue:
+    """백그라운드 작업 큐
+
+    등록된 핸들러를 워커 풀(asyncio task)에서 실행하고, 상태/진행 상황/결과를
+    backend에 저장한다. 같은 dedup_key의 작업이 진행 중이면 새로 만들지 않고
+    기존 작업을 돌려준다.
+    """
+
+    def __init__(
+        self,
+        backend=None,
+        workers: int = JOB_QUEUE_WORKERS,
+        lease_ttl: int = JOB_LEASE_TTL_SECONDS,
+    ):
+        self.logger = logging.getLogger(__name__)
+        self.backend = backend or InMemoryJobBackend()
+        self.workers = workers
+        self.lease_ttl = lease_ttl
+        self._handlers: Dict[str, JobHandler] = {}
+        # 이 프로세스에서 실행 중인 작업 id → 중복 키 (임대 연장 대상)
+        self._running_jobs: Dict[str, str] = {}
+        self._tasks = []
+        self._running = False
+
+    def register(self, job_type: str, handler: JobHandler):
+        self._handlers[job_type] = handler
+
+    async def start(self):
+        if self._running:
+            return
+        self._running = True
+        # 큐에서 꺼내기 전에 임대부터 등록
+        await self.backend.maintain(self.lease_ttl)
+        self._tasks = [
+            asyncio.create_task(self._worker(i)) for i in range(self.workers)
+        ]
+        self._tasks.append(asyncio.create_task(self._maintain()))
+        self.logger.info(f"작업 큐 워커 {self.workers}개 시작")
+
+    async def stop(self):
+        self._running = False
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def submit(
+        self,
+        job_type: str,
+        payload: Dict[str, Any],
+        dedup_key: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """작업 등록 (같은 dedup_key의 작업이 진행 중이면 그 작업을 반환)"""
+        if job_type not in self._handlers:
+            raise ValueError(f"등록되지 않은 작업 유형입니다: {job_type}")
+
+        job = {
+            "job_id": str(uuid.uuid4()),
+            "job_type": job_type,
+            "dedup_key": dedup_key,
+            "payload": payload,
+            "status": JOB_STATUS_QUEUED,
+            "progress": {},
+            "result": None,
+            "error": None,
+            "created_at": _now(),
+            "started_at": None,
+            "finished_at": None,
+        }
+
+        if dedup_key is None:
+            await self.backend.save(job)
+        else:
+            # 선점에 성공하면 작업도 함께 저장됨 (그 사이 기존 작업 기록이 만료되면 다시 선점)
+            while (
+                existing_job_id := await self.backend.claim_dedup(dedup_key, job)
+            ) is not None:
+                existing = await self.backend.get(existing_job_id)
+                if existing is not None:
+                    return existing
+
+        await self.backend.enqueue(job["job_id"])
+        return job
+
+    async def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        return await self.backend.get(job_id)
+
+    async def _worker(self, worker_index: int):
+        while self._running:
+            try:
+                job_id = await self.backend.dequeue(timeout=1.0)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.error(f"작업 큐 조회 실패 (worker {worker_index}): {e}")
+                await asyncio.sleep(1.0)
+                continue
+
+            if job_id is not None:
+                try:
+                    await self._run(job_id)
+                finally:
+                    await self.backend.ack(job_id)
+
+    async def _run(self, job_id: str):
+        job = await self.backend.get(job_id)
+        # 결과 저장 직후 워커가 죽어 큐로 되돌아온 작업은 다시 실행하지 않음
+        if job is None or job["status"] in JOB_FINISHED_STATUSES:
+            return
+
+        handler = self._handlers.get(job["job_type"])
+        job["status"] = JOB_STATUS_RUNNING
+        job["started_at"] = _now()
+        await self.backend.save(job)
+
+        # 실행 중에는 중복 키를 짧은 임대 시간으로 바꾸고 _maintain이 연장
+        if job["dedup_key"] is not None:
+            await self.backend.refresh_dedup(job["dedup_key"], job_id, self.lease_ttl)
+            self._running_jobs[job_id] = job["dedup_key"]
+
+        try:
+            if handler is None:
+                raise ValueError(f"등록되지 않은 작업 유형입니다: {job['job_type']}")
+
+            job["result"] = await handler(job["payload"], JobProgress(self.backend, job))
+            job["status"] = JOB_STATUS_SUCCEEDED
+        except Exception as e:
+            self.logger.error(f"작업 실패 ({job['job_type']}, {job_id}): {e}")
+            job["status"] = JOB_STATUS_FAILED
+            job["error"] = str(e)
+        finally:
+            self._running_jobs.pop(job_id, None)
+            job["finished_at"] = _now()
+            await self.backend.save(job)
+            if job["dedup_key"] is not None:
+                await self.backend.release_dedup(job["dedup_key"], job_id)
+
+    async def _maintain(self):
+        """lease_ttl / 3마다 저장소 임대와 실행 중인 작업의 중복 키를 연장
+
+        워커 프로세스가 죽으면 연장이 멈추므로 lease_ttl 안에 중복 키가 만료되어
+        같은 사용자의 동기화를 다시 등록할 수 있고, Redis 저장소에서는 처리 중이던
+        작업이 다른 프로세스에 의해 큐로 되돌아간다.
+        """
+        while True:
+            await asyncio.sleep(self.lease_ttl / 3)
+            try:
+                await self.backend.maintain(self.lease_ttl)
+                for job_id, dedup_key in list(self._running_jobs.items()):
+                    await self.backend.refresh_dedup(dedup_key, job_id, self.lease_ttl)
+            except Exception as e:
+                self.logger.error(f"작업 큐 임대 연장 실패: {e}")
+
+
+def create_job_backend(backend_name: str = JOB_QUEUE_BACKEND):
+    """설정에 맞는 작업 저장소 생성"""
+    if backend_name == "redis":
+        return RedisJobBackend()
+    return InMemoryJobBackend()
@@ -0,0 +1,230 @@
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+import numpy as np
+from utils.fixed_point import fixed_div, sum_segments, to_fixed, to_fixed_array
+
+# 업비트 주문 side → trade_type (0: 매수, 1: 매도), 그 외 값은 매수로 처리
+SIDE_TO_TRADE_TYPE = {"bid": 0, "ask": 1}
+
+
+class OrderColumns(NamedTuple):
+    """주문 단위로 집계한 열 (각 열의 i번째 값이 i번째 주문)
+
+    가격/수량/금액/수수료는 소수점 8자리 고정소수점 정수 (utils.fixed_point)
+    """
+
+    markets: List[str]
+    trade_uuids: List[str]
+    trade_types: List[int]
+    prices: List[int]
+    quantities: List[int]
+    total_prices: List[int]
+    fees: List[int]
+    trade_times: List[Any]
+
+
+class FillColumns(NamedTuple):
+    """체결 단위로 펼친 열 (각 열의 i번째 값이 i번째 체결)"""
+
+    order_uuids: List[str]
+    trade_uuids: List[str]
+    prices: List[int]
+    volumes: List[int]
+    funds: List[int]
+    trade_times: List[Any]
+
+
+def _strip_utc_offset(value: str) -> str:
+    """2024-01-01T09:00:00+09:00 → 2024-01-01T09:00:00
+
+    trade_time 컬럼은 시간대 없는 TIMESTAMP이고, PostgreSQL은 입력의 시간대를
+    무시하므로 표기된 현지 시각을 그대로 저장한다.
+    """
+    if value.endswith("Z"):
+        return value[:-1]
+    if value[-6:-5] in ("+", "-"):
+        return value[:-6]
+    return value
+
+
+def parse_trade_times(values: List[str]) -> List[Any]:
+    """ISO 8601 문자열 목록을 한 번에 datetime 목록으로 변환
+
+    한 주문의 체결은 같은 시각을 공유하는 경우가 많으므로 서로 다른 문자열만 변환한다.
+    """
+    unique_values = list(dict.fromkeys(values))
+    parsed = (
+        np.array(
+            [_strip_utc_offset(value) for value in unique_values],
+            dtype="datetime64[us]",
+        )
+        .tolist()
+    )
+    parsed_by_value = dict(zip(unique_values, parsed))
+    return [parsed_by_value[value] for value in values]
+
+
+def order_trades(order: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
+    """주문의 체결 목록 (/v1/order 응답은 trades, 주문 목록 응답은 체결 합계로 만든 체결)
+
+    /v1/orders/uuids 응답은 trades 없이 체결 합계만 준다. 여러 번 체결된 주문은
+    /v1/order로 다시 받으므로, 합계만 있는 주문은 한 번에 체결된 것으로 보고
+    체결 하나를 만든다. 체결가는 넣지 않고 flatten_fills에서 금액/수량 문자열로
+    정확히 계산한다. 체결 합계도 없으면 None.
+    """
+    trades = order.get("trades")
+    if trades is not None:
+        return trades
+
+    executed_volume = order.get("executed_volume")
+    executed_funds = order.get("executed_funds")
+    if executed_volume is None or executed_funds is None:
+        return None
+
+    if to_fixed(executed_volume) == 0:
+        return []
+
+    return [
+        {
+            "market": order.get("market"),
+            "uuid": order.get("uuid"),
+            "volume": executed_volume,
+            "funds": executed_funds,
+            "side": order.get("side"),
+            "created_at": order.get("created_at"),
+        }
+    ]
+
+
+def transform_orders(orders: List[Dict[str, Any]]) -> Tuple[OrderColumns, FillColumns]:
+    """주문 상세 목록을 주문 열과 체결 열로 한 번에 변환
+
+    주문/체결을 한 번만 순회하며 필드별 원본 값을 모은 뒤, 숫자 필드마다
+    to_fixed_array로 한 번씩만 읽는다. 주문 수량/금액은 체결 배열의 주문별
+    구간 합계이므로 합계와 평균가에 float 오차가 없다. 체결 목록을 알 수 없는
+    주문은 제외하고, 체결이 없는 주문은 수량/금액/평균가가 0이 된다.
+    체결 uuid가 없으면 "주문uuid:순번", 체결시간이 없으면 주문시간,
+    체결가가 없으면 금액/수량으로 채운다.
+    """
+    markets, trade_uuids, trade_types, fees, order_times, fill_counts = (
+        [], [], [], [], [], []
+    )
+    fill_order_uuids, fill_uuids, prices, volumes, funds, fill_times = (
+        [], [], [], [], [], []
+    )
+    missing_price_indexes = []
+
+    for order in orders:
+        trades = order_trades(order)
+        if trades is None:
+            continue
+
+        uuid = order.get("uuid")
+        created_at = order.get("created_at")
+        markets.append(str(order.get("market")))
+        trade_uuids.append(uuid)
+        trade_types.append(SIDE_TO_TRADE_TYPE.get(order.get("side"), 0))
+        fees.append(order.get("paid_fee", 0))
+        order_times.append(created_at)
+        fill_counts.append(len(trades))
+
+        for index, trade in enumerate(trades):
+            price = trade.get("price")
+            if price is None:
+                missing_price_indexes.append(len(prices))
+                price = 0
+            fill_order_uuids.append(uuid)
+            fill_uuids.append(trade.get("uuid") or f"{uuid}:{index}")
+            prices.append(price)
+            volumes.append(trade.get("volume", 0))
+            funds.append(trade.get("funds", 0))
+            fill_times.append(trade.get("created_at") or created_at)
+
+    volume_array = to_fixed_array(volumes)
+    funds_array = to_fixed_array(funds)
+    quantities = sum_segments(volume_array, fill_counts)
+    total_prices = sum_segments(funds_array, fill_counts)
+
+    volume_list = volume_array.tolist()
+    funds_list = funds_array.tolist()
+    price_list = to_fixed_array(prices).tolist()
+    for i in missing_price_indexes:
+        price_list[i] = fixed_div(funds_list[i], volume_list[i])
+
+    order_columns = OrderColumns(
+        markets=markets,
+        trade_uuids=trade_uuids,
+        trade_types=trade_types,
+        prices=list(map(fixed_div, total_prices, quantities)),
+        quantities=quantities,
+        total_prices=total_prices,
+        fees=to_fixed_array(fees).tolist(),
+        trade_times=parse_trade_times(order_times),
+    )
+    fill_columns = FillColumns(
+        order_uuids=fill_order_uuids,
+        trade_uuids=fill_uuids,
+        prices=price_list,
+        volumes=volume_list,
+        funds=funds_list,
+        trade_times=parse_trade_times(fill_times),
+    )
+    return order_columns, fill_columns
+
+
+def aggregate_orders(orders: List[Dict[str, Any]]) -> OrderColumns:
+    """주문 상세 목록을 주문 열로 집계 (체결 열도 필요하면 transform_orders 사용)"""
+    return transform_orders(orders)[0]
+
+
+def flatten_fills(orders: List[Dict[str, Any]]) -> FillColumns:
+    """주문 상세 목록의 체결을 주문 uuid와 함께 열 단위로 펼침 (transform_orders 참고)"""
+    return transform_orders(orders)[1]
+
+
+def build_fill_rows(
+    row_type: Callable[..., Any],
+    user_id: str,
+    exchange_code: int,
+    columns: FillColumns,
+) -> List[Any]:
+    """펼친 체결 열을 FILL_COPY_COLUMNS 순서의 행 튜플로 묶음"""
+    fill_count = len(columns.trade_uuids)
+    return list(
+        map(
+            row_type,
+            [user_id] * fill_count,
+            [exchange_code] * fill_count,
+            columns.order_uuids,
+            columns.trade_uuids,
+            columns.prices,
+            columns.volumes,
+            columns.funds,
+            columns.trade_times,
+        )
+    )
+
+
+def build_rows(
+    row_type: Callable[..., Any],
+    user_id: str,
+    exchange_code: int,
+    coin_ids: List[int],
+    columns: OrderColumns,
+) -> List[Any]:
+    """집계한 열을 INSERT_COLUMNS 순서의 행 튜플로 묶음"""
+    order_count = len(coin_ids)
+    return list(
+        map(
+            row_type,
+            [user_id] * order_count,
+            coin_ids,
+            [exchange_code] * order_count,
+            columns.trade_uuids,
+            columns.trade_types,
+            columns.prices,
+            columns.quantities,
+            columns.total_prices,
+            columns.fees,
+            columns.trade_times,
+        )
+    )
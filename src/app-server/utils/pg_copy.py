@@ -0,0 +1,43 @@
+import io
+from typing import Any, Iterator
+
+
+def to_copy_value(value: Any) -> str:
+    """COPY text 포맷 값으로 변환"""
+    if value is None:
+        return "\\N"
+    if isinstance(value, int):
+        return str(value)
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+class CopyLineReader(io.TextIOBase):
+    """COPY 행 iterator를 copy_expert가 읽을 수 있는 파일 객체로 감쌈 (전체를 메모리에 올리지 않음)"""
+
+    def __init__(self, lines: Iterator[str]):
+        self._lines = lines
+        self._buffer = ""
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> str:
+        while size < 0 or len(self._buffer) < size:
+            try:
+                self._buffer += next(self._lines)
+            except StopIteration:
+                break
+
+        if size < 0:
+            chunk, self._buffer = self._buffer, ""
+        else:
+            chunk, self._buffer = self._buffer[:size], self._buffer[size:]
+        return chunk
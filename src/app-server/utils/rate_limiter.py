@@ -0,0 +1,183 @@
+import asyncio
+import fcntl
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+# 업비트 요청 그룹별 초당 요청 한도
+UPBIT_GROUP_RATES: Dict[str, int] = {
+    "default": 30,  # 거래소 API (주문 외)
+    "order": 8,  # 주문 생성/취소
+    "market": 10,  # 시세 API
+    "candles": 10,
+    "ticker": 10,
+    "orderbook": 10,
+    "crix-trades": 10,
+    "static": 50,  # static.upbit.com (로고 등 정적 파일, CDN이라 거래소 API 한도와 별개)
+}
+
+_REMAINING_REQ_PATTERN = re.compile(r"(\w+)=([\w\-]+)")
+
+
+def parse_remaining_req(
+    header_value: Optional[str],
+) -> Optional[Tuple[str, Optional[int], Optional[int]]]:
+    """Remaining-Req 헤더 파싱 (예: "group=default; min=1800; sec=29")"""
+    if not header_value:
+        return None
+
+    fields = dict(_REMAINING_REQ_PATTERN.findall(header_value))
+    group = fields.get("group")
+    if not group:
+        return None
+
+    def to_int(value: Optional[str]) -> Optional[int]:
+        try:
+            return int(value) if value is not None else None
+        except ValueError:
+            return None
+
+    return group, to_int(fields.get("min")), to_int(fields.get("sec"))
+
+
+class TokenBucketRateLimiter:
+    """그룹별 토큰 버킷 요청 제한기
+
+    버킷 상태는 파일에 저장하고 fcntl 잠금으로 보호하므로 같은 호스트의
+    여러 스레드와 워커 프로세스가 하나의 요청 한도를 공유한다.
+    """
+
+    def __init__(
+        self,
+        state_dir: Optional[str] = None,
+        group_rates: Optional[Dict[str, int]] = None,
+    ):
+        self.state_dir = state_dir or os.getenv(
+            "UPBIT_RATE_LIMIT_STATE_DIR",
+            os.path.join(tempfile.gettempdir(), "bitriever_rate_limit"),
+        )
+        self.group_rates = {**UPBIT_GROUP_RATES, **(group_rates or {})}
+        self._thread_lock = threading.Lock()
+        os.makedirs(self.state_dir, exist_ok=True)
+
+    def _rate(self, group: str) -> int:
+        return self.group_rates.get(group, self.group_rates["default"])
+
+    def _state_path(self, bucket: str) -> str:
+        safe_name = re.sub(r"[^\w\-]", "_", bucket)
+        return os.path.join(self.state_dir, f"{safe_name}.json")
+
+    def _update_state(self, bucket: str, group: str, mutate):
+        """잠금을 잡은 상태에서 버킷 상태를 읽고 mutate 결과를 저장"""
+        rate = self._rate(group)
+        with self._thread_lock, open(self._state_path(bucket), "a+") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                f.seek(0)
+                raw = f.read()
+                state = json.loads(raw) if raw else {}
+                now = time.time()
+
+                tokens = float(state.get("tokens", rate))
+                updated_at = float(state.get("updated_at", now))
+                # 보류 시각(updated_at이 미래)까지는 토큰이 채워지지 않음
+                tokens = min(rate, tokens + max(0.0, now - updated_at) * rate)
+                updated_at = max(updated_at, now)
+
+                tokens, updated_at, result = mutate(tokens, updated_at, now, rate)
+
+                f.seek(0)
+                f.truncate()
+                f.write(json.dumps({"tokens": tokens, "updated_at": updated_at}))
+                f.flush()
+                return result
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def _try_acquire(self, group: str, key: Optional[str]) -> float:
+        """토큰을 하나 가져오고, 없으면 다음 토큰까지 필요한 대기 시간을 반환"""
+        bucket = f"{group}-{key}" if key else group
+
+        def take(tokens, updated_at, now, rate):
+            if tokens >= 1 and updated_at <= now:
+                return tokens - 1, updated_at, 0.0
+            wait = max(updated_at - now, 0.0) + max(0.0, 1 - tokens) / rate
+            return tokens, updated_at, wait
+
+        return self._update_state(bucket, group, take)
+
+    def acquire(self, group: str = "default", key: Optional[str] = None) -> float:
+        """토큰을 얻을 때까지 필요한 만큼만 대기하고, 대기한 시간(초)을 반환"""
+        waited = 0.0
+        while True:
+            wait = self._try_acquire(group, key)
+            if wait <= 0:
+                return waited
+            time.sleep(wait)
+            waited += wait
+
+    async def acquire_async(
+        self, group: str = "default", key: Optional[str] = None
+    ) -> float:
+        """acquire의 비동기 버전 (대기 중 이벤트 루프를 막지 않음)
+
+        버킷 파일 잠금과 읽기/쓰기는 블로킹 작업이므로 스레드에서 실행한다.
+        """
+        waited = 0.0
+        while True:
+            wait = await asyncio.to_thread(self._try_acquire, group, key)
+            if wait <= 0:
+                return waited
+            await asyncio.sleep(wait)
+            waited += wait
+
+    def update(
+        self,
+        group: str,
+        remaining_min: Optional[int],
+        remaining_sec: Optional[int],
+        key: Optional[str] = None,
+    ):
+        """서버가 알려준 잔여 요청 수로 버킷을 보정"""
+        bucket = f"{group}-{key}" if key else group
+
+        def sync(tokens, updated_at, now, rate):
+            if remaining_sec is not None:
+                tokens = min(tokens, float(remaining_sec))
+                if remaining_sec <= 0:
+                    # 현재 초의 한도를 다 쓴 경우 다음 초까지 보류
+                    updated_at = max(updated_at, now + 1.0)
+            if remaining_min is not None and remaining_min <= 0:
+                tokens = 0.0
+                updated_at = max(updated_at, now + 60.0)
+            return tokens, updated_at, None
+
+        self._update_state(bucket, group, sync)
+
+    async def update_async(
+        self,
+        group: str,
+        remaining_min: Optional[int],
+        remaining_sec: Optional[int],
+        key: Optional[str] = None,
+    ):
+        """update의 비동기 버전 (파일 잠금을 스레드에서 처리)"""
+        await asyncio.to_thread(
+            self.update, group, remaining_min, remaining_sec, key
+        )
+
+
+# 싱글톤 인스턴스
+_upbit_rate_limiter: Optional[TokenBucketRateLimiter] = None
+
+
+def get_upbit_rate_limiter() -> TokenBucketRateLimiter:
+    """업비트 요청 제한기 싱글톤 인스턴스 반환"""
+    global _upbit_rate_limiter
+    if _upbit_rate_limiter is None:
+        _upbit_rate_limiter = TokenBucketRateLimiter()
+    return _upbit_rate_limiter
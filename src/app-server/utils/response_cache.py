@@ -0,0 +1,175 @@
+import os
+import time
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Set, Tuple
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# 응답 캐시 설정
+# memory | redis | none
+RESPONSE_CACHE_BACKEND = os.getenv("RESPONSE_CACHE_BACKEND", "memory")
+RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "1024"))
+RESPONSE_CACHE_MAX_BYTES = int(
+    os.getenv("RESPONSE_CACHE_MAX_BYTES", str(64 * 1024 * 1024))
+)
+RESPONSE_CACHE_TTL_SECONDS = int(os.getenv("RESPONSE_CACHE_TTL_SECONDS", "300"))
+RESPONSE_CACHE_REDIS_URL = os.getenv(
+    "RESPONSE_CACHE_REDIS_URL", "redis://localhost:6379/0"
+)
+
+
+class InMemoryResponseCache:
+    """프로세스 내부 응답 캐시 (LRU + 전체 바이트 수 제한 + TTL)
+
+    값은 인코딩된 bytes로 저장하며, 사용자별 키 목록을 따로 두어
+    해당 사용자의 항목만 한 번에 무효화한다. 무효화할 때마다 사용자 세대
+    번호를 올려, 무효화 전에 읽기 시작한 결과가 나중에 저장되지 않게 한다.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = RESPONSE_CACHE_MAX_ENTRIES,
+        max_bytes: int = RESPONSE_CACHE_MAX_BYTES,
+        ttl_seconds: int = RESPONSE_CACHE_TTL_SECONDS,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[bytes, float]]" = (
+            OrderedDict()
+        )
+        self._user_keys: Dict[str, Set[str]] = {}
+        self._generations: Dict[str, int] = {}
+        self._size = 0
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def generation(self, user_id: str) -> int:
+        """조회 전에 받아 두었다가 set()에 넘기는 사용자 세대 번호"""
+        return self._generations.get(user_id, 0)
+
+    def get(
+        self, user_id: str, key: str, generation: Optional[int] = None
+    ) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get((user_id, key))
+            if entry is None:
+                return None
+
+            value, expires_at = entry
+            if expires_at < time.monotonic():
+                self._remove((user_id, key))
+                return None
+
+            self._entries.move_to_end((user_id, key))
+            return value
+
+    def set(self, user_id: str, key: str, value: bytes, generation: int):
+        # 한 항목이 전체 제한보다 크면 캐시하지 않음
+        if len(value) > self.max_bytes:
+            return
+
+        with self._lock:
+            # 조회 중에 무효화되었으면 저장하지 않음
+            if generation != self._generations.get(user_id, 0):
+                return
+
+            if (user_id, key) in self._entries:
+                self._remove((user_id, key))
+
+            self._entries[(user_id, key)] = (
+                value,
+                time.monotonic() + self.ttl_seconds,
+            )
+            self._user_keys.setdefault(user_id, set()).add(key)
+            self._size += len(value)
+
+            # 가장 오래 쓰지 않은 항목부터 제거
+            while (
+                len(self._entries) > self.max_entries or self._size > self.max_bytes
+            ):
+                self._remove(next(iter(self._entries)))
+
+    def invalidate_user(self, user_id: str):
+        with self._lock:
+            self._generations[user_id] = self._generations.get(user_id, 0) + 1
+            for key in list(self._user_keys.get(user_id, ())):
+                self._remove((user_id, key))
+
+    def _remove(self, entry_key: Tuple[str, str]):
+        value, _ = self._entries.pop(entry_key)
+        self._size -= len(value)
+
+        user_id, key = entry_key
+        keys = self._user_keys.get(user_id)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._user_keys[user_id]
+
+
+class RedisResponseCache:
+    """Redis 호환 응답 캐시 (여러 워커 프로세스가 캐시와 무효화를 공유)
+
+    사용자별 세대 번호를 키에 넣고, 무효화는 세대 번호만 올린다.
+    이전 세대 항목은 TTL과 Redis maxmemory 정책으로 정리된다.
+    """
+
+    def __init__(
+        self,
+        url: str = RESPONSE_CACHE_REDIS_URL,
+        ttl_seconds: int = RESPONSE_CACHE_TTL_SECONDS,
+        max_entry_bytes: int = RESPONSE_CACHE_MAX_BYTES,
+        prefix: str = "bitriever:response",
+    ):
+        import redis
+
+        self.redis = redis.from_url(url)
+        self.ttl_seconds = ttl_seconds
+        self.max_entry_bytes = max_entry_bytes
+        self.prefix = prefix
+
+    def _generation_key(self, user_id: str) -> str:
+        return f"{self.prefix}:generation:{user_id}"
+
+    def _entry_key(self, user_id: str, key: str, generation: int) -> str:
+        return f"{self.prefix}:{user_id}:{generation}:{key}"
+
+    def generation(self, user_id: str) -> int:
+        """조회 전에 받아 두었다가 get()/set()에 넘기는 사용자 세대 번호"""
+        return int(self.redis.get(self._generation_key(user_id)) or 0)
+
+    def get(
+        self, user_id: str, key: str, generation: Optional[int] = None
+    ) -> Optional[bytes]:
+        if generation is None:
+            generation = self.generation(user_id)
+        return self.redis.get(self._entry_key(user_id, key, generation))
+
+    def set(self, user_id: str, key: str, value: bytes, generation: int):
+        # 조회 중에 무효화되었으면 이전 세대 키에 저장되어 읽히지 않음
+        if len(value) > self.max_entry_bytes:
+            return
+        self.redis.set(
+            self._entry_key(user_id, key, generation), value, ex=self.ttl_seconds
+        )
+
+    def invalidate_user(self, user_id: str):
+        self.redis.incr(self._generation_key(user_id))
+
+
+def create_response_cache(backend_name: str = RESPONSE_CACHE_BACKEND):
+    """설정에 맞는 응답 캐시 생성 (none이면 캐시 사용 안 함)"""
+    if backend_name == "none":
+        return None
+    if backend_name == "redis":
+        return RedisResponseCache()
+    return InMemoryResponseCache()
@@ -0,0 +1,45 @@
+import os
+import re
+import json
+import tempfile
+from typing import Any, Dict, Optional
+from dotenv import load_dotenv
+
+load_dotenv()
+
+SYNC_STATE_DIR = os.getenv(
+    "SYNC_STATE_DIR", os.path.join(tempfile.gettempdir(), "bitriever_sync_state")
+)
+
+
+class FileSyncStateStore:
+    """외부 데이터 동기화 상태 저장소 (ETag, Last-Modified, 내용 해시 등)
+
+    이름마다 JSON 파일 하나에 저장하고, 임시 파일에 쓴 뒤 교체하므로
+    중간에 실패해도 이전 상태가 깨지지 않는다.
+    """
+
+    def __init__(self, state_dir: Optional[str] = None):
+        self.state_dir = state_dir or SYNC_STATE_DIR
+        os.makedirs(self.state_dir, exist_ok=True)
+
+    def _state_path(self, name: str) -> str:
+        safe_name = re.sub(r"[^\w\-]", "_", name)
+        return os.path.join(self.state_dir, f"{safe_name}.json")
+
+    def get(self, name: str) -> Dict[str, Any]:
+        try:
+            with open(self._state_path(name)) as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def save(self, name: str, state: Dict[str, Any]):
+        fd, tmp_path = tempfile.mkstemp(dir=self.state_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(state, f)
+            os.replace(tmp_path, self._state_path(name))
+        except Exception:
+            os.unlink(tmp_path)
+            raise
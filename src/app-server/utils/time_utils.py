@@ -59,6 +59,33 @@ def split_time_range(
     return time_ranges
 
 
+def split_time_range_into(
+    start_time: datetime,
+    end_time: datetime,
+    parts: int,
+    min_span: timedelta = timedelta(days=7),
+) -> List[Tuple[datetime, datetime]]:
+    """기간을 최대 parts개의 연속 구간으로 균등 분할 (구간은 min_span보다 짧아지지 않음)
+
+    split_time_range와 같이 각 구간의 종료 시각은 다음 구간 시작 1초 전이다.
+    """
+    if start_time >= end_time:
+        return []
+
+    total = end_time - start_time
+    parts = max(1, min(parts, int(total / min_span)))
+    span = total / parts
+
+    # 구간 경계는 초 단위로 맞춤
+    boundaries = [
+        (start_time + span * i).replace(microsecond=0) for i in range(1, parts)
+    ]
+    starts = [start_time] + boundaries
+    ends = [boundary - timedelta(seconds=1) for boundary in boundaries] + [end_time]
+
+    return list(zip(starts, ends))
+
+
 def get_upbit_time_ranges(current_time: datetime, days: int) -> List[Tuple[str, str]]:
     start_time, end_time = get_time_range(current_time, days)
     time_ranges = split_time_range(start_time, end_time, max_days=7)
@@ -109,3 +136,89 @@ def get_date_range_strings(
     time_ranges = split_time_range(start_dt, end_dt, max_days=7)
 
     return [(format_iso8601(start), format_iso8601(end)) for start, end in time_ranges]
+
+
+class AdaptiveTimeWindowScanner:
+    """결과 건수에 따라 구간 폭을 조절하는 주문 목록 조회 구간 생성기
+
+    - 빈 구간이 나오면 다음 구간 폭을 두 배로 넓힘 (max_width까지)
+    - 한 번에 limit건이 가득 차면 가장 오래된 created_at을 커서로 삼아
+      같은 구간의 남은 부분을 이어서 조회하고, 다음 구간 폭은 절반으로 줄임
+    - 구간은 [start, end] 양끝 포함이며 다음 구간은 end + 1초부터 시작
+
+    사용법: next_window()로 조회할 구간을 받고, 응답의 created_at 목록을
+    record()에 넘긴다. record()가 True를 반환하면 해당 구간 조회가 끝난 것.
+    """
+
+    def __init__(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        limit: int = 1000,
+        max_width: timedelta = timedelta(days=7),
+        min_width: timedelta = timedelta(hours=1),
+        initial_width: Optional[timedelta] = None,
+    ):
+        if start_time.tzinfo is None:
+            start_time = start_time.replace(tzinfo=KOREA_TIMEZONE)
+        if end_time.tzinfo is None:
+            end_time = end_time.replace(tzinfo=KOREA_TIMEZONE)
+
+        self.end_time = end_time
+        self.limit = limit
+        self.max_width = max_width
+        self.min_width = min(min_width, max_width)
+        self.width = min(initial_width or max_width, max_width)
+
+        self.window_start = start_time
+        self.window_end = self._get_window_end()
+        self._cursor_end: Optional[datetime] = None  # 가득 찬 구간의 페이지 커서
+        self.request_count = 0
+        self.window_count = 0
+
+    def _get_window_end(self) -> datetime:
+        return min(self.window_start + self.width - timedelta(seconds=1), self.end_time)
+
+    @property
+    def is_done(self) -> bool:
+        return self.window_start > self.end_time
+
+    def next_window(self) -> Optional[Tuple[str, str]]:
+        """다음에 조회할 구간 (ISO 8601 문자열), 모두 조회했으면 None"""
+        if self.is_done:
+            return None
+        request_end = self._cursor_end or self.window_end
+        return format_iso8601(self.window_start), format_iso8601(request_end)
+
+    def record(self, created_ats: List[str]) -> bool:
+        """조회 결과를 반영하고, 현재 구간 조회가 끝났으면 True 반환"""
+        self.request_count += 1
+
+        if len(created_ats) >= self.limit:
+            # 가득 찬 페이지: 가장 오래된 주문 시각까지 같은 구간을 이어서 조회
+            # (경계 시각의 주문은 다시 내려올 수 있으므로 호출 측에서 중복 제거)
+            oldest = min(parse_iso8601(created_at) for created_at in created_ats)
+            previous_end = self._cursor_end or self.window_end
+            if oldest >= previous_end:
+                # 같은 초에 limit건 이상이 몰린 경우 커서가 움직이지 않으므로 1초 당김
+                oldest = previous_end - timedelta(seconds=1)
+
+            self.width = max(self.width / 2, self.min_width)
+            if oldest >= self.window_start:
+                self._cursor_end = oldest
+                return False
+
+        elif not created_ats:
+            self.width = min(self.width * 2, self.max_width)
+
+        # 구간 완료: 다음 구간으로 이동
+        self.window_count += 1
+        self.window_start = self.window_end + timedelta(seconds=1)
+        self.window_end = self._get_window_end()
+        self._cursor_end = None
+        return True
+
+    @property
+    def completed_window_end(self) -> datetime:
+        """마지막으로 조회를 마친 구간의 종료 시각"""
+        return self.window_start - timedelta(seconds=1)
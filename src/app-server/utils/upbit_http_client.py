@@ -1,24 +1,52 @@
+import os
 import requests
+from requests.adapters import HTTPAdapter
+from dotenv import load_dotenv
 import hashlib
 import jwt
 import uuid
 from urllib.parse import urlencode, unquote
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Mapping, Tuple
+from utils.rate_limiter import (
+    TokenBucketRateLimiter,
+    get_upbit_rate_limiter,
+    parse_remaining_req,
+)
+
+load_dotenv()
+
+# 요청 타임아웃 (초, 동기/비동기 클라이언트 공통)
+UPBIT_HTTP_TIMEOUT = float(os.getenv("UPBIT_HTTP_TIMEOUT", "10"))
+
+# 엔드포인트별 요청 그룹 (Remaining-Req 헤더로 확인되면 갱신됨)
+UPBIT_ENDPOINT_GROUPS: Dict[str, str] = {
+    "/v1/market": "market",
+    "/v1/candles": "candles",
+    "/v1/ticker": "ticker",
+    "/v1/orderbook": "orderbook",
+    "/v1/trades": "crix-trades",
+}
 
 
 class UpbitHttpClientError(Exception):
     """Upbit HTTP Client 관련 에러"""
 
-    pass
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        self.status_code = status_code
+        super().__init__(message)
+
 
+class BaseUpbitHttpClient:
+    """동기/비동기 Upbit HTTP Client 공통 로직 (인증, 요청 제한)"""
 
-class UpbitHttpClient:
     def __init__(
         self,
         base_url: str = "https://api.upbit.com",
+        rate_limiter: Optional[TokenBucketRateLimiter] = None,
     ):
         self.base_url = base_url
-        self.session = requests.Session()
+        self.rate_limiter = rate_limiter or get_upbit_rate_limiter()
+        self._endpoint_groups: Dict[str, str] = {}
 
     def _create_jwt_token(
         self, access_key: str, secret_key: str, params: Optional[Dict[str, Any]] = None
@@ -54,6 +82,61 @@ class UpbitHttpClient:
             "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
         }
 
+    def _resolve_group(self, endpoint: str) -> str:
+        """요청 전에 엔드포인트의 요청 그룹 추정"""
+        if endpoint in self._endpoint_groups:
+            return self._endpoint_groups[endpoint]
+
+        for prefix, group in UPBIT_ENDPOINT_GROUPS.items():
+            if endpoint.startswith(prefix):
+                return group
+        return "default"
+
+    def _rate_limit_key(self, access_key: str, require_auth: bool) -> Optional[str]:
+        """거래소 API는 키 단위, 시세 API는 IP 단위로 한도가 적용됨"""
+        if not require_auth or not access_key:
+            return None
+        return hashlib.sha256(access_key.encode("utf-8")).hexdigest()[:16]
+
+    def _parse_remaining_req(
+        self, endpoint: str, response_headers: Mapping[str, str]
+    ) -> Optional[Tuple[str, Optional[int], Optional[int]]]:
+        """응답의 Remaining-Req 헤더를 읽고 엔드포인트의 요청 그룹을 기록"""
+        remaining = parse_remaining_req(response_headers.get("Remaining-Req"))
+        if remaining is not None:
+            self._endpoint_groups[endpoint] = remaining[0]
+        return remaining
+
+    def _apply_remaining_req(
+        self, endpoint: str, response_headers: Mapping[str, str], key: Optional[str]
+    ):
+        """응답의 Remaining-Req 헤더로 요청 제한기 보정"""
+        remaining = self._parse_remaining_req(endpoint, response_headers)
+        if remaining is None:
+            return
+
+        group, remaining_min, remaining_sec = remaining
+        self.rate_limiter.update(group, remaining_min, remaining_sec, key)
+
+
+class UpbitHttpClient(BaseUpbitHttpClient):
+    def __init__(
+        self,
+        base_url: str = "https://api.upbit.com",
+        pool_maxsize: int = 10,
+        rate_limiter: Optional[TokenBucketRateLimiter] = None,
+        timeout: float = UPBIT_HTTP_TIMEOUT,
+    ):
+        super().__init__(base_url, rate_limiter)
+        self.session = requests.Session()
+        # requests는 기본 타임아웃이 없으므로 (연결, 읽기) 타임아웃을 항상 지정
+        self.timeout = (timeout, timeout)
+
+        # 동시 요청 시 커넥션 재사용을 위해 풀 크기 설정
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
     def get(
         self,
         endpoint: str,
@@ -61,6 +144,7 @@ class UpbitHttpClient:
         secret_key: str,
         params: Optional[Dict[str, Any]] = None,
         require_auth: bool = False,  # 인증 헤더가 필요한지 체크
+        timeout: Optional[float] = None,  # 요청별 타임아웃 (초)
     ) -> Optional[Dict[str, Any]]:
         try:
             url = f"{self.base_url}{endpoint}"
@@ -72,7 +156,16 @@ class UpbitHttpClient:
                 else None
             )
 
-            response = self.session.get(url, params=params, headers=headers)
+            key = self._rate_limit_key(access_key, require_auth)
+            self.rate_limiter.acquire(self._resolve_group(endpoint), key)
+
+            response = self.session.get(
+                url,
+                params=params,
+                headers=headers,
+                timeout=(timeout, timeout) if timeout is not None else self.timeout,
+            )
+            self._apply_remaining_req(endpoint, response.headers, key)
             response.raise_for_status()
 
             return response.json()
@@ -81,7 +174,12 @@ class UpbitHttpClient:
             error_msg = (
                 f"UpbitHttpClient GET request failed for endpoint {endpoint}: {e}"
             )
-            raise UpbitHttpClientError(error_msg)
+            status_code = (
+                e.response.status_code
+                if getattr(e, "response", None) is not None
+                else None
+            )
+            raise UpbitHttpClientError(error_msg, status_code)
         except Exception as e:
             error_msg = f"UpbitHttpClient unexpected error in GET method for endpoint {endpoint}: {e}"
             raise UpbitHttpClientError(error_msg)